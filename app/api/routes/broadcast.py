@@ -7,6 +7,7 @@ from fastapi.responses import JSONResponse
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import os
+import asyncio
 from pathlib import Path
 
 from ...services.broadcast_controller import broadcast_controller
@@ -244,7 +245,7 @@ async def broadcast_text(
             'language': language
         }
         
-        preview_info = broadcast_controller.create_preview('text', params)
+        preview_info = await broadcast_controller.create_preview_async('text', params)
         if not preview_info:
             raise HTTPException(status_code=500, detail="프리뷰 생성 실패")
         
@@ -297,16 +298,15 @@ async def broadcast_audio(
         # 파일 저장
         file_extension = os.path.splitext(audio_file.filename)[1]
         temp_path = Path(config.temp_dir) / f"preview_audio_{datetime.now().strftime('%Y%m%d_%H%M%S')}{file_extension}"
-        with open(temp_path, "wb") as f:
-            content = await audio_file.read()
-            f.write(content)
+        await audio_file.seek(0)
+        await asyncio.to_thread(broadcast_controller.save_upload_stream, audio_file.file, temp_path)
         
         # use_original이 True가 아닐 때만 파일 길이 체크
         if not use_original:
             # 파일 길이 체크 (5분 = 300초 제한)
             try:
                 logger.info(f"오디오 파일 길이 확인 시작: {temp_path}")
-                duration = broadcast_controller._get_audio_duration_with_ffprobe(str(temp_path))
+                duration = await asyncio.to_thread(broadcast_controller._get_audio_duration_with_ffprobe, str(temp_path))
                 logger.info(f"오디오 파일 길이 확인 완료: {duration:.1f}초")
                 
                 if duration > 300:  # 5분 초과
@@ -357,8 +357,8 @@ async def broadcast_audio(
         
         logger.info(f"[API] use_original 플래그: {use_original}, original_preview_id: {original_preview_id}")
         
-        # 프리뷰 생성 (동기 처리 - 완료 후 응답)
-        preview_info = broadcast_controller.create_preview('audio', params)
+        # 프리뷰 생성 (별도 스레드에서 처리 - 완료 후 응답)
+        preview_info = await broadcast_controller.create_preview_async('audio', params)
         if not preview_info:
             raise HTTPException(status_code=500, detail="프리뷰 생성 실패")
         
@@ -403,7 +403,7 @@ async def broadcast_audio(
 @router.post("/stop", response_model=Dict[str, Any])
 async def stop_broadcast():
     try:
-        stop_success = broadcast_controller.stop_broadcast()
+        stop_success = await asyncio.to_thread(broadcast_controller.stop_broadcast)
         return {
             "success": stop_success,
             "action": "방송 중지 및 장치 끄기",
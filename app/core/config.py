@@ -5,7 +5,11 @@
 """
 import os
 import sys
+import queue
+import atexit
 import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 
@@ -24,6 +28,16 @@ FFPROBE_PATH = Path("/usr/bin/ffprobe")
 # 오디오 정규화 기본 설정
 DEFAULT_TARGET_DBFS = -12.0
 
+# 프리뷰 인코딩 품질 ("preview": 64kbps/22050Hz 모노, "full": 192kbps/44100Hz 스테레오)
+# 승인된 프리뷰 파일이 그대로 방송되므로 기본값은 "full"
+DEFAULT_PREVIEW_QUALITY = "full"
+
+# 디버깅용 정규화 TTS 파일 보존 여부 (preserved_normalized_tts_*.mp3)
+DEFAULT_KEEP_NORMALIZED_TTS = False
+
+# 연속 방송 병합 여부 (대기 중인 다음 작업이 같은 장치를 쓰면 장치를 끄지 않고 넘김)
+DEFAULT_BROADCAST_COALESCE = True
+
 # 데이터 디렉토리 설정
 # 애플리케이션 데이터를 저장할 디렉토리 경로 설정
 if getattr(sys, 'frozen', False):
@@ -50,10 +64,49 @@ SPECIAL_CHANNELS = {
     0xD0: "특수 기능 채널 (208)"
 }
 
+# 공용 로그 큐 (파일/콘솔 출력은 백그라운드 리스너 스레드에서 처리)
+_log_queue = None
+_log_listener = None
+_log_listener_lock = threading.Lock()
+
+def _get_queue_handler() -> QueueHandler:
+    """
+    공용 로그 큐 핸들러 반환
+    최초 호출 시 파일/콘솔 핸들러를 가진 QueueListener를 시작합니다.
+    """
+    global _log_queue, _log_listener
+    
+    with _log_listener_lock:
+        if _log_listener is None:
+            # 로그 포맷 설정
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+            
+            # 파일 핸들러 설정
+            log_file = LOG_DIR / f"app_{datetime.now().strftime('%Y%m%d')}.log"
+            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler.setFormatter(formatter)
+            
+            # 콘솔 핸들러 설정
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(formatter)
+            
+            _log_queue = queue.SimpleQueue()
+            _log_listener = QueueListener(_log_queue, file_handler, console_handler, respect_handler_level=True)
+            _log_listener.start()
+            atexit.register(_log_listener.stop)
+    
+    return QueueHandler(_log_queue)
+
 def setup_logging(name: str = None, level: str = "INFO") -> logging.Logger:
     """
     통일된 로깅 설정
     
+    로그 레코드는 큐에 넣기만 하고 실제 파일/콘솔 출력은 백그라운드 스레드가 처리하므로
+    호출 스레드가 stdout 잠금이나 파일 쓰기로 대기하지 않습니다.
+    
     Parameters:
     -----------
     name : str, optional
@@ -80,26 +133,8 @@ def setup_logging(name: str = None, level: str = "INFO") -> logging.Logger:
     log_level = getattr(logging, level.upper(), logging.INFO)
     logger.setLevel(log_level)
     
-    # 로그 포맷 설정
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # 파일 핸들러 설정
-    log_file = LOG_DIR / f"app_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setLevel(log_level)
-    file_handler.setFormatter(formatter)
-    
-    # 콘솔 핸들러 설정
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
-    
-    # 핸들러 추가
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # 큐 핸들러 추가
+    logger.addHandler(_get_queue_handler())
     
     return logger
 
@@ -144,6 +179,15 @@ class Config:
         # 오디오 정규화 설정
         self.default_target_dbfs = DEFAULT_TARGET_DBFS
         
+        # 프리뷰 인코딩 품질 설정
+        self.preview_quality = DEFAULT_PREVIEW_QUALITY
+        
+        # 정규화된 TTS 파일 보존 설정 (디버깅용)
+        self.keep_normalized_tts = DEFAULT_KEEP_NORMALIZED_TTS
+        
+        # 연속 방송 병합 설정
+        self.broadcast_coalesce = DEFAULT_BROADCAST_COALESCE
+        
     def get_app_info(self):
         """
         앱 정보 반환
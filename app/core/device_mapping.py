@@ -32,6 +32,9 @@ class DeviceMapper:
         # 저장된 매트릭스 설정 로드 (JSON 우선)
         self._load_matrix_config()
         
+        # 매트릭스 변경 시마다 증가하는 버전 (역방향 조회 캐시 무효화용)
+        self.matrix_version = 0
+        
         # 매트릭스에서 device_map 자동 생성 (좌표 -> 장치명)
         self.device_map = self._build_device_map_from_matrix()
         
@@ -167,6 +170,7 @@ class DeviceMapper:
             return False, "매트릭스 형식이 유효하지 않습니다."
         
         self.device_matrix = matrix
+        self.matrix_version += 1
         success = self._save_matrix_config()
         
         if success:
@@ -183,6 +187,7 @@ class DeviceMapper:
             return False, "장치 이름이 유효하지 않습니다."
         
         self.device_matrix[row][col] = device_name.strip()
+        self.matrix_version += 1
         success = self._save_matrix_config()
         
         if success:
@@ -200,6 +205,7 @@ class DeviceMapper:
     def reset_matrix_to_default(self):
         """매트릭스를 기본값으로 초기화"""
         self.device_matrix = self._initialize_device_matrix()
+        self.matrix_version += 1
         success = self._save_matrix_config()
         
         if success:
@@ -5,46 +5,367 @@
 """
 import os
 import time
+import logging
 import threading
 import json
 import datetime
 import wave
 import contextlib
-import traceback
 import queue
+import struct
 from pathlib import Path
 from typing import List, Dict, Any, Set, Tuple, Optional, Union
 from fastapi import UploadFile, HTTPException
 import sys
 import hashlib
+import secrets
 import shutil
+import subprocess
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-
-# 오디오 재생 라이브러리 확인
-try:
-    import vlc
-    print("[*] VLC 모듈이 로드되었습니다. 오디오 재생이 가능합니다.")
-except ImportError:
-    print("[!] 경고: VLC 모듈을 로드할 수 없습니다. 오디오 재생이 제한될 수 있습니다.")
+import functools
+import itertools
+from collections import deque
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 # TTS 엔진은 tts_service.py에서 관리 (MeloTTS > gTTS > pyttsx3 순서)
 
 from ..core.config import config, setup_logging
+from ..utils.audio_normalizer import audio_normalizer
 from .broadcast_manager import broadcast_manager
 
 # 중앙 로깅 설정 사용
 logger = setup_logging(__name__)
 
+# 오디오 재생 라이브러리 확인
+try:
+    import vlc
+    _VLC = vlc
+    _VLC_ACTIVE_STATES = (vlc.State.Playing, vlc.State.Opening, vlc.State.Buffering)
+    logger.info("VLC 모듈이 로드되었습니다. 오디오 재생이 가능합니다.")
+except ImportError:
+    _VLC = None
+    _VLC_ACTIVE_STATES = ()
+    logger.warning("VLC 모듈을 로드할 수 없습니다. 오디오 재생이 제한될 수 있습니다.")
+
+# pydub은 ffmpeg 결합이 실패했을 때만 사용하므로 처음 필요할 때 로드
+@functools.lru_cache(maxsize=None)
+def _audio_segment_class():
+    """pydub AudioSegment 클래스 반환 (로드 실패 시 RuntimeError)"""
+    try:
+        from pydub import AudioSegment
+    except ImportError as e:
+        raise RuntimeError(f"pydub 모듈을 로드할 수 없습니다: {e}") from e
+    return AudioSegment
+
+# reflink 복제 지원 확인 (Linux 전용)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+_FICLONE = 0x40049409
+
+# 헤더 기반 오디오 길이 확인 라이브러리 (없으면 ffprobe 사용)
+try:
+    import mutagen
+except ImportError:
+    mutagen = None
+
+# libsndfile 기반 오디오 정보 확인 (WAV/FLAC/OGG 등, 없으면 wave 모듈 사용)
+try:
+    import soundfile
+except (ImportError, OSError):
+    soundfile = None
+
+_SOUNDFILE_EXTENSIONS = ('.wav', '.flac', '.ogg', '.aiff', '.aif')  # soundfile로 길이를 확인할 확장자
+
 # 음성 파일 저장 경로
 AUDIO_DIR = Path(config.audio_dir)
 
+# TTS 캐시 보관 기간 (초 단위, 7일)
+TTS_CACHE_TTL = 7 * 24 * 60 * 60
+TTS_CACHE_CLEANUP_INTERVAL = 6 * 60 * 60  # 만료된 TTS 캐시 정리 주기 (초)
+STATUS_CACHE_TTL = 0.2  # 큐 현황 캐시 유효 시간 (초)
+SIGNAL_RECHECK_INTERVAL = 60.0  # 신호음 파일 존재 여부 재확인 주기 (초)
+DURATION_SIDECAR_SUFFIX = ".dur"  # ffprobe 길이 결과를 저장하는 사이드카 확장자
+LOUDNORM_CACHE_SIZE = 256  # 프리뷰 음량 분석 결과 캐시 최대 항목 수
+
+# 프리뷰 MP3 인코딩 설정 (config.preview_quality 값으로 선택)
+PREVIEW_ENCODE_SETTINGS = {
+    "preview": {"bitrate": "64k", "channels": 1, "sample_rate": 22050},
+    "full": {"bitrate": "192k", "channels": 2, "sample_rate": 44100},
+}
+
+# 프로세스 전역 프리뷰 생성 스레드 풀 (ffmpeg는 작업당 1스레드로 실행하므로 CPU 수만큼, 최대 8개)
+_PREVIEW_EXECUTOR = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2), thread_name_prefix="preview")
+
+# 방송 중 TTS 합성 전용 스레드 (방송 워커는 하나이므로 1개, 프리뷰 작업이 밀려도 방송 TTS가 지연되지 않도록 분리)
+_BROADCAST_TTS_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="broadcast_tts")
+
+# 오디오 스크래치 버퍼 풀 (업로드 저장 등 대용량 복사에 재사용)
+_WAV_BUF_POOL: "queue.SimpleQueue[bytearray]" = queue.SimpleQueue()
+_WAV_BUF_MIN_SIZE = 144384
+_WAV_BUF_MAX_POOLED = 2 * 1024 * 1024
+
+def acquire_buf(n=0):
+    """풀에서 n 바이트 이상의 버퍼를 꺼내거나 새로 할당"""
+    try:
+        buf = _WAV_BUF_POOL.get_nowait()
+        if len(buf) >= n:
+            return buf
+    except queue.Empty:
+        pass
+    return bytearray(max(n, _WAV_BUF_MIN_SIZE))
+
+def release_buf(buf):
+    """버퍼를 풀에 반환 (너무 큰 버퍼는 버림)"""
+    if len(buf) < _WAV_BUF_MAX_POOLED:
+        _WAV_BUF_POOL.put(buf)
+
+@functools.lru_cache(maxsize=512)
+def _wav_duration(path_str, mtime_ns, size):
+    """
+    WAV 파일 길이 계산 (경로, 수정 시간, 크기 기준으로 캐시)
+    
+    Parameters:
+    -----------
+    path_str : str
+        WAV 파일 경로
+    mtime_ns : int
+        파일 수정 시간 (나노초, 캐시 무효화용)
+    size : int
+        파일 크기 (캐시 무효화용)
+        
+    Returns:
+    --------
+    float
+        재생 시간 (초)
+    """
+    duration = _wav_header_duration(path_str, size)
+    if duration is not None:
+        return duration
+    # 헤더 해석이 안 되면 libsndfile, 그것도 없으면 wave 모듈 사용
+    if soundfile is not None:
+        with contextlib.suppress(Exception):
+            return soundfile.info(path_str).duration
+    with wave.open(path_str, 'rb') as wav_file:
+        return wav_file.getnframes() / wav_file.getframerate()
+
+_WAV_HEADER_READ_SIZE = 4096  # RIFF 헤더 탐색 시 읽는 앞부분 크기 (fmt/data 청크 위치 확인용)
+
+def _wav_header_duration(path_str, size):
+    """
+    RIFF 헤더만 읽어 WAV 길이 계산 (data 청크 크기 / 초당 바이트 수)
+    
+    Returns:
+    --------
+    float
+        재생 시간 (초), RIFF/WAVE 형식이 아니거나 헤더를 해석할 수 없으면 None
+    """
+    with open(path_str, 'rb') as f:
+        header = f.read(_WAV_HEADER_READ_SIZE)
+    if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+        return None
+    
+    byte_rate = 0
+    offset = 12
+    while offset + 8 <= len(header):
+        chunk_id, chunk_size = struct.unpack_from('<4sI', header, offset)
+        body = offset + 8
+        if chunk_id == b'fmt ' and body + 16 <= len(header):
+            _, channels, sample_rate, _, block_align, bits = struct.unpack_from('<HHIIHH', header, body)
+            byte_rate = sample_rate * (block_align or channels * bits // 8)
+        elif chunk_id == b'data':
+            if not byte_rate:
+                return None
+            # 스트리밍 중 기록된 파일은 청크 크기가 실제보다 클 수 있으므로 파일 크기로 제한
+            return min(chunk_size, size - body) / byte_rate
+        offset = body + chunk_size + (chunk_size & 1)
+    return None
+
+@functools.lru_cache(maxsize=512)
+def _fast_duration(path_str, mtime_ns, size):
+    """
+    파일 헤더만 읽어 오디오 길이 계산 (ffprobe 프로세스 실행 없이)
+    
+    Parameters:
+    -----------
+    path_str : str
+        오디오 파일 경로
+    mtime_ns : int
+        파일 수정 시간 (캐시 무효화용)
+    size : int
+        파일 크기 (캐시 무효화용)
+        
+    Returns:
+    --------
+    float
+        재생 시간 (초), 헤더로 알 수 없으면 0.0
+    """
+    try:
+        lower = path_str.lower()
+        if lower.endswith(".wav"):
+            return _wav_duration(path_str, mtime_ns, size)
+        if soundfile is not None and lower.endswith(_SOUNDFILE_EXTENSIONS):
+            return soundfile.info(path_str).duration
+        if mutagen is not None:
+            audio = mutagen.File(path_str)
+            if audio is not None and audio.info is not None:
+                return float(audio.info.length or 0.0)
+    except Exception:
+        pass
+    return 0.0
+
+def _read_duration_sidecar(path_str, mtime_ns, size):
+    """<파일>.dur 사이드카에서 길이 읽기 (파일이 바뀌었거나 없으면 None)"""
+    try:
+        with open(path_str + DURATION_SIDECAR_SUFFIX, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("mtime_ns") == mtime_ns and data.get("size") == size:
+            return float(data["duration"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _write_duration_sidecar(path_str, mtime_ns, size, duration):
+    """<파일>.dur 사이드카에 길이 기록 (실패해도 무시)"""
+    try:
+        with open(path_str + DURATION_SIDECAR_SUFFIX, "w", encoding="utf-8") as f:
+            json.dump({"mtime_ns": mtime_ns, "size": size, "duration": duration}, f)
+    except OSError as e:
+        logger.debug("길이 사이드카 기록 실패: %s (%s)", path_str, e)
+
+@functools.lru_cache(maxsize=512)
+def _ffprobe_duration(ffprobe_path, path_str, mtime_ns, size, use_sidecar=False):
+    """
+    ffprobe로 오디오 길이 확인 (경로, 수정 시간, 크기 기준으로 캐시)
+    
+    Parameters:
+    -----------
+    ffprobe_path : str
+        ffprobe 실행 파일 경로
+    path_str : str
+        오디오 파일 경로
+    mtime_ns : int
+        파일 수정 시간 (캐시 무효화용)
+    size : int
+        파일 크기 (캐시 무효화용)
+    use_sidecar : bool
+        <파일>.dur 사이드카를 읽고 써서 재시작 후에도 결과 유지
+        
+    Returns:
+    --------
+    float
+        재생 시간 (초)
+    """
+    if use_sidecar:
+        duration = _read_duration_sidecar(path_str, mtime_ns, size)
+        if duration is not None:
+            return duration
+    
+    # format 길이 한 줄만 출력 (JSON 전체 덤프/파싱 생략)
+    # 분석/탐색 범위를 앞부분 1초 정도로 제한해 파일 전체를 훑지 않도록 함
+    cmd = [
+        ffprobe_path,
+        "-v", "quiet",
+        "-analyzeduration", "100000",
+        "-probesize", "100000",
+        "-read_intervals", "%+1",
+        "-select_streams", "a:0",
+        "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        path_str
+    ]
+    
+    # 출력은 짧은 ASCII 숫자이므로 텍스트 디코딩 없이 바이트 그대로 파싱
+    result = subprocess.run(cmd, capture_output=True)
+    
+    # 실패는 예외로 알려서 캐시에 남기지 않음
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe 실행 실패: {result.stderr.decode('utf-8', 'replace')}")
+    output = result.stdout.strip()
+    if not output:
+        raise RuntimeError("ffprobe에서 출력이 없습니다.")
+    
+    try:
+        duration = float(output)
+    except ValueError:
+        # 길이를 알 수 없는 스트림은 "N/A" 출력
+        duration = 0.0
+    
+    if use_sidecar:
+        _write_duration_sidecar(path_str, mtime_ns, size, duration)
+    return duration
+
+def _reflink(src, dst):
+    """
+    FICLONE ioctl로 데이터 블록을 공유하는 복제본 생성 (Btrfs/XFS 등 지원 파일 시스템)
+    
+    Returns:
+    --------
+    bool
+        복제 성공 여부 (실패 시 생성된 빈 파일은 삭제)
+    """
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+        return True
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(dst)
+        return False
+
+# 방 ID → (행, 열) 좌표 (예: 312 → (3, 12))
+_ROOM_TO_COORD = {row * 100 + col: (row, col) for row in range(1, 5) for col in range(1, 17)}
+# 장치명 → 방 ID (기본 "행-열" 표기, 예: "1-1", "4-16")
+_NAME_TO_ROOM = {f"{row}-{col}": room_id for room_id, (row, col) in _ROOM_TO_COORD.items()}
+# 방 ID → 비트마스크 비트 (bit = (row-1)*16 + (col-1))
+_ROOM_BIT = {room_id: 1 << ((row - 1) * 16 + (col - 1)) for room_id, (row, col) in _ROOM_TO_COORD.items()}
+
+@functools.lru_cache(maxsize=256)
+def _room_from_name(device_name, allow_room_id=False):
+    """
+    장치명을 방 ID로 변환 (표에 없는 표기는 각 부분을 정수로 읽어 정규화, 예: "1-01" → 101)
+    
+    Parameters:
+    -----------
+    device_name : str
+        장치명 (예: "1-1", "3-02")
+    allow_room_id : bool
+        방 ID 문자열 (예: "101") 허용 여부
+        
+    Returns:
+    --------
+    int
+        방 번호 (예: 101, 302) 또는 None
+    """
+    room_id = _NAME_TO_ROOM.get(device_name)
+    if room_id is not None:
+        return room_id
+    try:
+        if allow_room_id and device_name.isdigit():
+            room_id = int(device_name)
+            return room_id if room_id in _ROOM_TO_COORD else None
+        if '-' in device_name and device_name[:1].isdigit():
+            grade, class_num = device_name.split('-')
+            row, col = int(grade), int(class_num)
+            if 1 <= row <= 4 and 1 <= col <= 16:
+                return row * 100 + col
+    except ValueError:
+        pass
+    return None
+
+_JOB_SEQ = itertools.count(1)  # 같은 밀리초에 생성된 작업도 ID가 겹치지 않도록 붙이는 일련번호
+
 class BroadcastJob:
     """방송 작업 클래스"""
+    __slots__ = ('job_type', 'params', 'job_id', 'estimated_duration', 'created_at')
+    
     def __init__(self, job_type, params, job_id=None):
         self.job_type = job_type  # 'audio' or 'text'
         self.params = params
-        self.job_id = job_id or f"job_{int(time.time() * 1000)}"
+        self.job_id = job_id or f"job_{int(time.time() * 1000)}_{next(_JOB_SEQ)}"
         self.estimated_duration = self._calculate_duration()
         self.created_at = datetime.datetime.now()
         
@@ -60,11 +381,13 @@ class BroadcastJob:
             if audio_path:
                 try:
                     audio_path = Path(audio_path)
-                    if audio_path.exists() and audio_path.suffix.lower() in ['.wav']:
-                        with wave.open(str(audio_path), 'rb') as wav_file:
-                            frames = wav_file.getnframes()
-                            rate = wav_file.getframerate()
-                            return frames / rate
+                    suffix = audio_path.suffix.lower()
+                    if suffix == '.wav':
+                        st = audio_path.stat()  # 없는 파일은 예외로 기본값 처리
+                        return _wav_duration(str(audio_path), st.st_mtime_ns, st.st_size)
+                    elif soundfile is not None and suffix in _SOUNDFILE_EXTENSIONS:
+                        st = audio_path.stat()
+                        return _fast_duration(str(audio_path), st.st_mtime_ns, st.st_size) or 30
                     else:
                         return 30  # 기본값
                 except Exception as e:
@@ -112,22 +435,58 @@ class BroadcastController:
         # DeviceMapper 초기화
         from ..core.device_mapping import DeviceMapper
         self.device_mapper = DeviceMapper()
+        self._device_index = {}  # 장치명 → 매트릭스 좌표 (row, col) 역방향 조회 테이블
+        self._device_index_version = -1  # 조회 테이블을 만든 시점의 매트릭스 버전
+        
+        # 장치명/방 ID 조회 테이블 (모듈 로드 시 한 번 만든 테이블 공유)
+        self._room_to_coord = _ROOM_TO_COORD
+        self._room_bit = _ROOM_BIT
         
         # 오디오 재생 관련 속성
         self.player = None
         self.is_playing = False
+        self.playback_finished = True
+        self._play_future = Future()  # 재생 종료 시 VLC 이벤트가 최종 상태로 완료시키는 Future
+        self._play_future.set_result(None)
+        
+        # VLC 인스턴스/플레이어 (재생마다 생성하지 않고 재사용)
+        self._vlc_instance = None
+        self._vlc_player = None
+        self._vlc_media = None
+        self._vlc_io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vlc_io")  # VLC 호출 직렬화
+        self._init_vlc_player()
         self.broadcast_thread = None
         
         # TTS 모델 속성
         self.tts_model = None
         self.tts_initialized = False
         
+        # TTS 캐시 (동일 문구 재합성 방지)
+        self._tts_cache_dir = Path(config.temp_dir) / "tts_cache"
+        self._tts_cache_ttl = TTS_CACHE_TTL
+        self._tts_mem_index: Dict[str, Path] = {}
+        self._tts_cache_lock = threading.Lock()
+        self._tts_cache_hits = 0  # TTS 캐시 적중 횟수 (모니터링용)
+        self._inflight: Dict[tuple, Future] = {}  # 진행 중인 작업 (같은 키 중복 실행 방지)
+        self._inflight_lock = threading.Lock()
+        self._loudnorm_cache: Dict[tuple, Optional[str]] = {}  # (경로, 수정 시간, 크기) -> loudnorm 필터
+        self._load_tts_cache_index()
+        self._tts_cleanup_stop = threading.Event()
+        threading.Thread(target=self._tts_cache_cleanup_loop, daemon=True).start()
+        
         # 방송 작업 관리
-        self.broadcast_jobs = []
-        self.current_broadcast_start_time = None
+        self._jobs = deque()  # 대기 중인 작업 (순서 보장)
+        self._jobs_by_id = {}  # job_id → 대기 중인 작업 (ID 조회용)
+        self._jobs_cv = threading.Condition()
+        self._pending_duration_sum = 0.0  # 대기 중인 작업의 예상 소요시간 합계
+        self._current_job = None
+        self._shutting_down = False  # 종료 요청 시 워커가 None(종료 신호)을 받고 빠져나감
+        self._queue_version = 0  # 대기열 변경 시 증가
+        self._cached_status = (-1, 0.0, None)  # (버전, 생성 시각, 상태)
+        self.current_broadcast_start_time = None  # 현재 방송 시작 시각 (표시용)
+        self._current_broadcast_started = None  # 현재 방송 시작 시각 (time.monotonic, 경과 시간 계산용)
         self.current_broadcast_duration = None
         
-        self.broadcast_queue = queue.Queue()
         self.broadcast_worker_thread = threading.Thread(target=self._broadcast_worker, daemon=True)
         self.broadcast_worker_thread.start()
         
@@ -137,33 +496,50 @@ class BroadcastController:
         # 시작/끝 신호음 파일 경로
         self.start_signal_path = Path(config.data_dir) / "start.mp3"
         self.end_signal_path = Path(config.data_dir) / "end.mp3"
+        self._signal_segments = {}  # 신호음 경로 → (mtime_ns, 디코딩된 AudioSegment) 캐시
+        self.reload_signals()
         
         # 프리뷰 관리
         self.preview_dir = Path(config.app_data_dir) / "previews"
-        print(f"[*] 프리뷰 디렉토리 설정: {self.preview_dir}")
-        print(f"[*] 프리뷰 디렉토리 절대 경로: {self.preview_dir.absolute()}")
+        logger.info(f"프리뷰 디렉토리 설정: {self.preview_dir}")
+        logger.info(f"프리뷰 디렉토리 절대 경로: {self.preview_dir.absolute()}")
         
         try:
             self.preview_dir.mkdir(exist_ok=True)
-            print(f"[*] 프리뷰 디렉토리 생성/확인 완료: {self.preview_dir}")
+            logger.info(f"프리뷰 디렉토리 생성/확인 완료: {self.preview_dir}")
         except Exception as e:
-            print(f"[!] 프리뷰 디렉토리 생성 실패: {e}")
+            logger.warning(f"프리뷰 디렉토리 생성 실패: {e}")
+        
+        # ffmpeg/ffprobe 경로 (pydub이 찾을 수 있도록 PATH에 한 번만 추가)
+        ffmpeg_paths = config.get_ffmpeg_paths()
+        self._ffmpeg_path = Path(ffmpeg_paths["ffmpeg_path"])
+        self._ffprobe_path = Path(ffmpeg_paths["ffprobe_path"])
+        self._ffprobe_ok = ffmpeg_paths["ffprobe_exists"]
+        self._ffmpeg_ok = ffmpeg_paths["ffmpeg_exists"] and ffmpeg_paths["ffprobe_exists"]
+        ffmpeg_dir = str(self._ffmpeg_path.parent)
+        if self._ffmpeg_ok and ffmpeg_dir not in os.environ.get('PATH', '').split(os.pathsep):
+            os.environ['PATH'] = ffmpeg_dir + os.pathsep + os.environ.get('PATH', '')
         
         self.pending_previews = {}  # preview_id -> preview_info
+        self._previews_lock = threading.RLock()  # pending_previews 변경 보호
+        self._previews_snapshot = ()  # 변경 시마다 갱신되는 프리뷰 목록 스냅샷 (조회는 잠금 없이)
         
-        # 프리뷰 생성용 스레드 풀 (병렬 처리용)
-        self.preview_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="preview_worker")
-        print(f"[*] 프리뷰 생성 스레드 풀 초기화 완료 (최대 4개 동시 처리)")
+        # 프리뷰 생성용 스레드 풀 (프로세스 전역 풀 공유)
+        self.preview_executor = _PREVIEW_EXECUTOR
+        logger.info(f"프리뷰 생성 스레드 풀 연결 완료 (최대 {_PREVIEW_EXECUTOR._max_workers}개 동시 처리)")
         
         # 장치 상태 저장 및 복원 기능
-        self.device_state_backup = {}  # 방송 전 장치 상태 저장
+        self.device_state_backup = {}  # 방송 전 장치 상태 저장 (장치명 -> 켜짐 여부)
+        self._device_state_backup_mask = 0  # 저장된 장치들의 활성 비트마스크 스냅샷
         self.restore_device_states_enabled = True  # 방송 후 상태 복원 여부 (기본값: True)
+        self._held_mask = 0  # 다음 방송을 위해 켜 둔 장치 비트마스크 (방송 사이 끄기/켜기 생략)
+        self._held_devices = None  # 켜 둔 장치를 넘겨받을 작업과 (대상, 종료) 장치 목록
         
-        print(f"[*] BroadcastController 초기화 완료 - BroadcastManager 사용")
-        print(f"[*] 시작 신호음: {self.start_signal_path}")
-        print(f"[*] 끝 신호음: {self.end_signal_path}")
-        print(f"[*] 프리뷰 디렉토리: {self.preview_dir}")
-        print(f"[*] 장치 상태 복원 기능: {'활성화' if self.restore_device_states_enabled else '비활성화'}")
+        logger.info("BroadcastController 초기화 완료 - BroadcastManager 사용")
+        logger.info(f"시작 신호음: {self.start_signal_path}")
+        logger.info(f"끝 신호음: {self.end_signal_path}")
+        logger.info(f"프리뷰 디렉토리: {self.preview_dir}")
+        logger.info(f"장치 상태 복원 기능: {'활성화' if self.restore_device_states_enabled else '비활성화'}")
     
     def _device_name_to_coordinates(self, device_name):
         """
@@ -179,26 +555,12 @@ class BroadcastController:
         tuple
             (row, col) 또는 (None, None)
         """
-        try:
-            # 학년-반 형식 (예: "1-1", "3-2")
-            if '-' in device_name and device_name[0].isdigit():
-                grade, class_num = device_name.split('-')
-                row = int(grade)
-                col = int(class_num)
-                
-                # 좌표 유효성 검사
-                if 1 <= row <= 4 and 1 <= col <= 16:
-                    return row, col
-                else:
-                    print(f"[!] 좌표 범위 초과: ({row}, {col})")
-                    return None, None
-            else:
-                print(f"[!] 지원되지 않는 장치명 형식: {device_name}")
-                return None, None
-                    
-        except Exception as e:
-            print(f"[!] 장치명 변환 중 오류: {e}")
+        room_id = _room_from_name(device_name) if isinstance(device_name, str) else None
+        coords = self._room_to_coord.get(room_id)
+        if coords is None:
+            logger.warning(f"지원되지 않는 장치명 형식: {device_name}")
             return None, None
+        return coords
     
     def get_version(self):
         """앱 버전 정보 반환"""
@@ -230,13 +592,13 @@ class BroadcastController:
         bool
             성공 여부
         """
-        print(f"[*] 장치 제어 (BroadcastManager): {device_name}, 상태: {'켜기' if state else '끄기'}")
+        logger.info(f"장치 제어 (BroadcastManager): {device_name}, 상태: {'켜기' if state else '끄기'}")
         
         try:
             # 장치 이름을 행/열 좌표로 변환
             row, col = self._device_name_to_coordinates(device_name)
             if row is None or col is None:
-                print(f"[!] 장치명을 좌표로 변환 실패: {device_name}")
+                logger.warning(f"장치명을 좌표로 변환 실패: {device_name}")
                 return False
             
             # BroadcastManager를 통해 장치 제어
@@ -248,7 +610,7 @@ class BroadcastController:
             return success
             
         except Exception as e:
-            print(f"[!] 장치 제어 중 오류: {e}")
+            logger.warning(f"장치 제어 중 오류: {e}")
             return False
     
     def control_device(self, device_name, state=1):
@@ -271,64 +633,68 @@ class BroadcastController:
         bool
             성공 여부
         """
-        print(f"[*] 여러 장치 제어 (BroadcastManager): {', '.join(map(str, device_list))}, 상태: {'켜기' if state else '끄기'}")
+        logger.info("여러 장치 제어 (BroadcastManager): %s, 상태: %s", device_list, '켜기' if state else '끄기')
         
         try:
-            # 장치 목록을 방 ID 집합으로 변환
-            target_rooms = set()
-            
-            for device_name in device_list:
-                try:
-                    # 숫자 ID인 경우
-                    if isinstance(device_name, int):
-                        room_id = device_name
-                    # 문자열 처리
-                    elif isinstance(device_name, str):
-                        if device_name.isdigit():
-                            room_id = int(device_name)
-                        elif '-' in device_name and device_name[0].isdigit():
-                            grade, class_num = device_name.split('-')
-                            room_id = int(grade) * 100 + int(class_num)
-                        else:
-                            print(f"[!] 지원되지 않는 장치명: {device_name}")
-                            continue
-                    else:
-                        print(f"[!] 지원되지 않는 데이터 타입: {type(device_name)}")
-                        continue
-                    
-                    # 좌표 유효성 검사
-                    row = room_id // 100
-                    col = room_id % 100
-                    if 1 <= row <= 4 and 1 <= col <= 16:
-                        target_rooms.add(room_id)
-                    else:
-                        print(f"[!] 잘못된 방 ID: {room_id}")
-                        
-                except Exception as e:
-                    print(f"[!] 장치 처리 중 오류 ({device_name}): {e}")
-                    continue
+            # 장치 목록을 방 비트마스크로 변환
+            target_mask = self._mask_from_names(device_list)
+            current_mask = self.broadcast_manager.get_active_mask()
             
             # BroadcastManager를 통해 상태 설정
             if state:
                 # 켜기: 현재 활성 방들과 새로운 방들을 합침
-                current_active = self.broadcast_manager.get_active_rooms()
-                all_active_rooms = current_active.union(target_rooms)
-                success = self.broadcast_manager.set_active_rooms(all_active_rooms)
+                new_mask = current_mask | target_mask
+                changed_mask = target_mask
             else:
-                # 끄기: 현재 활성 방에서 target_rooms를 제거
-                current_active = self.broadcast_manager.get_active_rooms()
-                remaining_rooms = current_active - target_rooms
-                success = self.broadcast_manager.set_active_rooms(remaining_rooms)
+                # 끄기: 현재 활성 방에서 대상 방들을 제거
+                new_mask = current_mask & ~target_mask
+                changed_mask = current_mask & target_mask
             
-            if success:
-                print(f"[*] 다중 장치 제어 완료: {sorted(target_rooms) if state else sorted(current_active - remaining_rooms)}")
+            # 상태가 그대로면 BroadcastManager에서 패킷 전송 생략
+            success = self.broadcast_manager.set_active_mask(new_mask)
+            
+            if success and changed_mask and logger.isEnabledFor(logging.INFO):
+                logger.info("다중 장치 제어 완료: %s", sorted(self._rooms_from_mask(changed_mask)))
             
             return success
             
         except Exception as e:
-            print(f"[!] 다중 장치 제어 중 오류: {e}")
+            logger.warning(f"다중 장치 제어 중 오류: {e}")
             return False
     
+    def _mask_from_names(self, device_list):
+        """
+        장치명 목록을 방 비트마스크로 변환
+        
+        Parameters:
+        -----------
+        device_list : list
+            장치명 또는 방 ID 리스트 (예: ["1-1", "101", 312])
+            
+        Returns:
+        --------
+        int
+            64비트 방 비트마스크
+        """
+        mask = 0
+        for device_name in device_list:
+            if isinstance(device_name, str):
+                room_id = _room_from_name(device_name, allow_room_id=True)
+            elif isinstance(device_name, int):
+                room_id = device_name if device_name in self._room_bit else None
+            else:
+                room_id = None
+            
+            if room_id is None:
+                logger.warning(f"지원되지 않는 장치명: {device_name}")
+                continue
+            mask |= self._room_bit[room_id]
+        return mask
+    
+    def _rooms_from_mask(self, mask):
+        """방 비트마스크를 방 ID 집합으로 변환"""
+        return {(i // 16 + 1) * 100 + (i % 16 + 1) for i in range(64) if mask >> i & 1}
+    
     def test_connection(self):
         """네트워크 연결 테스트"""
         return self.broadcast_manager.test_connection()
@@ -345,7 +711,7 @@ class BroadcastController:
     def initialize_tts(self, language="ko"):
         """TTS 시스템 초기화"""
         try:
-            print(f"[*] TTS 서비스 초기화 중 (언어: {language})...")
+            logger.info(f"TTS 서비스 초기화 중 (언어: {language})...")
             
             # 통합 TTS 서비스 사용
             from .tts_service import init_tts_service
@@ -362,15 +728,14 @@ class BroadcastController:
             
             # TTS 정보 출력
             tts_info = self.tts_service.get_tts_info()
-            print(f"[*] 활성화된 TTS 엔진: {tts_info['description']} (품질: {tts_info['quality']})")
+            logger.info(f"활성화된 TTS 엔진: {tts_info['description']} (품질: {tts_info['quality']})")
             
             self.tts_initialized = True
-            print(f"[*] TTS 서비스 초기화 완료 (언어: {language})")
+            logger.info(f"TTS 서비스 초기화 완료 (언어: {language})")
             return True
             
         except Exception as e:
-            print(f"[!] TTS 서비스 초기화 실패: {e}")
-            traceback.print_exc()
+            logger.exception(f"TTS 서비스 초기화 실패: {e}")
             self.tts_initialized = False
             return False
     
@@ -378,210 +743,465 @@ class BroadcastController:
         """텍스트를 음성으로 변환"""
         try:
             if not text or not text.strip():
-                print("[!] 오류: 변환할 텍스트가 비어있습니다.")
+                logger.warning("오류: 변환할 텍스트가 비어있습니다.")
                 return None
             
             # TTS 서비스가 초기화되지 않았으면 초기화
             if not hasattr(self, 'tts_service') or not self.tts_initialized:
-                print("[*] TTS 서비스가 초기화되지 않았습니다. 초기화를 시도합니다...")
+                logger.info("TTS 서비스가 초기화되지 않았습니다. 초기화를 시도합니다...")
                 success = self.initialize_tts(language)
                 if not success:
-                    print("[!] TTS 서비스 초기화 실패, 음성 변환을 진행할 수 없습니다.")
+                    logger.warning("TTS 서비스 초기화 실패, 음성 변환을 진행할 수 없습니다.")
                     return None
             
-            # 출력 경로가 지정되지 않았으면 자동 생성 (temp 디렉토리 사용)
-            if output_path is None:
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                # temp 디렉토리에 임시 TTS 파일 생성
-                output_path = Path(config.temp_dir) / f"audio_{timestamp}_tts.wav"
+            # 캐시 조회
+            cache_key = self._tts_cache_key(text, language)
+            cached_path = self._get_cached_speech(cache_key)
+            if cached_path is None:
+                # 같은 문구를 합성 중인 스레드가 있으면 그 결과를 기다림
+                cached_path = self._run_single_flight(
+                    ("tts", cache_key), self._synthesize_cached_locked, text, cache_key, language
+                )
+                if cached_path is None:
+                    return None
             else:
-                output_path = Path(output_path)
+                self._tts_cache_hits += 1
+                logger.info(f"TTS 캐시 적중: {cached_path} (누적 {self._tts_cache_hits}회)")
+            
+            # 출력 경로가 지정되지 않았으면 캐시 파일을 그대로 사용
+            if output_path is None:
+                return str(cached_path)
             
-            # 디렉토리가 존재하지 않으면 생성
+            output_path = Path(output_path)
             os.makedirs(output_path.parent, exist_ok=True)
+            self._link_or_copy(cached_path, output_path)
             
-            # 텍스트 내용 로깅
-            display_text = text[:50] + ('...' if len(text) > 50 else '')
-            print(f"[*] 텍스트를 음성으로 변환 중: '{display_text}'")
+            return str(output_path)
             
-            # TTS 서비스를 사용하여 음성 생성
-            start_time = time.time()
-            result_path = self.tts_service.synthesize(text, output_path=output_path, language=language)
+        except Exception as e:
+            logger.error(f"음성 생성 중 오류: {e}")
+            return None
+    
+    def generate_speech_many(self, texts, language="ko"):
+        """
+        여러 텍스트를 한 번에 음성으로 변환 (캐시에 없는 텍스트만 일괄 합성)
+        
+        Parameters:
+        -----------
+        texts : list
+            변환할 텍스트 목록
+        language : str
+            텍스트 언어
             
-            if not result_path:
-                print("[!] 음성 생성 실패")
-                return None
-                
-            elapsed_time = time.time() - start_time
-            print(f"[*] 음성 파일 생성 완료: {output_path} (소요 시간: {elapsed_time:.2f}초)")
+        Returns:
+        --------
+        list
+            입력 순서와 같은 음성 파일 경로 목록 (실패한 항목은 None)
+        """
+        try:
+            if not hasattr(self, 'tts_service') or not self.tts_initialized:
+                if not self.initialize_tts(language):
+                    return [None] * len(texts)
+            
+            keys = [self._tts_cache_key(text, language) for text in texts]
+            
+            # 캐시에 없는 텍스트만 모아서 합성
+            missing = {}
+            for text, key in zip(texts, keys):
+                if text and text.strip() and key not in missing and self._get_cached_speech(key) is None:
+                    missing[key] = text
+            
+            if missing:
+                logger.info(f"TTS 일괄 합성 시작: {len(missing)}개 (언어: {language})")
+                start_time = time.monotonic()
+                # 항목별 single-flight로 합성 (엔진은 항목 단위로만 점유하므로 다른 방송의 합성이 배치 뒤에 막히지 않음)
+                for key, text in missing.items():
+                    try:
+                        self._run_single_flight(("tts", key), self._synthesize_cached_locked, text, key, language)
+                    except Exception as e:
+                        logger.warning(f"일괄 음성 생성 중 항목 실패: {e}")
+                logger.info(f"TTS 일괄 합성 완료: {len(missing)}개 (소요 시간: {time.monotonic() - start_time:.2f}초)")
             
-            return str(result_path)
+            paths = []
+            for key in keys:
+                cached_path = self._get_cached_speech(key)
+                paths.append(str(cached_path) if cached_path else None)
+            return paths
             
         except Exception as e:
-            logger.error(f"음성 생성 중 오류: {e}")
+            logger.error(f"일괄 음성 생성 중 오류: {e}")
+            return [None] * len(texts)
+    
+    def _prefetch_queued_speech(self, language, max_batch=8):
+        """대기열에 있는 같은 언어의 텍스트 방송을 미리 일괄 합성하여 캐시에 저장"""
+        with self._jobs_cv:
+            jobs = list(self._jobs)
+        texts = [job.params.get('text', '') for job in jobs
+                 if job.job_type == 'text' and job.params.get('language', 'ko') == language][:max_batch]
+        if texts:
+            self.generate_speech_many(texts, language=language)
+    
+    def _link_or_copy(self, src, dst):
+        """하드 링크로 파일 공유 (실패하면 reflink 복제, 그것도 안 되면 복사)"""
+        dst = Path(dst)
+        try:
+            if dst.exists():
+                dst.unlink()
+            os.link(src, dst)
+        except OSError:
+            if not _reflink(src, dst):
+                shutil.copyfile(src, dst)
+        return dst
+    
+    def _rendered_preview_cache_path(self, tts_audio_path):
+        """
+        TTS 파일에 대한 렌더링된 프리뷰 캐시 경로 반환
+        
+        Returns:
+        --------
+        tuple
+            (캐시 경로, 캐시 유효 여부)
+        """
+        # 인코딩 품질, 정규화 목표, 신호음 구성이 바뀌면 다른 캐시 파일을 사용
+        self._refresh_signals()
+        render_settings = (
+            tuple(sorted(self._preview_encode_settings().items())),
+            audio_normalizer.target_dbfs, "loudnorm-linear",
+            self._start_signal_exists, self._end_signal_exists,
+        )
+        render_tag = hashlib.blake2b(repr(render_settings).encode("utf-8"), digest_size=4).hexdigest()
+        cache_path = self._tts_cache_dir / f"{Path(tts_audio_path).stem}_{render_tag}_preview.mp3"
+        try:
+            rendered_mtime = os.stat(cache_path).st_mtime
+        except FileNotFoundError:
+            return cache_path, False
+        
+        # TTS 파일이나 신호음이 더 최근에 바뀌었으면 다시 렌더링
+        for source in (tts_audio_path, self.start_signal_path, self.end_signal_path):
+            try:
+                if os.stat(source).st_mtime > rendered_mtime:
+                    return cache_path, False
+            except FileNotFoundError:
+                continue
+        return cache_path, True
+    
+    def _tts_cache_key(self, text, language):
+        """TTS 캐시 키 계산 (엔진, 언어, 텍스트 기준)"""
+        voice = getattr(self.tts_service, 'tts_type', '') or ''
+        return hashlib.blake2b(f"{voice}|{language}|{text}".encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _get_cached_speech(self, cache_key):
+        """캐시된 음성 파일 경로 반환 (없으면 None)"""
+        cached_path = self._tts_mem_index.get(cache_key)
+        if cached_path is None:
+            return None
+        try:
+            # 헤더만 있는 빈 파일은 캐시로 인정하지 않음
+            if os.stat(cached_path).st_size > 44:
+                return cached_path
+        except FileNotFoundError:
+            pass
+        self._tts_mem_index.pop(cache_key, None)
+        return None
+    
+    def _run_single_flight(self, key, func, *args):
+        """
+        같은 키의 작업이 진행 중이면 그 결과를 기다리고, 아니면 직접 실행
+        
+        Parameters:
+        -----------
+        key : tuple
+            작업 식별 키
+        func : callable
+            실행할 함수
+        *args
+            함수 인자
+            
+        Returns:
+        --------
+        Any
+            함수 실행 결과 (먼저 시작한 호출의 결과를 공유)
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        return future.result()
+    
+    def _synthesize_cached_locked(self, text, cache_key, language):
+        """캐시를 재확인한 뒤 TTS 엔진을 독점하여 합성"""
+        with self._tts_cache_lock:
+            # 대기 중 다른 스레드가 같은 문구를 합성했을 수 있으므로 재확인
+            cached_path = self._get_cached_speech(cache_key)
+            if cached_path is None:
+                cached_path = self._synthesize_to_cache(text, cache_key, language)
+            return cached_path
+    
+    def _synthesize_to_cache(self, text, cache_key, language):
+        """텍스트를 합성하여 캐시 디렉토리에 저장"""
+        os.makedirs(self._tts_cache_dir, exist_ok=True)
+        # 임시 파일에 합성한 뒤 원자적으로 교체 (재생 중인 플레이어가 쓰다 만 파일을 읽지 않도록)
+        tmp_path = self._tts_cache_dir / f"{cache_key}.tmp.wav"
+        
+        # 텍스트 내용 로깅
+        display_text = text[:50] + ('...' if len(text) > 50 else '')
+        logger.info(f"텍스트를 음성으로 변환 중: '{display_text}'")
+        
+        # TTS 서비스를 사용하여 음성 생성
+        start_time = time.monotonic()
+        result_path = self.tts_service.synthesize(text, output_path=tmp_path, language=language)
+        
+        if not result_path:
+            logger.warning("음성 생성 실패")
             return None
+        
+        # 엔진에 따라 확장자가 바뀔 수 있으므로 결과 파일의 확장자를 유지
+        final_path = self._tts_cache_dir / f"{cache_key}{Path(result_path).suffix}"
+        os.replace(result_path, final_path)
+        result_path = final_path
+        self._tts_mem_index[cache_key] = result_path
+        
+        elapsed_time = time.monotonic() - start_time
+        logger.info(f"음성 파일 생성 완료: {result_path} (소요 시간: {elapsed_time:.2f}초)")
+        return result_path
+    
+    def _load_tts_cache_index(self):
+        """캐시 디렉토리를 스캔하여 메모리 인덱스 구성"""
+        try:
+            os.makedirs(self._tts_cache_dir, exist_ok=True)
+            for cached_file in self._tts_cache_dir.glob("*.*"):
+                # 프리뷰 렌더(_preview.mp3), 합성 중 임시 파일(.tmp.wav), 길이 사이드카(.dur)는 제외
+                stem = cached_file.stem
+                if (not stem or '.' in stem or stem.endswith("_preview")
+                        or cached_file.suffix == DURATION_SIDECAR_SUFFIX or not cached_file.is_file()):
+                    continue
+                self._tts_mem_index[stem] = cached_file
+            logger.info(f"TTS 캐시 로드 완료: {len(self._tts_mem_index)}개 ({self._tts_cache_dir})")
+        except Exception as e:
+            logger.warning(f"TTS 캐시 로드 실패: {e}")
+    
+    def get_tts_cache_stats(self):
+        """TTS 캐시 현황 반환 (캐시 항목 수, 누적 적중 횟수)"""
+        return {
+            "entries": len(self._tts_mem_index),
+            "hits": self._tts_cache_hits,
+        }
+    
+    def _tts_cache_cleanup_loop(self):
+        """시작 시 한 번, 이후 TTS_CACHE_CLEANUP_INTERVAL마다 만료된 TTS 캐시 정리 (종료 시 중단)"""
+        self._cleanup_tts_cache()
+        while not self._tts_cleanup_stop.wait(TTS_CACHE_CLEANUP_INTERVAL):
+            self._cleanup_tts_cache()
+    
+    def _cleanup_tts_cache(self):
+        """보관 기간이 지난 TTS 캐시 파일 정리 (길이 사이드카와 프리뷰 렌더도 함께 삭제)"""
+        try:
+            expire_before = time.time() - self._tts_cache_ttl
+            removed = 0
+            for cache_key, cached_path in list(self._tts_mem_index.items()):
+                try:
+                    if os.stat(cached_path).st_mtime < expire_before:
+                        with self._tts_cache_lock:
+                            self._tts_mem_index.pop(cache_key, None)
+                            cached_path.unlink()
+                            with contextlib.suppress(OSError):
+                                os.unlink(str(cached_path) + DURATION_SIDECAR_SUFFIX)
+                            for rendered_path in self._tts_cache_dir.glob(f"{cache_key}_*preview.mp3"):
+                                with contextlib.suppress(OSError):
+                                    rendered_path.unlink()
+                        removed += 1
+                except FileNotFoundError:
+                    self._tts_mem_index.pop(cache_key, None)
+            if removed:
+                logger.info(f"만료된 TTS 캐시 {removed}개 삭제")
+        except Exception as e:
+            logger.warning(f"TTS 캐시 정리 중 오류: {e}")
+    
+    # 오디오 재생 관련 메서드들
+    def _init_vlc_player(self):
+        """공용 VLC 인스턴스 및 플레이어 생성 (이벤트 핸들러는 한 번만 등록)"""
+        if _VLC is None:
+            logger.warning("VLC 모듈이 없어 플레이어를 초기화할 수 없습니다.")
+            return False
+        
+        try:
+            self._vlc_instance = _VLC.Instance('--no-audio-time-stretch', '--audio-resampler=soxr', '--no-video', '--quiet')
+            self._vlc_player = self._vlc_instance.media_player_new()
+            self._vlc_player.audio_set_volume(100)
+            self.player = self._vlc_player
+            
+            def handle_end_event(event):
+                self._mark_playback_done(event.type)
+                logger.info(f"VLC 이벤트: 미디어 재생 완료 ({event.type})")
+            
+            event_manager = self._vlc_player.event_manager()
+            for event_type in (_VLC.EventType.MediaPlayerEndReached,
+                               _VLC.EventType.MediaPlayerStopped,
+                               _VLC.EventType.MediaPlayerEncounteredError):
+                event_manager.event_attach(event_type, handle_end_event)
+            
+            logger.info("VLC 플레이어 초기화 완료")
+            return True
+        except Exception as e:
+            logger.warning(f"VLC 플레이어 초기화 실패: {e}")
+            self._vlc_instance = None
+            self._vlc_player = None
+            return False
     
-    # 오디오 재생 관련 메서드들 (기존 코드 유지)
     def play_audio(self, audio_path):
         """오디오 파일 재생"""
         try:
             audio_path = Path(audio_path)
             if not audio_path.exists():
-                print(f"[!] 오류: 오디오 파일이 존재하지 않습니다: {audio_path}")
+                logger.warning(f"오류: 오디오 파일이 존재하지 않습니다: {audio_path}")
                 return False
             
-            if self.is_playing and hasattr(self, 'player'):
-                print("[*] 이미 재생 중인 오디오가 있습니다. 큐에서 대기 중입니다.")
+            if self.is_playing:
+                logger.info("이미 재생 중인 오디오가 있습니다. 큐에서 대기 중입니다.")
                 return False
             
-            print(f"[*] 오디오 파일 재생 준비: {audio_path}")
+            logger.info(f"오디오 파일 재생 준비: {audio_path}")
             
-            # VLC를 사용해 재생 시도
+            # 공용 VLC 플레이어로 재생 시도 (미디어만 교체)
             try:
-                import vlc
-                
-                # VLC 인스턴스 초기화
-                vlc_instance = vlc.Instance('--no-audio-time-stretch', '--audio-resampler=soxr', '--no-video')
-                self.player = vlc_instance.media_player_new()
-                media = vlc_instance.media_new(str(audio_path))
-                
-                # 종료 이벤트 관리
-                self.playback_finished = False
-                
-                def handle_end_event(event):
-                    if event.u.new_state in [vlc.State.Ended, vlc.State.Error, vlc.State.Stopped]:
-                        self.playback_finished = True
-                        print(f"[*] VLC 이벤트: 미디어 재생 완료")
+                if self._vlc_player is None and not self._init_vlc_player():
+                    raise RuntimeError("VLC 플레이어를 사용할 수 없습니다")
                 
-                event_manager = media.event_manager()
-                event_manager.event_attach(vlc.EventType.MediaStateChanged, handle_end_event)
+                media = self._vlc_instance.media_new(str(audio_path))
                 
-                self.player.set_media(media)
-                self.player.audio_set_volume(100)
-                self.is_playing = True
+                def start_playback():
+                    # 이전 stop 작업이 끝난 뒤 같은 스레드에서 미디어 교체 및 재생
+                    self._vlc_player.set_media(media)
+                    
+                    # 이전 미디어 해제 (플레이어가 자체 참조를 유지하므로 안전)
+                    if self._vlc_media is not None:
+                        self._vlc_media.release()
+                    self._vlc_media = media
+                    
+                    # 종료 이벤트 관리
+                    self.playback_finished = False
+                    self._play_future = Future()
+                    self.is_playing = True
+                    
+                    return self._vlc_player.play()
                 
-                play_result = self.player.play()
+                play_result = self._vlc_io.submit(start_playback).result()
                 
                 if play_result == 0:
-                    print(f"[*] 오디오 재생 시작 (VLC 사용): {audio_path}")
-                    time.sleep(0.5)
+                    logger.info(f"오디오 재생 시작 (VLC 사용): {audio_path}")
                     
-                    if self.player.get_state() in [vlc.State.Playing, vlc.State.Opening]:
-                        # 재생 모니터링 스레드 시작
-                        self.player_thread = threading.Thread(
-                            target=self._monitor_vlc_playback,
-                            daemon=True
-                        )
-                        self.player_thread.start()
-                        return True
-                    else:
-                        print(f"[!] VLC 재생 상태가 Playing이 아님: {self.player.get_state()}")
+                    # 재생 상태가 확인되면 바로 반환 (최대 0.5초, 짧은 파일은 이미 종료 이벤트가 발생했을 수 있음)
+                    deadline = time.monotonic() + 0.5
+                    play_future = self._play_future
+                    while True:
+                        if play_future.done() or self._vlc_player.get_state() in _VLC_ACTIVE_STATES:
+                            return True
+                        if time.monotonic() >= deadline:
+                            break
+                        try:
+                            play_future.result(timeout=0.02)
+                        except FutureTimeoutError:
+                            pass
+                    logger.warning(f"VLC 재생 상태가 Playing이 아님: {self._vlc_player.get_state()}")
                 else:
-                    print(f"[!] VLC 재생 시작 실패: {play_result}")
+                    logger.warning(f"VLC 재생 시작 실패: {play_result}")
             except Exception as e:
-                print(f"[!] VLC로 오디오 재생 실패: {e}")
+                logger.warning(f"VLC로 오디오 재생 실패: {e}")
                 
-            print("[!] 모든 오디오 재생 방법이 실패했습니다.")
+            logger.warning("모든 오디오 재생 방법이 실패했습니다.")
+            self._mark_playback_done()
             return False
                 
         except Exception as e:
-            print(f"[!] 오디오 재생 중 오류 발생: {e}")
-            traceback.print_exc()
+            logger.exception(f"오디오 재생 중 오류 발생: {e}")
             return False
     
     def stop_audio(self):
-        """현재 재생 중인 오디오를 중지합니다."""
+        """
+        현재 재생 중인 오디오를 중지합니다. (플레이어는 해제하지 않고 재사용)
+        
+        player.stop()은 오디오 출력 정리를 기다리므로 VLC 전용 스레드에 맡기고 바로 반환합니다.
+        이후의 재생 요청도 같은 스레드에서 순서대로 실행되므로 중지가 끝난 뒤에 시작됩니다.
+        """
         if not self.is_playing:
-            print("[*] 중지할 오디오가 없습니다.")
+            logger.info("중지할 오디오가 없습니다.")
             return True
             
-        print("[*] 오디오 재생을 중지합니다...")
+        logger.info("오디오 재생을 중지합니다...")
         
         try:
-            import vlc
-            if hasattr(self, 'player') and isinstance(self.player, vlc.MediaPlayer):
-                try:
-                    self.player.stop()
-                    time.sleep(0.1)
-                    
-                    media = self.player.get_media()
-                    if media:
-                        try:
-                            media.release()
-                        except:
-                            pass
-                    
-                    try:
-                        self.player.release()
-                    except:
-                        if hasattr(self, 'player'):
-                            self.player = None
-                            
-                    print("[*] VLC 오디오 재생이 중지되었습니다.")
-                    
-                except Exception as e:
-                    print(f"[!] VLC 플레이어 중지 중 오류: {e}")
-                    if hasattr(self, 'player'):
-                        self.player = None
-                
-                self.is_playing = False
-                return True
+            # 실제 중지는 VLC 전용 스레드에서 처리 (다음 준비 작업과 겹쳐 실행)
+            self._mark_playback_done()
+            if self._vlc_player is not None:
+                self._vlc_io.submit(self._vlc_player.stop)
+                logger.info("VLC 오디오 재생 중지 요청 완료")
+            return True
                 
         except Exception as e:
-            print(f"[!] 오디오 중지 중 오류 발생: {e}")
-            self.is_playing = False
-            if hasattr(self, 'player'):
-                self.player = None
+            logger.warning(f"오디오 중지 중 오류 발생: {e}")
+            self._mark_playback_done()
             return False
     
-    def _monitor_vlc_playback(self):
-        """VLC 재생 상태를 모니터링하는 스레드 함수"""
-        try:
-            import vlc
-            if not hasattr(self, 'player') or not isinstance(self.player, vlc.MediaPlayer):
-                return
-            
-            while self.is_playing:
-                try:
-                    state = self.player.get_state()
-                    
-                    if state in [vlc.State.Ended, vlc.State.Stopped, vlc.State.Error]:
-                        print(f"[*] VLC 재생 완료 감지 (상태: {state})")
-                        self.playback_finished = True
-                        self.is_playing = False
-                        break
-                except Exception as e:
-                    print(f"[!] VLC 상태 확인 중 오류: {e}")
-                    time.sleep(1)
-                    continue
-                
-                time.sleep(0.5)
-                
-        except Exception as e:
-            print(f"[!] VLC 모니터링 스레드 오류: {e}")
-            self.playback_finished = True
-            self.is_playing = False
+    def _mark_playback_done(self, state=None):
+        """
+        재생 종료 상태 기록 및 재생 Future 완료 (대기 중인 스레드 깨우기)
+        
+        Parameters:
+        -----------
+        state : object
+            종료 원인 (VLC 이벤트 종류, 직접 중지한 경우 None)
+        """
+        self.playback_finished = True
+        self.is_playing = False
+        play_future = self._play_future
+        if not play_future.done():
+            try:
+                play_future.set_result(state)
+            except InvalidStateError:
+                pass  # VLC 이벤트 스레드와 동시에 완료된 경우
     
-    def _check_playback_finished(self):
-        """재생 완료 여부를 확인합니다"""
-        if hasattr(self, 'playback_finished') and self.playback_finished:
-            return True
-            
-        if not self.is_playing:
-            return True
-            
-        try:
-            import vlc
-            if hasattr(self, 'player') and isinstance(self.player, vlc.MediaPlayer):
-                state = self.player.get_state()
-                if state in [vlc.State.Ended, vlc.State.Stopped, vlc.State.Error]:
-                    print(f"[*] 재생 완료 체크: VLC 상태 {state}")
-                    return True
-        except Exception as e:
-            print(f"[!] VLC 상태 확인 중 오류: {e}")
-            pass
+    def _wait_for_playback(self, timeout=None):
+        """
+        재생 Future 완료 대기
+        
+        Parameters:
+        -----------
+        timeout : float
+            대기 시간 (초). 시간이 지나도 VLC가 재생 중이면 계속 대기합니다.
             
-        return False
+        Returns:
+        --------
+        object
+            재생 종료 원인 (VLC 이벤트 종류, 시간 초과/직접 중지 시 None)
+        """
+        play_future = self._play_future
+        while True:
+            try:
+                return play_future.result(timeout=timeout)
+            except FutureTimeoutError:
+                pass
+            try:
+                if self._vlc_player is not None and self._vlc_player.get_state() in _VLC_ACTIVE_STATES:
+                    logger.info("예상 재생 시간 초과, 재생이 계속되어 대기합니다...")
+                    continue
+            except Exception as e:
+                logger.warning(f"VLC 상태 확인 중 오류: {e}")
+            logger.warning("재생 종료 이벤트 대기 시간 초과")
+            self._mark_playback_done()
+            return None
     
     # 방송 큐 관련 메서드들
     def broadcast_audio(self, audio_path, target_devices, end_devices=None, duration=None, skip_signals=False):
@@ -594,11 +1214,8 @@ class BroadcastController:
             'skip_signals': skip_signals
         })
         
-        self.broadcast_queue.put(job)
-        self.broadcast_jobs.append(job)
-        
-        queue_position = len(self.broadcast_jobs)
-        estimated_start_time = self._calculate_estimated_start_time(queue_position)
+        queue_position, preceding_duration = self._enqueue_job(job)
+        estimated_start_time = self._calculate_estimated_start_time(preceding_duration)
         
         return {
             "status": "queued", 
@@ -618,11 +1235,8 @@ class BroadcastController:
             'language': language
         })
         
-        self.broadcast_queue.put(job)
-        self.broadcast_jobs.append(job)
-        
-        queue_position = len(self.broadcast_jobs)
-        estimated_start_time = self._calculate_estimated_start_time(queue_position)
+        queue_position, preceding_duration = self._enqueue_job(job)
+        estimated_start_time = self._calculate_estimated_start_time(preceding_duration)
         
         return {
             "status": "queued", 
@@ -633,25 +1247,62 @@ class BroadcastController:
             "message": f"방송이 대기열 {queue_position}번째에 추가되었습니다."
         }
     
-    def _calculate_estimated_start_time(self, queue_position):
-        """큐 순서에 따른 예상 시작시간 계산"""
-        import datetime
+    def _enqueue_job(self, job):
+        """
+        작업을 대기열에 추가하고 워커를 깨움
         
-        now = datetime.datetime.now()
-        total_estimated_duration = 0
+        Returns:
+        --------
+        tuple
+            (대기열 위치, 앞선 대기 작업들의 예상 소요시간 합계)
+        """
+        with self._jobs_cv:
+            preceding_duration = self._pending_duration_sum
+            self._jobs.append(job)
+            self._jobs_by_id[job.job_id] = job
+            self._pending_duration_sum += job.estimated_duration
+            self._queue_version += 1
+            queue_position = len(self._jobs)
+            self._jobs_cv.notify()
+        return queue_position, preceding_duration
+    
+    def _next_job(self):
+        """대기열에서 다음 작업을 꺼냄 (작업이 들어올 때까지 대기, 종료 요청 시 None 반환)"""
+        with self._jobs_cv:
+            while not self._jobs and not self._shutting_down:
+                self._jobs_cv.wait()
+            if self._shutting_down:
+                return None
+            job = self._jobs.popleft()
+            self._jobs_by_id.pop(job.job_id, None)
+            self._pending_duration_sum = max(0.0, self._pending_duration_sum - job.estimated_duration)
+            self._current_job = job
+            self._queue_version += 1
+        return job
+    
+    def get_queued_job(self, job_id):
+        """대기 중인 작업을 ID로 조회 (없으면 None)"""
+        return self._jobs_by_id.get(job_id)
+    
+    def _calculate_estimated_start_time(self, preceding_duration):
+        """
+        앞선 작업들의 예상 소요시간 합계로 예상 시작시간 계산
         
-        # 현재 재생 중인 방송의 남은 시간
-        if self.is_playing and self.current_broadcast_start_time and self.current_broadcast_duration:
-            elapsed_time = (datetime.datetime.now() - self.current_broadcast_start_time).total_seconds()
-            remaining_current_broadcast = max(0, self.current_broadcast_duration - elapsed_time)
-            total_estimated_duration += remaining_current_broadcast
+        Parameters:
+        -----------
+        preceding_duration : float
+            앞선 작업들의 예상 소요시간 합계 (초)
+        """
+        total_estimated_duration = preceding_duration
         
-        # 큐에 있는 작업들의 예상 소요시간
-        for i in range(queue_position - 1):
-            if i < len(self.broadcast_jobs):
-                total_estimated_duration += self.broadcast_jobs[i].estimated_duration
+        # 현재 재생 중인 방송의 남은 시간 (경과 시간은 monotonic 시계로 계산)
+        started = self._current_broadcast_started
+        if self.is_playing and started is not None and self.current_broadcast_duration:
+            elapsed_time = time.monotonic() - started
+            total_estimated_duration += max(0, self.current_broadcast_duration - elapsed_time)
         
-        estimated_start = now + datetime.timedelta(seconds=total_estimated_duration)
+        # 벽시계 시간은 결과를 표시할 때 한 번만 사용
+        estimated_start = datetime.datetime.now() + datetime.timedelta(seconds=total_estimated_duration)
         return estimated_start.strftime("%H:%M:%S")
     
     def _do_broadcast_audio(self, audio_path, target_devices, end_devices=None, duration=None, skip_signals=False):
@@ -661,117 +1312,185 @@ class BroadcastController:
                 logger.error(f"오디오 파일을 찾을 수 없음: {audio_path}")
                 return False
 
-            print(f"[*] 오디오 방송 시작: {audio_path}")
-            print(f"[*] 대상 장치: {target_devices}")
+            logger.info(f"오디오 방송 시작: {audio_path}")
+            logger.info(f"대상 장치: {target_devices}")
             if skip_signals:
-                print(f"[*] 프리뷰 파일 재생 모드 (시작음/끝음 건너뜀)")
+                logger.info("프리뷰 파일 재생 모드 (시작음/끝음 건너뜀)")
 
             # end_devices가 지정되지 않으면 target_devices와 동일하게 설정 (방송 후 자동 끄기)
             if end_devices is None:
                 end_devices = target_devices
-                print(f"[*] 방송 완료 후 자동으로 끌 장치: {end_devices}")
+                logger.info(f"방송 완료 후 자동으로 끌 장치: {end_devices}")
 
-            # 0. 방송 전 장치 상태 저장 (복원 기능이 활성화된 경우)
-            if self.restore_device_states_enabled:
-                print(f"[*] 0단계: 방송 전 장치 상태 저장...")
+            # 0. 방송 전 장치 상태 저장 (복원 기능이 활성화된 경우, 이전 방송에서 넘겨받은 장치면 기존 백업 유지)
+            if self._take_held_devices(target_devices):
+                logger.info("0단계: 이전 방송의 장치 상태를 이어받아 저장 생략")
+            elif self.restore_device_states_enabled:
+                logger.info("0단계: 방송 전 장치 상태 저장...")
                 self.save_device_states(target_devices)
-                print(f"[*] 0단계: 장치 상태 저장 완료")
+                logger.info("0단계: 장치 상태 저장 완료")
 
             # 1. 대상 장치 활성화
-            print(f"[*] 1단계: 대상 장치 활성화 시작...")
+            logger.info("1단계: 대상 장치 활성화 시작...")
             success = self.control_multiple_devices(target_devices, 1)
             if not success:
                 logger.error("장치 활성화 실패")
                 return False
-            print(f"[*] 1단계: 대상 장치 활성화 완료")
+            logger.info("1단계: 대상 장치 활성화 완료")
 
             # 2. 시작 신호음 재생 (프리뷰 파일이 아닌 경우에만)
             if not skip_signals:
-                print(f"[*] 2단계: 시작 신호음 재생...")
+                logger.info("2단계: 시작 신호음 재생...")
                 if self.play_start_signal():
                     # 시작 신호음 재생 완료 대기
-                    while not self._check_playback_finished():
-                        time.sleep(0.1)
+                    self._wait_for_playback(timeout=30)
                     self.stop_audio()
-                    print(f"[*] 2단계: 시작 신호음 재생 완료")
+                    logger.info("2단계: 시작 신호음 재생 완료")
                 else:
-                    print(f"[*] 2단계: 시작 신호음 재생 건너뜀")
+                    logger.info("2단계: 시작 신호음 재생 건너뜀")
             else:
-                print(f"[*] 2단계: 시작 신호음 재생 건너뜀 (프리뷰 파일)")
+                logger.info("2단계: 시작 신호음 재생 건너뜀 (프리뷰 파일)")
 
             # 3. 메인 오디오 재생
-            print(f"[*] 3단계: 메인 오디오 재생 시작...")
+            logger.info("3단계: 메인 오디오 재생 시작...")
             success = self.play_audio(str(audio_path))
             if not success:
                 logger.error("오디오 재생 실패")
-                print(f"[*] 재생 실패로 인한 장치 끄기 시작: {end_devices}")
+                logger.info(f"재생 실패로 인한 장치 끄기 시작: {end_devices}")
                 self._force_turn_off_devices(end_devices)
                 return False
-            print(f"[*] 3단계: 메인 오디오 재생 시작 완료")
+            logger.info("3단계: 메인 오디오 재생 시작 완료")
 
             # 4. 재생 완료 대기
-            print(f"[*] 4단계: 재생 완료 대기 중...")
-            while not self._check_playback_finished():
-                time.sleep(0.5)
+            logger.info("4단계: 재생 완료 대기 중...")
+            self._wait_for_playback(timeout=(self.current_broadcast_duration or 30) + 5)
 
             # 5. 재생 중지
-            print(f"[*] 5단계: 메인 오디오 재생 중지...")
+            logger.info("5단계: 메인 오디오 재생 중지...")
             self.stop_audio()
-            print("[*] 5단계: 메인 오디오 재생 중지 완료")
+            logger.info("5단계: 메인 오디오 재생 중지 완료")
 
             # 6. 끝 신호음 재생 (프리뷰 파일이 아닌 경우에만)
             if not skip_signals:
-                print(f"[*] 6단계: 끝 신호음 재생...")
+                logger.info("6단계: 끝 신호음 재생...")
                 if self.play_end_signal():
                     # 끝 신호음 재생 완료 대기
-                    while not self._check_playback_finished():
-                        time.sleep(0.1)
+                    self._wait_for_playback(timeout=30)
                     self.stop_audio()
-                    print(f"[*] 6단계: 끝 신호음 재생 완료")
+                    logger.info("6단계: 끝 신호음 재생 완료")
                 else:
-                    print(f"[*] 6단계: 끝 신호음 재생 건너뜀")
+                    logger.info("6단계: 끝 신호음 재생 건너뜀")
             else:
-                print(f"[*] 6단계: 끝 신호음 재생 건너뜀 (프리뷰 파일)")
+                logger.info("6단계: 끝 신호음 재생 건너뜀 (프리뷰 파일)")
 
             # 7. 종료 후 대기
-            print(f"[*] 7단계: 종료 후 대기 (0.5초)...")
+            logger.info("7단계: 종료 후 대기 (0.5초)...")
             time.sleep(0.5)
 
-            # 8. 장치 상태 처리
-            if self.restore_device_states_enabled:
+            # 8. 장치 상태 처리 (다음 방송이 같은 장치를 쓰면 켜 둔 채로 넘김)
+            if self._hold_devices_for_next_job(target_devices, end_devices):
+                logger.info("8단계: 다음 방송이 같은 장치를 사용하여 장치 상태 유지")
+            elif self.restore_device_states_enabled:
                 # 8a. 저장된 상태로 복원
-                print(f"[*] 8단계: 장치 상태 복원 시작...")
+                logger.info("8단계: 장치 상태 복원 시작...")
                 self.restore_device_states(target_devices)
-                print(f"[*] 8단계: 장치 상태 복원 완료")
+                logger.info("8단계: 장치 상태 복원 완료")
             else:
                 # 8b. 기존 방식: 종료 장치 비활성화 (방송 완료 후 자동으로 장치 끄기)
                 if end_devices:
-                    print(f"[*] 8단계: 방송 완료 - 장치 끄기 시작: {end_devices}")
+                    logger.info(f"8단계: 방송 완료 - 장치 끄기 시작: {end_devices}")
                     success = self._force_turn_off_devices(end_devices)
                     if success:
-                        print(f"[*] 8단계: 장치 끄기 완료: {end_devices}")
+                        logger.info(f"8단계: 장치 끄기 완료: {end_devices}")
                     else:
-                        print(f"[!] 8단계: 장치 끄기 실패: {end_devices}")
+                        logger.warning(f"8단계: 장치 끄기 실패: {end_devices}")
 
-            print("[*] 오디오 방송 완료")
+            logger.info("오디오 방송 완료")
             return True
 
         except Exception as e:
             logger.exception("오디오 방송 실행 중 오류")
-            print(f"[!] 방송 실행 중 예외 발생: {e}")
+            logger.warning(f"방송 실행 중 예외 발생: {e}")
             try:
                 self.stop_audio()
                 if self.restore_device_states_enabled:
                     # 예외 발생 시에도 상태 복원 시도
-                    print(f"[*] 예외 발생으로 인한 장치 상태 복원 시도...")
+                    logger.info("예외 발생으로 인한 장치 상태 복원 시도...")
                     self.restore_device_states(target_devices)
                 elif end_devices:
-                    print(f"[*] 예외 발생으로 인한 장치 끄기: {end_devices}")
+                    logger.info(f"예외 발생으로 인한 장치 끄기: {end_devices}")
                     self._force_turn_off_devices(end_devices)
             except Exception as cleanup_error:
-                print(f"[!] 정리 작업 중 오류: {cleanup_error}")
+                logger.warning(f"정리 작업 중 오류: {cleanup_error}")
             return False
     
+    def _hold_devices_for_next_job(self, target_devices, end_devices):
+        """
+        다음 대기 작업이 같은 장치를 사용하면 장치를 켜 둔 채로 넘김
+        
+        이미 대기열에 있는 다음 작업만 확인하며 (기다리지 않음), 대상/종료 장치가 같으면
+        이번 방송의 끄기(또는 복원)와 다음 방송의 켜기 패킷을 생략합니다.
+        config.broadcast_coalesce 가 False이면 사용하지 않습니다.
+        
+        Parameters:
+        -----------
+        target_devices : list
+            이번 방송의 대상 장치 목록
+        end_devices : list
+            이번 방송 후 끌 장치 목록
+            
+        Returns:
+        --------
+        bool
+            장치를 켜 둔 채로 넘겼는지 여부
+        """
+        if not config.broadcast_coalesce:
+            return False
+        with self._jobs_cv:
+            if not self._jobs:
+                return False
+            next_job = self._jobs[0]
+        params = next_job.params
+        
+        next_target = params.get('target_devices') or []
+        next_end = params.get('end_devices')
+        target_mask = self._mask_from_names(target_devices)
+        if self._mask_from_names(next_target) != target_mask:
+            return False
+        # 종료 장치가 지정되지 않으면 대상 장치와 같으므로 다시 계산하지 않음
+        end_mask = target_mask if end_devices is target_devices else self._mask_from_names(end_devices or [])
+        next_end_mask = target_mask if next_end is None else self._mask_from_names(next_end)
+        if next_end_mask != end_mask:
+            return False
+        
+        self._held_mask = target_mask
+        self._held_devices = (next_job, target_devices, end_devices)
+        return True
+    
+    def _take_held_devices(self, target_devices):
+        """이전 방송이 켜 둔 장치를 이어받을 수 있는지 확인하고 유지 상태 해제"""
+        held_mask, self._held_mask = self._held_mask, 0
+        self._held_devices = None
+        return bool(held_mask) and held_mask == self._mask_from_names(target_devices)
+    
+    def _release_held_devices(self):
+        """
+        넘겨받지 못한 채 켜 둔 장치 정리 (다음 작업이 실패했거나 취소된 경우)
+        
+        이전 방송의 종료 처리와 같이 복원 기능이 켜져 있으면 저장된 상태로 복원하고,
+        그렇지 않으면 종료 장치를 끕니다.
+        """
+        held, self._held_devices = self._held_devices, None
+        self._held_mask = 0
+        if held is None:
+            return
+        _, target_devices, end_devices = held
+        logger.warning(f"넘겨받지 못한 장치 정리: {target_devices}")
+        if self.restore_device_states_enabled:
+            self.restore_device_states(target_devices)
+        elif end_devices:
+            self._force_turn_off_devices(end_devices)
+    
     def _force_turn_off_devices(self, device_list):
         """
         장치를 강제로 끄는 메서드 (여러 번 시도)
@@ -787,253 +1506,286 @@ class BroadcastController:
             성공 여부
         """
         if not device_list:
-            print("[*] 끌 장치가 없습니다.")
+            logger.info("끌 장치가 없습니다.")
             return True
             
-        print(f"[*] 장치 강제 끄기 시작: {device_list}")
+        logger.info(f"장치 강제 끄기 시작: {device_list}")
         
-        # 최대 3번 시도
-        for attempt in range(3):
-            try:
-                print(f"[*] 장치 끄기 시도 {attempt + 1}/3...")
-                
-                # BroadcastManager를 통한 장치 끄기
-                success = self.control_multiple_devices(device_list, 0)
-                
-                if success:
-                    print(f"[*] 장치 끄기 성공 (시도 {attempt + 1}/3)")
-                    
-                    # 상태 확인
-                    time.sleep(0.2)
-                    active_rooms = self.broadcast_manager.get_active_rooms()
-                    print(f"[*] 현재 활성화된 방: {sorted(active_rooms)}")
-                    
+        # 끌 방 비트마스크를 한 번만 계산하고 지수 백오프로 최대 3번 시도 (꺼짐 확인 시 즉시 종료)
+        try:
+            off_mask = self._mask_from_names(device_list)
+            delay = 0.1
+            for attempt in range(3):
+                # 메모리상 이미 꺼져 있어도 장비 상태와 어긋났을 수 있으므로 항상 전송
+                if self.broadcast_manager.apply_state_mask(0, off_mask, force=True):
+                    logger.info(f"장치 끄기 성공 (시도 {attempt + 1}/3) - 활성 마스크: 0x{self.broadcast_manager.get_active_mask():016x}")
                     return True
-                else:
-                    print(f"[!] 장치 끄기 실패 (시도 {attempt + 1}/3)")
-                    
-            except Exception as e:
-                print(f"[!] 장치 끄기 시도 {attempt + 1}/3 중 오류: {e}")
-            
-            # 재시도 전 대기
-            if attempt < 2:
-                time.sleep(0.5)
+                if attempt < 2:
+                    time.sleep(delay)
+                    delay *= 2
+            logger.warning(f"장치 끄기 실패: {device_list}")
+        except Exception as e:
+            logger.warning(f"장치 끄기 중 오류: {e}")
         
         # 모든 시도 실패 시 최후 수단으로 모든 장치 끄기
-        print("[!] 모든 시도 실패, 최후 수단으로 모든 장치 끄기 시도...")
+        logger.warning("모든 시도 실패, 최후 수단으로 모든 장치 끄기 시도...")
         try:
             success = self.broadcast_manager.turn_off_all_devices()
             if success:
-                print("[*] 모든 장치 끄기 성공")
+                logger.info("모든 장치 끄기 성공")
                 return True
             else:
-                print("[!] 모든 장치 끄기 실패")
+                logger.warning("모든 장치 끄기 실패")
                 return False
         except Exception as e:
-            print(f"[!] 모든 장치 끄기 중 오류: {e}")
+            logger.warning(f"모든 장치 끄기 중 오류: {e}")
             return False
     
     def _do_broadcast_text(self, text, target_devices, end_devices=None, language="ko"):
         """텍스트 방송 실행"""
         try:
-            print(f"[*] 텍스트 방송 시작: {text[:50]}{'...' if len(text) > 50 else ''}")
-            print(f"[*] 대상 장치: {target_devices}")
+            logger.info(f"텍스트 방송 시작: {text[:50]}{'...' if len(text) > 50 else ''}")
+            logger.info(f"대상 장치: {target_devices}")
 
             # end_devices가 지정되지 않으면 target_devices와 동일하게 설정
             if end_devices is None:
                 end_devices = target_devices
-                print(f"[*] 방송 완료 후 자동으로 끌 장치: {end_devices}")
+                logger.info(f"방송 완료 후 자동으로 끌 장치: {end_devices}")
+
+            # 1. TTS 오디오 생성 (상태 저장, 장치 활성화, 시작 신호음과 동시에 진행)
+            logger.info("1단계: TTS 오디오 생성 시작...")
+            tts_future = _BROADCAST_TTS_EXECUTOR.submit(self.generate_speech, text, language=language)
 
-            # 0. 방송 전 장치 상태 저장 (복원 기능이 활성화된 경우)
-            if self.restore_device_states_enabled:
-                print(f"[*] 0단계: 방송 전 장치 상태 저장...")
+            # 0. 방송 전 장치 상태 저장 (복원 기능이 활성화된 경우, 이전 방송에서 넘겨받은 장치면 기존 백업 유지)
+            if self._take_held_devices(target_devices):
+                logger.info("0단계: 이전 방송의 장치 상태를 이어받아 저장 생략")
+            elif self.restore_device_states_enabled:
+                logger.info("0단계: 방송 전 장치 상태 저장...")
                 self.save_device_states(target_devices)
-                print(f"[*] 0단계: 장치 상태 저장 완료")
-
-            # 1. TTS 오디오 생성
-            print(f"[*] 1단계: TTS 오디오 생성...")
-            tts_audio_path = self.generate_speech(text, language=language)
-            if not tts_audio_path:
-                logger.error("TTS 오디오 생성 실패")
-                return False
-            print(f"[*] 1단계: TTS 오디오 생성 완료: {tts_audio_path}")
+                logger.info("0단계: 장치 상태 저장 완료")
 
             # 2. 대상 장치 활성화
-            print(f"[*] 2단계: 대상 장치 활성화 시작...")
+            logger.info("2단계: 대상 장치 활성화 시작...")
             success = self.control_multiple_devices(target_devices, 1)
             if not success:
                 logger.error("장치 활성화 실패")
+                tts_future.cancel()
                 return False
-            print(f"[*] 2단계: 대상 장치 활성화 완료")
+            logger.info("2단계: 대상 장치 활성화 완료")
 
             # 3. 시작 신호음 재생
-            print(f"[*] 3단계: 시작 신호음 재생...")
+            logger.info("3단계: 시작 신호음 재생...")
             if self.play_start_signal():
                 # 시작 신호음 재생 완료 대기
-                while not self._check_playback_finished():
-                    time.sleep(0.1)
+                self._wait_for_playback(timeout=30)
                 self.stop_audio()
-                print(f"[*] 3단계: 시작 신호음 재생 완료")
+                logger.info("3단계: 시작 신호음 재생 완료")
             else:
-                print(f"[*] 3단계: 시작 신호음 재생 건너뜀")
+                logger.info("3단계: 시작 신호음 재생 건너뜀")
+
+            # TTS 생성 완료 대기 (대부분 이미 끝나 있음)
+            tts_audio_path = tts_future.result()
+            if not tts_audio_path:
+                logger.error("TTS 오디오 생성 실패")
+                # 장치는 이미 켜져 있으므로 정상 종료와 같이 복원 (방송 전부터 켜져 있던 장치는 유지)
+                if self.restore_device_states_enabled:
+                    logger.info("TTS 생성 실패로 인한 장치 상태 복원 시작...")
+                    self.restore_device_states(target_devices)
+                else:
+                    logger.info(f"TTS 생성 실패로 인한 장치 끄기 시작: {end_devices}")
+                    self._force_turn_off_devices(end_devices)
+                return False
+            logger.info(f"1단계: TTS 오디오 생성 완료: {tts_audio_path}")
+
+            # 대기 중인 다른 텍스트 방송은 재생하는 동안 일괄 합성
+            self.preview_executor.submit(self._prefetch_queued_speech, language)
 
             # 4. TTS 오디오 재생
-            print(f"[*] 4단계: TTS 오디오 재생 시작...")
+            logger.info("4단계: TTS 오디오 재생 시작...")
             success = self.play_audio(str(tts_audio_path))
             if not success:
                 logger.error("TTS 오디오 재생 실패")
-                print(f"[*] 재생 실패로 인한 장치 끄기 시작: {end_devices}")
+                logger.info(f"재생 실패로 인한 장치 끄기 시작: {end_devices}")
                 self._force_turn_off_devices(end_devices)
                 return False
-            print(f"[*] 4단계: TTS 오디오 재생 시작 완료")
+            logger.info("4단계: TTS 오디오 재생 시작 완료")
 
             # 5. 재생 완료 대기
-            print(f"[*] 5단계: 재생 완료 대기 중...")
-            while not self._check_playback_finished():
-                time.sleep(0.5)
+            logger.info("5단계: 재생 완료 대기 중...")
+            self._wait_for_playback(timeout=(self.current_broadcast_duration or 30) + 2.0)
 
             # 6. 재생 중지
-            print(f"[*] 6단계: TTS 오디오 재생 중지...")
+            logger.info("6단계: TTS 오디오 재생 중지...")
             self.stop_audio()
-            print("[*] 6단계: TTS 오디오 재생 중지 완료")
+            logger.info("6단계: TTS 오디오 재생 중지 완료")
 
             # 7. 끝 신호음 재생
-            print(f"[*] 7단계: 끝 신호음 재생...")
+            logger.info("7단계: 끝 신호음 재생...")
             if self.play_end_signal():
                 # 끝 신호음 재생 완료 대기
-                while not self._check_playback_finished():
-                    time.sleep(0.1)
+                self._wait_for_playback(timeout=30)
                 self.stop_audio()
-                print(f"[*] 7단계: 끝 신호음 재생 완료")
+                logger.info("7단계: 끝 신호음 재생 완료")
             else:
-                print(f"[*] 7단계: 끝 신호음 재생 건너뜀")
+                logger.info("7단계: 끝 신호음 재생 건너뜀")
 
             # 8. 종료 후 대기
-            print(f"[*] 8단계: 종료 후 대기 (0.5초)...")
+            logger.info("8단계: 종료 후 대기 (0.5초)...")
             time.sleep(0.5)
 
-            # 9. 장치 상태 처리
-            if self.restore_device_states_enabled:
+            # 9. 장치 상태 처리 (다음 방송이 같은 장치를 쓰면 켜 둔 채로 넘김)
+            if self._hold_devices_for_next_job(target_devices, end_devices):
+                logger.info("9단계: 다음 방송이 같은 장치를 사용하여 장치 상태 유지")
+            elif self.restore_device_states_enabled:
                 # 9a. 저장된 상태로 복원
-                print(f"[*] 9단계: 장치 상태 복원 시작...")
+                logger.info("9단계: 장치 상태 복원 시작...")
                 self.restore_device_states(target_devices)
-                print(f"[*] 9단계: 장치 상태 복원 완료")
+                logger.info("9단계: 장치 상태 복원 완료")
             else:
                 # 9b. 기존 방식: 종료 장치 비활성화
                 if end_devices:
-                    print(f"[*] 9단계: 방송 완료 - 장치 끄기 시작: {end_devices}")
+                    logger.info(f"9단계: 방송 완료 - 장치 끄기 시작: {end_devices}")
                     success = self._force_turn_off_devices(end_devices)
                     if success:
-                        print(f"[*] 9단계: 장치 끄기 완료: {end_devices}")
+                        logger.info(f"9단계: 장치 끄기 완료: {end_devices}")
                     else:
-                        print(f"[!] 9단계: 장치 끄기 실패: {end_devices}")
+                        logger.warning(f"9단계: 장치 끄기 실패: {end_devices}")
 
-            print("[*] 텍스트 방송 완료")
+            logger.info("텍스트 방송 완료")
             return True
 
         except Exception as e:
             logger.exception("텍스트 방송 실행 중 오류")
-            print(f"[!] 방송 실행 중 예외 발생: {e}")
+            logger.warning(f"방송 실행 중 예외 발생: {e}")
             try:
                 self.stop_audio()
                 if self.restore_device_states_enabled:
                     # 예외 발생 시에도 상태 복원 시도
-                    print(f"[*] 예외 발생으로 인한 장치 상태 복원 시도...")
+                    logger.info("예외 발생으로 인한 장치 상태 복원 시도...")
                     self.restore_device_states(target_devices)
                 elif end_devices:
-                    print(f"[*] 예외 발생으로 인한 장치 끄기: {end_devices}")
+                    logger.info(f"예외 발생으로 인한 장치 끄기: {end_devices}")
                     self._force_turn_off_devices(end_devices)
             except Exception as cleanup_error:
-                print(f"[!] 정리 작업 중 오류: {cleanup_error}")
+                logger.warning(f"정리 작업 중 오류: {cleanup_error}")
             return False
     
+    def shutdown(self, timeout=5.0):
+        """
+        방송 워커 종료 (재생 중지 후 워커 스레드 대기)
+        
+        진행 중인 방송이 있을 때만 장치를 끄며, 그렇지 않으면 장치 상태는 그대로 둡니다.
+        
+        Parameters:
+        -----------
+        timeout : float
+            워커 스레드 종료 대기 시간 (초)
+        """
+        with self._jobs_cv:
+            if self._shutting_down:
+                return
+            self._shutting_down = True
+            broadcasting = self._current_job is not None
+            self._jobs_cv.notify_all()
+        
+        if broadcasting:
+            self.stop_broadcast()
+        else:
+            self.stop_audio()
+        self.broadcast_worker_thread.join(timeout)
+        self._tts_cleanup_stop.set()
+        self._vlc_io.shutdown(wait=False, cancel_futures=True)
+        # 방송 장비와의 지속 연결 종료
+        self.broadcast_manager.network_manager.close()
+        logger.info("BroadcastController 종료 완료")
+    
     def stop_broadcast(self):
         """현재 실행 중인 방송 중지"""
         try:
-            print("[*] 방송 강제 종료 시작...")
+            logger.info("방송 강제 종료 시작...")
             
             # 1. 오디오 재생 중지
-            print("[*] 1단계: 오디오 재생 중지...")
+            logger.info("1단계: 오디오 재생 중지...")
             self.stop_audio()
-            print("[*] 1단계: 오디오 재생 중지 완료")
+            logger.info("1단계: 오디오 재생 중지 완료")
             
             # 2. 방송 큐 비우기
-            print("[*] 2단계: 방송 큐 정리...")
-            queue_size = self.broadcast_queue.qsize()
-            while not self.broadcast_queue.empty():
-                try:
-                    self.broadcast_queue.get_nowait()
-                    self.broadcast_queue.task_done()
-                except queue.Empty:
-                    break
-            print(f"[*] 2단계: 방송 큐 정리 완료 ({queue_size}개 작업 제거)")
-            
-            # 3. 방송 작업 목록 비우기
-            print("[*] 3단계: 방송 작업 목록 정리...")
-            jobs_count = len(self.broadcast_jobs)
-            self.broadcast_jobs.clear()
-            print(f"[*] 3단계: 방송 작업 목록 정리 완료 ({jobs_count}개 작업 제거)")
-            
-            # 4. BroadcastManager를 통해 모든 장치 끄기
-            print("[*] 4단계: 모든 장치 끄기...")
-            success = self.broadcast_manager.turn_off_all_devices()
-            if success:
-                print("[*] 4단계: BroadcastManager를 통한 모든 장치 끄기 완료")
-                
-                # 상태 확인
-                time.sleep(0.2)
-                active_rooms = self.broadcast_manager.get_active_rooms()
-                if active_rooms:
-                    print(f"[!] 경고: 여전히 활성화된 방이 있습니다: {sorted(active_rooms)}")
-                    # 추가 시도
-                    print("[*] 추가 시도로 모든 장치 끄기...")
-                    retry_success = self.broadcast_manager.turn_off_all_devices()
-                    if retry_success:
-                        print("[*] 추가 시도 성공")
-                    else:
-                        print("[!] 추가 시도 실패")
-                else:
-                    print("[*] 모든 장치가 성공적으로 꺼졌습니다.")
+            logger.info("2단계: 방송 큐 정리...")
+            with self._jobs_cv:
+                queue_size = len(self._jobs)
+                self._jobs.clear()
+                self._jobs_by_id.clear()
+                self._pending_duration_sum = 0.0
+                self._held_mask = 0
+                self._held_devices = None
+                self._queue_version += 1
+            logger.info(f"2단계: 방송 큐 정리 완료 ({queue_size}개 작업 제거)")
+            
+            # 3. BroadcastManager를 통해 모든 장치 끄기
+            logger.info("3단계: 모든 장치 끄기...")
+            if self._ensure_all_off():
+                logger.info("3단계: 모든 장치가 성공적으로 꺼졌습니다.")
             else:
-                print("[!] 4단계: BroadcastManager를 통한 장치 끄기 실패")
-                # 최후 수단으로 다시 시도
-                print("[*] 최후 수단으로 다시 시도...")
-                final_success = self.broadcast_manager.turn_off_all_devices()
-                if final_success:
-                    print("[*] 최후 수단 성공")
-                else:
-                    print("[!] 최후 수단 실패")
+                logger.warning("3단계: 모든 장치 끄기 실패 - 활성화된 방: %s", sorted(self.broadcast_manager.get_active_rooms()))
             
-            # 5. 현재 방송 상태 초기화
-            print("[*] 5단계: 방송 상태 초기화...")
+            # 4. 현재 방송 상태 초기화
+            logger.info("4단계: 방송 상태 초기화...")
             self.current_broadcast_start_time = None
+            self._current_broadcast_started = None
             self.current_broadcast_duration = None
-            print("[*] 5단계: 방송 상태 초기화 완료")
+            logger.info("4단계: 방송 상태 초기화 완료")
             
-            print("[*] 방송 강제 종료 완료")
             logger.info("방송 강제 종료 완료")
             return True
             
-        except Exception as e:
-            print(f"[!] 방송 중지 중 오류: {e}")
-            logger.exception(f"방송 중지 중 오류: {e}")
+        except Exception:
+            logger.exception("방송 중지 중 오류")
             
             # 오류 발생 시에도 장치 끄기 시도
             try:
-                print("[*] 오류 발생으로 인한 장치 끄기 시도...")
+                logger.info("오류 발생으로 인한 장치 끄기 시도...")
                 self.broadcast_manager.turn_off_all_devices()
             except Exception as cleanup_error:
-                print(f"[!] 정리 작업 중 오류: {cleanup_error}")
+                logger.warning(f"정리 작업 중 오류: {cleanup_error}")
             
             return False
 
+    def _ensure_all_off(self, max_attempts=3):
+        """
+        모든 장치 끄기 명령 전송 (전송이 성공하면 바로 반환, 실패 시 재시도)
+        
+        Parameters:
+        -----------
+        max_attempts : int
+            최대 전송 시도 횟수
+            
+        Returns:
+        --------
+        bool
+            모든 장치가 꺼졌는지 여부
+        """
+        for attempt in range(max_attempts):
+            if self.broadcast_manager.turn_off_all_devices():
+                return True
+            logger.warning(f"모든 장치 끄기 재시도 ({attempt + 1}/{max_attempts})")
+        return False
+    
     def _broadcast_worker(self):
-        """방송 작업 처리 워커 스레드"""
+        """방송 작업 처리 워커 스레드 (shutdown 호출 시 종료)"""
         while True:
-            job = self.broadcast_queue.get()
+            job = self._next_job()
+            if job is None:
+                if self._held_devices is not None:
+                    self._release_held_devices()
+                logger.info("방송 워커 종료")
+                break
+            # 장치를 넘겨받을 작업이 취소되었으면 켜 둔 장치를 먼저 정리
+            if self._held_devices is not None and self._held_devices[0] is not job:
+                self._release_held_devices()
             try:
                 # 현재 방송 시작 시간과 예상 길이 기록
                 self.current_broadcast_start_time = datetime.datetime.now()
+                self._current_broadcast_started = time.monotonic()
                 self.current_broadcast_duration = job.estimated_duration
                 
                 if job.job_type == 'audio':
@@ -1050,34 +1802,45 @@ class BroadcastController:
                 elif job.job_type == 'text':
                     self._do_broadcast_text(**job.params)
                 
-                # 작업 완료 후 목록에서 제거
-                if job in self.broadcast_jobs:
-                    self.broadcast_jobs.remove(job)
-                
                 # 현재 방송 상태 초기화
                 self.current_broadcast_start_time = None
+                self._current_broadcast_started = None
                 self.current_broadcast_duration = None
                 
             except Exception as e:
                 logger.error(f"방송 작업 처리 중 오류: {e}")
-                if job in self.broadcast_jobs:
-                    self.broadcast_jobs.remove(job)
             finally:
-                self.broadcast_queue.task_done()
+                # 이 작업이 넘겨받기 전에 끝났으면 (파일 없음, 예외 등) 켜 둔 장치 정리
+                if self._held_devices is not None and self._held_devices[0] is job:
+                    self._release_held_devices()
+                with self._jobs_cv:
+                    self._current_job = None
+                    self._queue_version += 1
 
     def get_queue_status(self):
-        """큐 현황 정보 반환"""
+        """큐 현황 정보 반환 (대기열이 바뀌지 않았으면 0.2초 동안 캐시된 결과 반환)"""
         try:
+            with self._jobs_cv:
+                version = self._queue_version
+                cached_version, cached_at, cached = self._cached_status
+                if cached_version == version and time.monotonic() - cached_at < STATUS_CACHE_TTL:
+                    return cached
+                jobs = list(self._jobs)
+            
             current_status = {
                 "is_playing": self.is_playing,
                 "current_broadcast": None,
-                "queue_size": len(self.broadcast_jobs),
+                "queue_size": len(jobs),
                 "queue_items": []
             }
             
-            # 현재 재생 중인 방송 정보
-            if self.is_playing and self.current_broadcast_start_time and self.current_broadcast_duration:
-                elapsed_time = (datetime.datetime.now() - self.current_broadcast_start_time).total_seconds()
+            now = datetime.datetime.now()
+            remaining_time = 0.0
+            
+            # 현재 재생 중인 방송 정보 (경과 시간은 monotonic 시계로 계산)
+            started = self._current_broadcast_started
+            if self.is_playing and started is not None and self.current_broadcast_start_time and self.current_broadcast_duration:
+                elapsed_time = time.monotonic() - started
                 remaining_time = max(0, self.current_broadcast_duration - elapsed_time)
                 
                 current_status["current_broadcast"] = {
@@ -1088,9 +1851,11 @@ class BroadcastController:
                     "progress_percent": round((elapsed_time / self.current_broadcast_duration) * 100, 1) if self.current_broadcast_duration > 0 else 0
                 }
             
-            # 큐에 있는 작업들 정보
-            for i, job in enumerate(self.broadcast_jobs):
-                estimated_start_time = self._calculate_estimated_start_time(i + 1)
+            # 큐에 있는 작업들 정보 (앞선 작업 길이를 누적하여 예상 시작시간 계산)
+            cumulative_sec = remaining_time
+            for i, job in enumerate(jobs):
+                estimated_start_time = (now + datetime.timedelta(seconds=cumulative_sec)).strftime("%H:%M:%S")
+                cumulative_sec += job.estimated_duration
                 
                 job_info = {
                     "position": i + 1,
@@ -1112,6 +1877,7 @@ class BroadcastController:
                 
                 current_status["queue_items"].append(job_info)
             
+            self._cached_status = (version, time.monotonic(), current_status)
             return current_status
             
         except Exception as e:
@@ -1160,51 +1926,112 @@ class BroadcastController:
         
         print("="*60 + "\n")
 
+    def reload_signals(self):
+        """시작/끝 신호음 파일 존재 여부 다시 확인 (신호음 파일을 바꾼 뒤 호출)"""
+        self._start_signal_exists = self.start_signal_path.exists()
+        self._end_signal_exists = self.end_signal_path.exists()
+        self._signals_checked_at = time.monotonic()
+        self._signal_segments.clear()
+    
+    def _refresh_signals(self):
+        """마지막 확인 후 SIGNAL_RECHECK_INTERVAL이 지났으면 신호음 파일 존재 여부 재확인"""
+        if time.monotonic() - self._signals_checked_at > SIGNAL_RECHECK_INTERVAL:
+            self.reload_signals()
+    
+    def _signal_segment(self, signal_path, exists):
+        """
+        디코딩된 신호음 AudioSegment 반환 (파일이 바뀌기 전까지 한 번만 디코딩)
+        
+        Parameters:
+        -----------
+        signal_path : Path
+            신호음 파일 경로
+        exists : bool
+            신호음 파일 존재 여부 (없으면 빈 AudioSegment 반환)
+        """
+        AudioSegment = _audio_segment_class()
+        if not exists:
+            return AudioSegment.empty()
+        key = str(signal_path)
+        mtime_ns = os.stat(key).st_mtime_ns
+        cached = self._signal_segments.get(key)
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, AudioSegment.from_file(key))
+            self._signal_segments[key] = cached
+        return cached[1]
+    
     def play_start_signal(self):
         """방송 시작 신호음 재생"""
-        if self.start_signal_path.exists():
-            print(f"[*] 방송 시작 신호음 재생: {self.start_signal_path}")
+        self._refresh_signals()
+        if self._start_signal_exists:
+            logger.info(f"방송 시작 신호음 재생: {self.start_signal_path}")
             return self.play_audio(str(self.start_signal_path))
         else:
-            print(f"[!] 시작 신호음 파일이 없습니다: {self.start_signal_path}")
+            logger.warning(f"시작 신호음 파일이 없습니다: {self.start_signal_path}")
             return False
     
     def play_end_signal(self):
         """방송 끝 신호음 재생"""
-        if self.end_signal_path.exists():
-            print(f"[*] 방송 끝 신호음 재생: {self.end_signal_path}")
+        self._refresh_signals()
+        if self._end_signal_exists:
+            logger.info(f"방송 끝 신호음 재생: {self.end_signal_path}")
             return self.play_audio(str(self.end_signal_path))
         else:
-            print(f"[!] 끝 신호음 파일이 없습니다: {self.end_signal_path}")
+            logger.warning(f"끝 신호음 파일이 없습니다: {self.end_signal_path}")
             return False
 
     def create_preview(self, job_type, params):
-        """프리뷰 생성 (병렬 처리)"""
-        # 스레드 풀에서 프리뷰 생성 실행
-        future = self.preview_executor.submit(self._create_preview_sync, job_type, params)
-        return future.result()  # 완료될 때까지 기다림
+        """프리뷰 생성 (호출한 스레드에서 바로 실행)"""
+        return self._create_preview_sync(job_type, params)
     
     async def create_preview_async(self, job_type, params):
         """프리뷰 생성 (비동기)"""
-        # 별도 스레드에서 프리뷰 생성 실행
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self._create_preview_sync, job_type, params)
+        # 프리뷰 전용 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.preview_executor, self._create_preview_sync, job_type, params)
         return result
     
+    def save_upload_stream(self, fileobj, dest_path):
+        """
+        업로드 파일 스트림을 풀 버퍼로 나누어 저장
+        
+        Parameters:
+        -----------
+        fileobj : file-like
+            업로드 파일 객체 (UploadFile.file)
+        dest_path : str 또는 Path
+            저장할 경로
+            
+        Returns:
+        --------
+        int
+            저장된 바이트 수
+        """
+        buf = acquire_buf()
+        view = memoryview(buf)
+        total = 0
+        try:
+            with open(dest_path, "wb") as f:
+                while True:
+                    n = fileobj.readinto(buf)
+                    if not n:
+                        break
+                    f.write(view[:n])
+                    total += n
+        finally:
+            view.release()
+            release_buf(buf)
+        return total
+    
     def _create_preview_sync(self, job_type, params):
         """프리뷰 생성 (동기)"""
         try:
-            import datetime
-            import hashlib
-            
-            print(f"[프리뷰] 프리뷰 생성 시작 - job_type: {job_type}, params: {params}")
+            logger.info("[프리뷰] 프리뷰 생성 시작 - job_type: %s, params: %s", job_type, params)
             
             # 프리뷰 ID 생성
-            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-            params_hash = hashlib.md5(str(params).encode()).hexdigest()[:8]
-            preview_id = f"{timestamp}_{params_hash}"
+            preview_id = f"{int(time.time()):x}_{secrets.token_hex(4)}"
             
-            print(f"[프리뷰] 프리뷰 ID 생성: {preview_id}")
+            logger.info(f"[프리뷰] 프리뷰 ID 생성: {preview_id}")
             
             preview_info = {
                 "preview_id": preview_id,
@@ -1215,19 +2042,19 @@ class BroadcastController:
             }
             
             # 프리뷰 오디오 생성
-            print(f"[프리뷰] 프리뷰 오디오 생성 시작...")
+            logger.info("[프리뷰] 프리뷰 오디오 생성 시작...")
             if job_type == 'audio':
                 # 오디오 파일의 경우 시작 신호음 + 원본 오디오 + 끝 신호음으로 프리뷰 생성
-                print(f"[프리뷰] 오디오 프리뷰 생성...")
+                logger.info("[프리뷰] 오디오 프리뷰 생성...")
                 preview_path = self._create_audio_preview(preview_id, params)
             elif job_type == 'text':
                 # TTS의 경우 TTS 생성 후 시작 신호음 + TTS 오디오 + 끝 신호음으로 프리뷰 생성
-                print(f"[프리뷰] 텍스트 프리뷰 생성...")
+                logger.info("[프리뷰] 텍스트 프리뷰 생성...")
                 preview_path = self._create_text_preview(preview_id, params)
             else:
                 raise ValueError(f"지원하지 않는 작업 타입: {job_type}")
             
-            print(f"[프리뷰] 프리뷰 오디오 생성 결과: {preview_path}")
+            logger.info(f"[프리뷰] 프리뷰 오디오 생성 결과: {preview_path}")
             
             if preview_path:
                 preview_info["preview_path"] = preview_path
@@ -1235,26 +2062,29 @@ class BroadcastController:
                 preview_info["approval_endpoint"] = f"/api/broadcast/approve/{preview_id}"
                 
                 # 예상 길이 계산
-                print(f"[프리뷰] 예상 길이 계산...")
+                logger.info("[프리뷰] 예상 길이 계산...")
                 job = BroadcastJob(job_type, params)
                 preview_info["estimated_duration"] = job.estimated_duration
-                print(f"[프리뷰] 예상 길이: {job.estimated_duration}초")
+                logger.info(f"[프리뷰] 예상 길이: {job.estimated_duration}초")
                 
-                # 실제 프리뷰 파일 길이 측정 (ffprobe 사용)
+                # 실제 프리뷰 파일 길이 측정 (ffprobe 사용, 파일 정보는 한 번만 조회해 보관)
                 try:
-                    actual_duration = self._get_audio_duration_with_ffprobe(preview_path)
+                    st = os.stat(preview_path)
+                    preview_info["file_size"] = st.st_size
+                    preview_info["file_mtime_ns"] = st.st_mtime_ns
+                    actual_duration = self._get_audio_duration_with_ffprobe(preview_path, st)
                     if actual_duration > 0:
                         preview_info["actual_duration"] = actual_duration
-                        print(f"[프리뷰] 실제 프리뷰 길이: {actual_duration:.2f}초")
+                        logger.info(f"[프리뷰] 실제 프리뷰 길이: {actual_duration:.2f}초")
                     else:
                         preview_info["actual_duration"] = None
-                        print(f"[프리뷰] 실제 길이 측정 실패")
+                        logger.warning("[프리뷰] 실제 길이 측정 실패")
                 except Exception as e:
                     preview_info["actual_duration"] = None
-                    print(f"[프리뷰] 길이 측정 중 오류: {e}")
+                    logger.warning(f"[프리뷰] 길이 측정 중 오류: {e}")
                 
                 # 방송 큐 상태 확인 및 예상 시간 계산
-                print(f"[프리뷰] 큐 상태 확인 및 예상 시간 계산...")
+                logger.info("[프리뷰] 큐 상태 확인 및 예상 시간 계산...")
                 queue_status = self.get_queue_status()
                 current_time = datetime.datetime.now()
                 
@@ -1280,21 +2110,20 @@ class BroadcastController:
                             estimated_end_time = estimated_start_time + datetime.timedelta(seconds=preview_info["estimated_duration"])
                         preview_info["estimated_end_time"] = estimated_end_time.isoformat()
                         
-                        print(f"[프리뷰] 예상 시작 시간: {estimated_start_time.strftime('%H:%M:%S')}")
-                        print(f"[프리뷰] 예상 종료 시간: {estimated_end_time.strftime('%H:%M:%S')}")
+                        logger.info(f"[프리뷰] 예상 시작 시간: {estimated_start_time.strftime('%H:%M:%S')}")
+                        logger.info(f"[프리뷰] 예상 종료 시간: {estimated_end_time.strftime('%H:%M:%S')}")
                     else:
                         preview_info["estimated_start_time"] = None
                         preview_info["estimated_end_time"] = None
                         
                 else:
-                    # 대기 중인 방송이 있는지 확인
-                    if queue_status["queue_items"]:
+                    # 대기 중인 방송이 있는지 확인 (총 길이는 큐에서 누적 관리)
+                    with self._jobs_cv:
+                        queued_count = len(self._jobs)
+                        total_waiting_duration = self._pending_duration_sum
+                    
+                    if queued_count:
                         preview_info["queue_status"] = "queued"
-                        # 대기 중인 방송들의 총 길이 계산
-                        total_waiting_duration = sum(
-                            broadcast.get("estimated_duration", 0) 
-                            for broadcast in queue_status["queue_items"]
-                        )
                         
                         # 예상 시작 시간 = 현재 시간 + 대기 중인 방송들의 총 길이
                         estimated_start_time = current_time + datetime.timedelta(seconds=total_waiting_duration)
@@ -1307,9 +2136,9 @@ class BroadcastController:
                             estimated_end_time = estimated_start_time + datetime.timedelta(seconds=preview_info["estimated_duration"])
                         preview_info["estimated_end_time"] = estimated_end_time.isoformat()
                         
-                        print(f"[프리뷰] 대기 중인 방송 수: {len(queue_status['queue_items'])}")
-                        print(f"[프리뷰] 예상 시작 시간: {estimated_start_time.strftime('%H:%M:%S')}")
-                        print(f"[프리뷰] 예상 종료 시간: {estimated_end_time.strftime('%H:%M:%S')}")
+                        logger.info(f"[프리뷰] 대기 중인 방송 수: {queued_count}")
+                        logger.info(f"[프리뷰] 예상 시작 시간: {estimated_start_time.strftime('%H:%M:%S')}")
+                        logger.info(f"[프리뷰] 예상 종료 시간: {estimated_end_time.strftime('%H:%M:%S')}")
                     else:
                         # 즉시 시작 가능
                         preview_info["queue_status"] = "ready"
@@ -1322,32 +2151,25 @@ class BroadcastController:
                             estimated_end_time = current_time + datetime.timedelta(seconds=preview_info["estimated_duration"])
                         preview_info["estimated_end_time"] = estimated_end_time.isoformat()
                         
-                        print(f"[프리뷰] 즉시 시작 가능")
-                        print(f"[프리뷰] 예상 종료 시간: {estimated_end_time.strftime('%H:%M:%S')}")
+                        logger.info("[프리뷰] 즉시 시작 가능")
+                        logger.info(f"[프리뷰] 예상 종료 시간: {estimated_end_time.strftime('%H:%M:%S')}")
                 
                 # 대기 중인 프리뷰에 추가
-                self.pending_previews[preview_id] = preview_info
+                self._store_preview(preview_id, preview_info)
                 
-                print(f"[*] 프리뷰 생성 완료: {preview_id}")
+                logger.info(f"프리뷰 생성 완료: {preview_id}")
                 return preview_info
             else:
-                print(f"[프리뷰] 프리뷰 오디오 생성 실패")
+                logger.warning("[프리뷰] 프리뷰 오디오 생성 실패")
                 raise Exception("프리뷰 오디오 생성 실패")
                 
         except Exception as e:
-            print(f"[프리뷰] 프리뷰 생성 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            logger.error(f"프리뷰 생성 중 오류: {e}")
+            logger.exception(f"[프리뷰] 프리뷰 생성 중 오류: {e}")
             return None
     
     def _create_audio_preview(self, preview_id, params):
         """오디오 방송 프리뷰 생성"""
         try:
-            from pydub import AudioSegment
-            import shutil
-            from ..core.config import config
-            
             audio_path = params.get('audio_path')
             use_original = params.get('use_original', False)  # 원본 사용 플래그
             original_preview_id = params.get('original_preview_id', '')  # 원본 프리뷰 ID
@@ -1355,137 +2177,296 @@ class BroadcastController:
             if not audio_path or not Path(audio_path).exists():
                 raise Exception(f"오디오 파일을 찾을 수 없음: {audio_path}")
             
-            print(f"[프리뷰] 오디오 프리뷰 생성 시작 (use_original={use_original})")
+            logger.info(f"[프리뷰] 오디오 프리뷰 생성 시작 (use_original={use_original})")
             logger.info(f"[프리뷰] use_original 플래그 타입: {type(use_original)}, 값: {use_original}")
             
             # 원본 사용 플래그가 있는 경우 원본 파일을 그대로 프리뷰로 사용
             if use_original:
-                print(f"[프리뷰] 원본 사용 플래그 감지: 원본 파일을 그대로 프리뷰로 사용")
+                logger.info("[프리뷰] 원본 사용 플래그 감지: 원본 파일을 그대로 프리뷰로 사용")
                 logger.info(f"[프리뷰] 원본 사용 플래그가 True입니다. 정규화 및 시작음/끝음 추가를 건너뜁니다.")
                 # 원본 파일을 프리뷰 디렉토리로 복사
                 preview_path = self.preview_dir / f"{preview_id}.mp3"
-                print(f"[프리뷰] 프리뷰 파일 저장 경로: {preview_path}")
-                print(f"[프리뷰] 프리뷰 파일 절대 경로: {preview_path.absolute()}")
-                shutil.copy2(audio_path, preview_path)
+                logger.info(f"[프리뷰] 프리뷰 파일 저장 경로: {preview_path}")
+                logger.info(f"[프리뷰] 프리뷰 파일 절대 경로: {preview_path.absolute()}")
+                self._link_or_copy(audio_path, preview_path)
                 
-                print(f"[*] 원본 파일을 프리뷰로 복사 완료: {preview_path}")
+                logger.info(f"원본 파일을 프리뷰로 복사 완료: {preview_path}")
                 logger.info(f"[프리뷰] 원본 파일 복사 완료: {audio_path} -> {preview_path}")
                 return str(preview_path)
             else:
                 logger.info(f"[프리뷰] use_original 플래그가 False입니다. 일반 처리로 진행합니다.")
             
             # 일반 파일 처리 (기존 로직)
-            # config에서 ffmpeg 경로 가져오기
-            ffmpeg_paths = config.get_ffmpeg_paths()
-            ffmpeg_path = Path(ffmpeg_paths["ffmpeg_path"])
-            ffprobe_path = Path(ffmpeg_paths["ffprobe_path"])
-            
-            if not ffmpeg_paths["ffmpeg_exists"] or not ffmpeg_paths["ffprobe_exists"]:
-                print(f"[!] ffmpeg/ffprobe 파일을 찾을 수 없습니다.")
-                print(f"[!] ffmpeg 경로: {ffmpeg_path}")
-                print(f"[!] ffprobe 경로: {ffprobe_path}")
+            ffmpeg_path = self._ffmpeg_path
+            
+            if not self._ffmpeg_ok:
+                logger.warning("ffmpeg/ffprobe 파일을 찾을 수 없습니다.")
+                logger.warning(f"ffmpeg 경로: {self._ffmpeg_path}")
+                logger.warning(f"ffprobe 경로: {self._ffprobe_path}")
                 # 프리뷰 없이 원본 파일 경로만 반환
                 return str(audio_path)
             
-            # pydub에 ffmpeg 경로 설정
-            import os
-            os.environ['PATH'] = str(ffmpeg_path.parent) + os.pathsep + os.environ.get('PATH', '')
-            
             try:
-                # 오디오 정규화 적용
-                normalized_audio_path = self._normalize_audio_for_preview(audio_path, preview_id)
-                
-                # 정규화된 오디오 파일 로드
-                main_audio = AudioSegment.from_file(normalized_audio_path)
-                
-                # 시작 신호음 로드
-                start_audio = AudioSegment.from_file(str(self.start_signal_path)) if self.start_signal_path.exists() else AudioSegment.empty()
-                
-                # 끝 신호음 로드
-                end_audio = AudioSegment.from_file(str(self.end_signal_path)) if self.end_signal_path.exists() else AudioSegment.empty()
-                
                 # 프리뷰 오디오 조합: 시작 신호음 + 정규화된 메인 오디오 + 끝 신호음
-                preview_audio = start_audio + main_audio + end_audio
+                self._refresh_signals()
+                input_paths = []
+                if self._start_signal_exists:
+                    input_paths.append(str(self.start_signal_path))
+                main_index = len(input_paths)
+                input_paths.append(str(audio_path))
+                if self._end_signal_exists:
+                    input_paths.append(str(self.end_signal_path))
+                
+                # 정규화가 필요하면 결합과 같은 ffmpeg 실행에서 loudnorm 적용
+                # (같은 파일을 동시에 분석하는 요청은 한 번만 분석)
+                st = os.stat(audio_path)
+                loudnorm_filter = self._run_single_flight(
+                    ("loudnorm", str(audio_path), st.st_mtime_ns, st.st_size),
+                    self._preview_loudnorm_filter, audio_path
+                )
+                input_filters = {main_index: loudnorm_filter} if loudnorm_filter else None
                 
-                # 프리뷰 파일 저장
+                # 프리뷰 파일 저장 (ffmpeg에서 바로 결합)
                 preview_path = self.preview_dir / f"{preview_id}.mp3"
-                print(f"[프리뷰] 일반 처리 프리뷰 파일 저장 경로: {preview_path}")
-                preview_audio.export(str(preview_path), format="mp3")
+                logger.info(f"[프리뷰] 일반 처리 프리뷰 파일 저장 경로: {preview_path}")
+                if not self._concat_audio_with_ffmpeg(ffmpeg_path, input_paths, preview_path, input_filters):
+                    # 실패 시 정규화 파일을 따로 만든 뒤 결합 (그래도 실패하면 pydub 사용)
+                    logger.warning("[프리뷰] 단일 ffmpeg 처리 실패, 정규화 파일을 거쳐 다시 시도합니다.")
+                    normalized_audio_path = self._normalize_audio_for_preview(audio_path, preview_id)
+                    input_paths[main_index] = str(normalized_audio_path)
+                    try:
+                        if not self._concat_audio_with_ffmpeg(ffmpeg_path, input_paths, preview_path):
+                            logger.warning("[프리뷰] ffmpeg 결합 실패, pydub으로 다시 시도합니다.")
+                            AudioSegment = _audio_segment_class()
+                            preview_audio = AudioSegment.empty()
+                            for input_path in input_paths:
+                                preview_audio += AudioSegment.from_file(input_path)
+                            preview_audio.export(str(preview_path), format="mp3", **self._preview_export_kwargs())
+                    finally:
+                        # 임시 정규화 파일 정리
+                        if normalized_audio_path != audio_path and Path(normalized_audio_path).exists():
+                            Path(normalized_audio_path).unlink()
                 
                 # ffprobe로 파일 길이 확인
                 try:
                     file_size = preview_path.stat().st_size
-                    print(f"[프리뷰] 오디오 프리뷰 파일 생성 완료: {preview_path} (크기: {file_size:,} bytes)")
+                    logger.info(f"[프리뷰] 오디오 프리뷰 파일 생성 완료: {preview_path} (크기: {file_size:,} bytes)")
                     
                     # ffprobe로 정확한 길이 확인
                     duration = self._get_audio_duration_with_ffprobe(str(preview_path))
                     if duration > 0:
-                        print(f"[프리뷰] 오디오 프리뷰 길이 (ffprobe): {duration:.2f}초")
+                        logger.info(f"[프리뷰] 오디오 프리뷰 길이 (ffprobe): {duration:.2f}초")
                     else:
-                        # pydub으로 길이 확인 시도 (백업)
-                        try:
-                            audio_length = len(preview_audio) / 1000.0  # 밀리초를 초로 변환
-                            print(f"[프리뷰] 오디오 프리뷰 길이 (pydub): {audio_length:.2f}초")
-                        except Exception as e:
-                            print(f"[프리뷰] pydub 길이 확인 실패: {e}")
+                        logger.warning("[프리뷰] 오디오 프리뷰 길이 확인 실패")
                         
                 except Exception as e:
-                    print(f"[프리뷰] 파일 정보 확인 실패: {e}")
-                
-                # 임시 정규화 파일 정리
-                if normalized_audio_path != audio_path and Path(normalized_audio_path).exists():
-                    Path(normalized_audio_path).unlink()
+                    logger.warning(f"[프리뷰] 파일 정보 확인 실패: {e}")
                 
-                print(f"[*] 오디오 프리뷰 생성 (정규화 적용): {preview_path}")
+                logger.info(f"오디오 프리뷰 생성 (정규화 적용): {preview_path}")
                 return str(preview_path)
                 
             except Exception as e:
-                print(f"[!] 오디오 처리 중 오류: {e}")
+                logger.warning(f"오디오 처리 중 오류: {e}")
                 # 오류 발생 시 원본 파일을 복사하여 프리뷰로 사용
-                preview_path = self.preview_dir / f"{preview_id}.mp3"
-                shutil.copy2(audio_path, preview_path)
-                print(f"[*] 원본 파일을 프리뷰로 복사: {preview_path}")
+                preview_path = self._link_or_copy(audio_path, self.preview_dir / f"{preview_id}.mp3")
+                logger.info(f"원본 파일을 프리뷰로 복사: {preview_path}")
                 return str(preview_path)
             
         except Exception as e:
             logger.error(f"오디오 프리뷰 생성 중 오류: {e}")
             return None
     
-    def _normalize_audio_for_preview(self, audio_path: str, preview_id: str) -> str:
+    def _preview_encode_settings(self):
+        """설정된 프리뷰 품질의 인코딩 설정 반환 (알 수 없는 값이면 full)"""
+        return PREVIEW_ENCODE_SETTINGS.get(getattr(config, "preview_quality", "full"), PREVIEW_ENCODE_SETTINGS["full"])
+    
+    def _preview_encode_args(self):
+        """ffmpeg 출력 인코딩 인자 (비트레이트, 채널, 샘플레이트)"""
+        settings = self._preview_encode_settings()
+        return ["-b:a", settings["bitrate"], "-ac", str(settings["channels"]), "-ar", str(settings["sample_rate"])]
+    
+    def _preview_export_kwargs(self):
+        """pydub export 인자 (비트레이트, 채널, 샘플레이트)"""
+        settings = self._preview_encode_settings()
+        return {
+            "bitrate": settings["bitrate"],
+            "parameters": ["-ac", str(settings["channels"]), "-ar", str(settings["sample_rate"])]
+        }
+    
+    def _concat_audio_with_ffmpeg(self, ffmpeg_path, input_paths, output_path, input_filters=None) -> bool:
         """
-        프리뷰용 오디오 정규화 (고품질)
+        ffmpeg concat 필터로 여러 오디오 파일을 하나의 MP3로 결합
+        
+        Parameters:
+        -----------
+        ffmpeg_path : Path
+            ffmpeg 실행 파일 경로
+        input_paths : list
+            순서대로 결합할 오디오 파일 경로 목록
+        output_path : Path
+            저장할 MP3 파일 경로
+        input_filters : dict, optional
+            결합 전에 적용할 입력별 필터 (입력 순번 -> ffmpeg 필터 문자열)
+            
+        Returns:
+        --------
+        bool
+            결합 성공 여부
+        """
+        input_filters = input_filters or {}
+        cmd = [str(ffmpeg_path), "-y", "-v", "error"]
+        for input_path in input_paths:
+            cmd += ["-i", str(input_path)]
+        
+        graph = ""
+        streams = ""
+        for i in range(len(input_paths)):
+            if i in input_filters:
+                graph += f"[{i}:a]{input_filters[i]}[a{i}];"
+                streams += f"[a{i}]"
+            else:
+                streams += f"[{i}:a]"
+        cmd += [
+            "-filter_complex", f"{graph}{streams}concat=n={len(input_paths)}:v=0:a=1[out]",
+            "-map", "[out]",
+            "-c:a", "libmp3lame",
+            *self._preview_encode_args(),
+            # 여러 프리뷰가 동시에 만들어지므로 ffmpeg 하나가 모든 코어를 쓰지 않도록 제한
+            "-threads", "1",
+            "-filter_complex_threads", "1",
+            str(output_path)
+        ]
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
+        except OSError as e:
+            logger.warning(f"[프리뷰] ffmpeg 실행 실패: {e}")
+            return False
+        
+        if result.returncode != 0:
+            logger.warning(f"[프리뷰] ffmpeg 결합 오류: {result.stderr.strip()}")
+            return False
+        return Path(output_path).exists()
+    
+    def _preview_loudnorm_filter(self, audio_path: str) -> Optional[str]:
+        """
+        프리뷰 결합 시 메인 오디오에 적용할 loudnorm 필터 문자열 반환
+        
+        Parameters:
+        -----------
+        audio_path : str
+            분석할 오디오 파일 경로
+            
+        Returns:
+        --------
+        str or None
+            정규화가 필요하면 ffmpeg 필터 문자열, 불필요하거나 분석 실패 시 None
         """
-        print(f"[정규화] 프리뷰용 오디오 정규화 시도: {audio_path} (preview_id={preview_id})")
         try:
-            from ..utils.audio_normalizer import audio_normalizer
+            # 같은 파일(경로, 수정 시간, 크기)은 분석용 ffmpeg를 다시 실행하지 않음
+            st = os.stat(audio_path)
+            cache_key = (str(audio_path), st.st_mtime_ns, st.st_size)
+            if cache_key in self._loudnorm_cache:
+                return self._loudnorm_cache[cache_key]
+            
+            norm_info = audio_normalizer.get_normalization_info(audio_path)
+            if "error" in norm_info:
+                logger.warning(f"[정규화] 정규화 정보 분석 실패: {norm_info['error']}")
+                return None
             
-            # 정규화 전 볼륨 정보 확인
-            print(f"[정규화] 정규화 전 볼륨 분석 시작...")
-            before_stats = audio_normalizer.get_audio_stats(audio_path)
-            if "error" not in before_stats:
-                print(f"[정규화] 정규화 전 - 평균: {before_stats.get('mean_volume', 'N/A')} dBFS, 최대: {before_stats.get('max_volume', 'N/A')} dBFS")
+            if not norm_info.get("needs_normalization", False):
+                logger.info(f"[정규화] 정규화 불필요: {norm_info.get('reason', '볼륨이 적절함')}")
+                loudnorm_filter = None
             else:
-                print(f"[정규화] 정규화 전 볼륨 분석 실패: {before_stats['error']}")
+                target = norm_info.get("target_volume", config.default_target_dbfs)
+                logger.info(f"[정규화] 정규화 필요: {norm_info.get('reason', '')} (목표 {target} dBFS)")
+                loudnorm_filter = f"loudnorm=I={target}:TP=-1.5:LRA=11"
+                # 기존 정규화와 같이 linear 모드로 적용 (1차 측정값 사용, 동적 압축으로 음색이 바뀌지 않도록)
+                measured = self._measure_loudness(audio_path, loudnorm_filter)
+                if measured:
+                    loudnorm_filter += (
+                        f":measured_I={measured['input_i']}:measured_LRA={measured['input_lra']}"
+                        f":measured_TP={measured['input_tp']}:measured_thresh={measured['input_thresh']}"
+                        f":offset={measured['target_offset']}:linear=true"
+                    )
+                else:
+                    logger.warning("[정규화] 음량 측정 실패 - 단일 패스(dynamic) loudnorm 사용")
+                loudnorm_filter += ",aresample=44100"
+            
+            if len(self._loudnorm_cache) >= LOUDNORM_CACHE_SIZE:
+                self._loudnorm_cache.pop(next(iter(self._loudnorm_cache)))
+            self._loudnorm_cache[cache_key] = loudnorm_filter
+            return loudnorm_filter
+            
+        except Exception as e:
+            logger.warning(f"[정규화] 정규화 분석 중 오류: {e}")
+            return None
+    
+    def _measure_loudness(self, audio_path: str, loudnorm_filter: str) -> Optional[Dict[str, str]]:
+        """
+        loudnorm 1차 패스로 오디오 음량 측정 (linear 모드 2차 패스에 사용)
+        
+        Parameters:
+        -----------
+        audio_path : str
+            측정할 오디오 파일 경로
+        loudnorm_filter : str
+            목표값이 지정된 loudnorm 필터 문자열
+            
+        Returns:
+        --------
+        dict or None
+            input_i, input_lra, input_tp, input_thresh, target_offset 측정값 (실패 시 None)
+        """
+        cmd = [
+            str(self._ffmpeg_path), "-hide_banner", "-nostats", "-i", str(audio_path),
+            "-af", f"{loudnorm_filter}:print_format=json", "-f", "null", "-"
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
+            output = result.stderr
+            measured = json.loads(output[output.rindex("{"):output.rindex("}") + 1])
+            keys = ("input_i", "input_lra", "input_tp", "input_thresh", "target_offset")
+            # 무음 등으로 측정값이 -inf/inf이면 linear 모드를 쓸 수 없음
+            if result.returncode != 0 or any("inf" in str(measured.get(key, "inf")) for key in keys):
+                return None
+            return {key: measured[key] for key in keys}
+        except (OSError, ValueError) as e:
+            logger.warning(f"[정규화] 음량 측정 중 오류: {e}")
+            return None
+    
+    def _normalize_audio_for_preview(self, audio_path: str, preview_id: str) -> str:
+        """
+        프리뷰용 오디오 정규화 (고품질)
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("[정규화] 프리뷰용 오디오 정규화 시도: %s (preview_id=%s)", audio_path, preview_id)
+        try:
+            # 정규화 전 볼륨 정보 확인 (디버그 로그에서만 사용)
+            if debug:
+                before_stats = audio_normalizer.get_audio_stats(audio_path)
+                if "error" not in before_stats:
+                    logger.debug("[정규화] 정규화 전 - 평균: %s dBFS, 최대: %s dBFS",
+                                 before_stats.get('mean_volume', 'N/A'), before_stats.get('max_volume', 'N/A'))
+                else:
+                    logger.debug("[정규화] 정규화 전 볼륨 분석 실패: %s", before_stats['error'])
             
             # 정규화 필요성 확인
             norm_info = audio_normalizer.get_normalization_info(audio_path)
-            print(f"[정규화] 정규화 필요성 분석 결과: {norm_info}")
+            if debug:
+                logger.debug("[정규화] 정규화 필요성 분석 결과: %s", norm_info)
             
             if "error" in norm_info:
-                print(f"[정규화] 정규화 정보 분석 실패: {norm_info['error']}")
+                logger.warning(f"[정규화] 정규화 정보 분석 실패: {norm_info['error']}")
                 return audio_path
             
             if not norm_info.get("needs_normalization", False):
-                print(f"[정규화] 정규화 불필요: {norm_info.get('reason', '볼륨이 적절함')}")
+                logger.info("[정규화] 정규화 불필요: %s", norm_info.get('reason', '볼륨이 적절함'))
                 return audio_path
             
-            print(f"[정규화] 정규화 필요: {norm_info.get('reason', '')}")
-            print(f"[정규화] 현재 평균 볼륨: {norm_info.get('current_mean_volume', 'N/A')} dBFS")
-            print(f"[정규화] 목표 볼륨: {norm_info.get('target_volume', 'N/A')} dBFS")
-            
-            # 정규화된 파일 경로 (temp 디렉토리에 표준화된 형식으로 저장)
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            normalized_path = Path(config.temp_dir) / f"normalized_{timestamp}_norm.mp3"
+            # 정규화된 파일 경로 (temp 디렉토리에 프리뷰 ID 기준으로 저장)
+            normalized_path = Path(config.temp_dir) / f"normalized_{preview_id}_norm.mp3"
             
             # 고품질 정규화 수행
             success = audio_normalizer.normalize_audio_high_quality(
@@ -1496,17 +2477,32 @@ class BroadcastController:
             )
             
             if success and normalized_path.exists():
-                print(f"[정규화] 정규화 완료: {normalized_path}")
+                logger.info("[정규화] 정규화 완료: %s (평균 %s dBFS → 목표 %s dBFS, 사유: %s)",
+                            normalized_path, norm_info.get('current_mean_volume', 'N/A'),
+                            norm_info.get('target_volume', 'N/A'), norm_info.get('reason', ''))
                 return str(normalized_path)
             else:
-                print(f"[정규화] 정규화 실패, 원본 파일 사용")
+                logger.warning("[정규화] 정규화 실패, 원본 파일 사용")
                 return audio_path
                 
         except Exception as e:
-            print(f"[정규화] 정규화 중 오류: {e}")
+            logger.warning(f"[정규화] 정규화 중 오류: {e}")
             return audio_path
     
-    def _get_audio_duration_with_ffprobe(self, audio_path: str) -> float:
+    def _remember_duration(self, audio_path, duration):
+        """
+        직접 계산한 길이를 사이드카에 기록하여 이후 길이 조회에서 ffprobe 실행 생략
+        
+        Returns:
+        --------
+        os.stat_result
+            기록 시점의 파일 정보
+        """
+        st = os.stat(audio_path)
+        _write_duration_sidecar(str(audio_path), st.st_mtime_ns, st.st_size, duration)
+        return st
+    
+    def _get_audio_duration_with_ffprobe(self, audio_path: str, st: Optional[os.stat_result] = None) -> float:
         """
         ffprobe를 사용해서 오디오 파일 길이를 정확하게 확인
         
@@ -1514,6 +2510,8 @@ class BroadcastController:
         -----------
         audio_path : str
             확인할 오디오 파일 경로
+        st : os.stat_result, optional
+            이미 조회한 파일 정보 (없으면 새로 조회)
             
         Returns:
         --------
@@ -1521,53 +2519,29 @@ class BroadcastController:
             오디오 길이 (초), 실패 시 0.0
         """
         try:
-            from ..core.config import config
-            import subprocess
-            import json
+            if st is None:
+                st = os.stat(audio_path)
             
-            ffmpeg_paths = config.get_ffmpeg_paths()
-            ffprobe_path = Path(ffmpeg_paths["ffprobe_path"])
-            
-            if not ffmpeg_paths["ffprobe_exists"]:
-                print(f"[!] ffprobe를 찾을 수 없습니다.")
-                return 0.0
-            
-            # ffprobe로 오디오 정보 분석
-            cmd = [
-                str(ffprobe_path),
-                "-v", "quiet",
-                "-print_format", "json",
-                "-show_format",
-                str(audio_path)
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
-            
-            if result.returncode != 0:
-                print(f"[!] ffprobe 실행 실패: {result.stderr}")
-                return 0.0
+            # WAV/MP3/OGG 등은 헤더에서 바로 길이 확인 (실패 시에만 ffprobe 실행)
+            duration = _fast_duration(str(audio_path), st.st_mtime_ns, st.st_size)
+            if duration > 0:
+                return duration
             
-            if not result.stdout.strip():
-                print(f"[!] ffprobe에서 출력이 없습니다.")
+            if not self._ffprobe_ok:
+                logger.warning("ffprobe를 찾을 수 없습니다.")
                 return 0.0
             
-            data = json.loads(result.stdout)
-            format_info = data.get("format", {})
-            duration = float(format_info.get("duration", 0))
-            
-            return duration
+            # 프리뷰/TTS 캐시 결과물은 사이드카에 길이를 남겨 재시작 후에도 재사용
+            use_sidecar = Path(audio_path).parent in (self.preview_dir, self._tts_cache_dir)
+            return _ffprobe_duration(str(self._ffprobe_path), str(audio_path), st.st_mtime_ns, st.st_size, use_sidecar)
             
         except Exception as e:
-            print(f"[!] ffprobe로 길이 확인 중 오류: {e}")
+            logger.warning(f"ffprobe로 길이 확인 중 오류: {e}")
             return 0.0
 
     def _create_text_preview(self, preview_id, params):
-        print(f"[프리뷰] TTS 방송 프리뷰 생성 시작 (preview_id={preview_id})")
+        logger.debug("[프리뷰] TTS 방송 프리뷰 생성 시작 (preview_id=%s)", preview_id)
         try:
-            from pydub import AudioSegment
-            import shutil
-            from ..core.config import config
-            
             text = params.get('text', '')
             language = params.get('language', 'ko')
             
@@ -1575,162 +2549,185 @@ class BroadcastController:
             tts_audio_path = self.generate_speech(text, language=language)
             if not tts_audio_path:
                 raise Exception("TTS 오디오 생성 실패")
-            print(f"[프리뷰] TTS 오디오 생성 완료: {tts_audio_path}")
-            
-            # config에서 ffmpeg 경로 가져오기
-            ffmpeg_paths = config.get_ffmpeg_paths()
-            ffmpeg_path = Path(ffmpeg_paths["ffmpeg_path"])
-            ffprobe_path = Path(ffmpeg_paths["ffprobe_path"])
-            print(f"[프리뷰] ffmpeg 경로: {ffmpeg_path}")
-            print(f"[프리뷰] ffprobe 경로: {ffprobe_path}")
-            
-            if not ffmpeg_paths["ffmpeg_exists"] or not ffmpeg_paths["ffprobe_exists"]:
-                print(f"[프리뷰] ffmpeg/ffprobe 파일을 찾을 수 없습니다.")
-                # TTS 파일을 프리뷰 디렉토리로 복사
+            logger.debug("[프리뷰] TTS 오디오 생성 완료: %s (ffmpeg: %s, ffprobe: %s)",
+                         tts_audio_path, self._ffmpeg_path, self._ffprobe_path)
+            
+            if not self._ffmpeg_ok:
+                logger.info("[프리뷰] ffmpeg/ffprobe 파일을 찾을 수 없습니다.")
+                # TTS 파일을 프리뷰 디렉토리에 링크
                 preview_path = self.preview_dir / f"{preview_id}.wav"
-                shutil.copy2(tts_audio_path, preview_path)
-                print(f"[프리뷰] TTS 파일을 프리뷰로 복사: {preview_path}")
+                self._link_or_copy(tts_audio_path, preview_path)
+                logger.info(f"[프리뷰] TTS 파일을 프리뷰로 링크: {preview_path}")
                 return str(preview_path)
             
-            # pydub에 ffmpeg 경로 설정
-            import os
-            os.environ['PATH'] = str(ffmpeg_path.parent) + os.pathsep + os.environ.get('PATH', '')
-            print(f"[프리뷰] pydub PATH 설정 완료")
+            # 같은 문구로 이미 렌더링된 프리뷰가 있으면 재사용
+            rendered_cache_path, rendered_valid = self._rendered_preview_cache_path(tts_audio_path)
+            if rendered_valid:
+                preview_path = self._link_or_copy(rendered_cache_path, self.preview_dir / f"{preview_id}.mp3")
+                logger.info(f"[프리뷰] 캐시된 TTS 프리뷰 재사용: {preview_path}")
+                return str(preview_path)
             
             try:
-                # TTS 오디오 정규화 적용
-                print(f"[TTS정규화] TTS 정규화 시작: {tts_audio_path}")
-                normalized_tts_path = self._normalize_audio_for_preview(tts_audio_path, preview_id)
-                print(f"[TTS정규화] TTS 정규화 완료: {normalized_tts_path}")
+                # 시작 신호음 + 정규화된 TTS 오디오 + 끝 신호음을 ffmpeg 한 번으로 결합
+                self._refresh_signals()
+                input_paths = []
+                if self._start_signal_exists:
+                    input_paths.append(str(self.start_signal_path))
+                main_index = len(input_paths)
+                input_paths.append(str(tts_audio_path))
+                if self._end_signal_exists:
+                    input_paths.append(str(self.end_signal_path))
                 
-                # 정규화된 TTS 오디오 로드
-                tts_audio = AudioSegment.from_file(normalized_tts_path)
+                loudnorm_filter = self._preview_loudnorm_filter(tts_audio_path)
+                input_filters = {main_index: loudnorm_filter} if loudnorm_filter else None
                 
-                # 시작 신호음 로드
-                start_audio = AudioSegment.from_file(str(self.start_signal_path)) if self.start_signal_path.exists() else AudioSegment.empty()
-                
-                # 끝 신호음 로드
-                end_audio = AudioSegment.from_file(str(self.end_signal_path)) if self.end_signal_path.exists() else AudioSegment.empty()
-                
-                # 프리뷰 오디오 조합: 시작 신호음 + 정규화된 TTS 오디오 + 끝 신호음
-                preview_audio = start_audio + tts_audio + end_audio
-                
-                # 프리뷰 파일 저장 (mp3 옵션 명시)
                 preview_path = self.preview_dir / f"{preview_id}.mp3"
-                preview_audio.export(
-                    str(preview_path), 
-                    format="mp3",
-                    bitrate="192k",
-                    parameters=["-ac", "2", "-ar", "44100"]
-                )
+                if self._concat_audio_with_ffmpeg(self._ffmpeg_path, input_paths, preview_path, input_filters):
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[프리뷰] 프리뷰 파일 생성 완료: %s (크기: %s bytes)",
+                                     preview_path, f"{preview_path.stat().st_size:,}")
+                else:
+                    logger.warning("[프리뷰] 단일 ffmpeg 처리 실패, pydub으로 다시 시도합니다.")
+                    self._render_text_preview_with_pydub(preview_id, tts_audio_path, preview_path)
                 
-                # ffprobe로 파일 길이 확인
+                # 렌더링된 프리뷰를 캐시에 링크 (같은 문구 재요청 시 재사용)
                 try:
-                    file_size = preview_path.stat().st_size
-                    print(f"[프리뷰] 프리뷰 파일 생성 완료: {preview_path} (크기: {file_size:,} bytes)")
-                    
-                    # ffprobe로 정확한 길이 확인
-                    duration = self._get_audio_duration_with_ffprobe(str(preview_path))
-                    if duration > 0:
-                        print(f"[프리뷰] 프리뷰 길이 (ffprobe): {duration:.2f}초")
-                    else:
-                        # pydub으로 길이 확인 시도 (백업)
-                        try:
-                            audio_length = len(preview_audio) / 1000.0  # 밀리초를 초로 변환
-                            print(f"[프리뷰] 프리뷰 길이 (pydub): {audio_length:.2f}초")
-                        except Exception as e:
-                            print(f"[프리뷰] pydub 길이 확인 실패: {e}")
-                        
+                    self._link_or_copy(preview_path, rendered_cache_path)
                 except Exception as e:
-                    print(f"[프리뷰] 파일 정보 확인 실패: {e}")
-                
-                # 정규화된 TTS 파일을 보존 (임시로)
-                preserved_normalized_path = self.preview_dir / f"preserved_normalized_tts_{preview_id}.mp3"
-                shutil.copy2(normalized_tts_path, preserved_normalized_path)
-                print(f"[TTS정규화] 정규화된 TTS 파일 보존: {preserved_normalized_path}")
-                
-                # 임시 정규화 파일은 정리하지 않음 (보존용으로 사용)
-                # if normalized_tts_path != tts_audio_path and Path(normalized_tts_path).exists():
-                #     Path(normalized_tts_path).unlink()
+                    logger.warning(f"[프리뷰] 프리뷰 캐시 저장 실패: {e}")
                 
-                print(f"[*] TTS 프리뷰 생성 (정규화 적용): {preview_path}")
+                logger.info(f"TTS 프리뷰 생성 (정규화 적용): {preview_path}")
                 return str(preview_path)
                 
             except Exception as e:
-                print(f"[!] TTS 오디오 처리 중 오류: {e}")
-                # 오류 발생 시 TTS 파일을 복사하여 프리뷰로 사용
+                logger.warning(f"TTS 오디오 처리 중 오류: {e}")
+                # 오류 발생 시 TTS 파일을 링크하여 프리뷰로 사용
                 preview_path = self.preview_dir / f"{preview_id}.wav"
-                shutil.copy2(tts_audio_path, preview_path)
-                print(f"[*] TTS 파일을 프리뷰로 복사: {preview_path}")
+                self._link_or_copy(tts_audio_path, preview_path)
+                logger.info(f"TTS 파일을 프리뷰로 복사: {preview_path}")
                 return str(preview_path)
             
         except Exception as e:
             logger.error(f"TTS 프리뷰 생성 중 오류: {e}")
             return None
     
+    def _render_text_preview_with_pydub(self, preview_id, tts_audio_path, preview_path):
+        """정규화 파일을 만든 뒤 pydub으로 TTS 프리뷰 결합 (단일 ffmpeg 처리 실패 시 사용)"""
+        AudioSegment = _audio_segment_class()
+        
+        # TTS 오디오 정규화 적용
+        normalized_tts_path = self._normalize_audio_for_preview(tts_audio_path, preview_id)
+        
+        # 정규화된 TTS 오디오 로드
+        tts_audio = AudioSegment.from_file(normalized_tts_path)
+        
+        # 시작/끝 신호음 로드
+        start_audio = self._signal_segment(self.start_signal_path, self._start_signal_exists)
+        end_audio = self._signal_segment(self.end_signal_path, self._end_signal_exists)
+        
+        # 프리뷰 오디오 조합: 시작 신호음 + 정규화된 TTS 오디오 + 끝 신호음
+        preview_audio = start_audio + tts_audio + end_audio
+        preview_audio.export(
+            str(preview_path), 
+            format="mp3",
+            **self._preview_export_kwargs()
+        )
+        
+        # 길이는 이미 알고 있으므로 ffprobe 대신 사이드카에 기록
+        try:
+            duration = len(preview_audio) / 1000.0  # 밀리초를 초로 변환
+            st = self._remember_duration(preview_path, duration)
+            logger.info(f"[프리뷰] 프리뷰 파일 생성 완료: {preview_path} (크기: {st.st_size:,} bytes, 길이: {duration:.2f}초)")
+        except Exception as e:
+            logger.warning(f"[프리뷰] 파일 정보 확인 실패: {e}")
+        
+        # 디버깅 설정 시에만 정규화된 TTS 파일을 보존 (복사 대신 하드 링크)
+        if config.keep_normalized_tts:
+            preserved_normalized_path = self.preview_dir / f"preserved_normalized_tts_{preview_id}.mp3"
+            self._link_or_copy(normalized_tts_path, preserved_normalized_path)
+            logger.debug("[TTS정규화] 정규화된 TTS 파일 보존: %s", preserved_normalized_path)
+    
+    def _store_preview(self, preview_id, preview_info):
+        """대기 중인 프리뷰 추가 (스냅샷 갱신 포함)"""
+        with self._previews_lock:
+            self.pending_previews[preview_id] = preview_info
+            self._previews_snapshot = tuple(self.pending_previews.values())
+    
+    def _claim_preview(self, preview_id):
+        """
+        대기 중인 프리뷰를 꺼내서 반환 (승인/거부가 동시에 같은 프리뷰를 처리하지 않도록)
+        
+        Returns:
+        --------
+        dict
+            프리뷰 정보 (없으면 None)
+        """
+        with self._previews_lock:
+            preview_info = self.pending_previews.pop(preview_id, None)
+            if preview_info is not None:
+                self._previews_snapshot = tuple(self.pending_previews.values())
+            return preview_info
+    
     def approve_preview(self, preview_id):
         """프리뷰 승인 및 실제 방송 큐에 추가"""
+        preview_info = self._claim_preview(preview_id)
         try:
-            if preview_id not in self.pending_previews:
+            if preview_info is None:
                 raise Exception(f"프리뷰를 찾을 수 없음: {preview_id}")
             
-            preview_info = self.pending_previews[preview_id]
             job_type = preview_info["job_type"]
             params = preview_info["params"]
             preview_path = preview_info.get("preview_path")
             
-            if not preview_path or not Path(preview_path).exists():
+            if not preview_path:
+                raise Exception(f"프리뷰 파일을 찾을 수 없음: {preview_path}")
+            try:
+                st = os.stat(preview_path)
+            except FileNotFoundError:
                 raise Exception(f"프리뷰 파일을 찾을 수 없음: {preview_path}")
+            if st.st_mtime_ns != preview_info.get("file_mtime_ns", st.st_mtime_ns):
+                # 생성 후 파일이 바뀌었으면 저장된 길이를 쓰지 않고 다시 측정
+                preview_info["actual_duration"] = None
             
-            # 프리뷰 파일을 직접 방송 큐에 추가
-            if job_type == 'audio':
-                # 오디오 프리뷰: 프리뷰 파일을 직접 사용
-                result = self.broadcast_audio(
-                    audio_path=preview_path,
-                    target_devices=params.get('target_devices', []),
-                    end_devices=params.get('end_devices', []),
-                    duration=preview_info.get('actual_duration'),
-                    skip_signals=True  # 프리뷰 파일에는 이미 시작음/끝음이 포함됨
-                )
-            elif job_type == 'text':
-                # 텍스트 프리뷰: 프리뷰 파일을 직접 사용
-                result = self.broadcast_audio(
-                    audio_path=preview_path,
-                    target_devices=params.get('target_devices', []),
-                    end_devices=params.get('end_devices', []),
-                    duration=preview_info.get('actual_duration'),
-                    skip_signals=True  # 프리뷰 파일에는 이미 시작음/끝음이 포함됨
-                )
-            else:
+            if job_type not in ('audio', 'text'):
                 raise Exception(f"지원하지 않는 작업 타입: {job_type}")
             
-            # 승인된 프리뷰 제거
-            del self.pending_previews[preview_id]
+            # 오디오/텍스트 프리뷰 모두 렌더링된 프리뷰 파일을 그대로 방송 큐에 추가
+            # (길이는 프리뷰 생성 시 구한 값을 사용하므로 파일을 다시 분석하지 않음)
+            result = self.broadcast_audio(
+                audio_path=preview_path,
+                target_devices=params.get('target_devices', []),
+                end_devices=params.get('end_devices', []),
+                duration=preview_info.get('actual_duration'),
+                skip_signals=True  # 프리뷰 파일에는 이미 시작음/끝음이 포함됨
+            )
             
-            print(f"[*] 프리뷰 승인 완료: {preview_id}")
-            print(f"[*] 프리뷰 파일 방송: {preview_path}")
+            logger.info(f"프리뷰 승인 완료: {preview_id}")
+            logger.info(f"프리뷰 파일 방송: {preview_path}")
             return result
             
         except Exception as e:
             logger.error(f"프리뷰 승인 중 오류: {e}")
+            # 승인에 실패한 프리뷰는 다시 대기 목록으로 되돌림
+            if preview_info is not None:
+                self._store_preview(preview_id, preview_info)
             return None
     
     def reject_preview(self, preview_id):
         """프리뷰 거부"""
         try:
-            if preview_id not in self.pending_previews:
+            # 대기 중인 프리뷰에서 제거
+            preview_info = self._claim_preview(preview_id)
+            if preview_info is None:
                 raise Exception(f"프리뷰를 찾을 수 없음: {preview_id}")
             
             # 프리뷰 파일 삭제
-            preview_info = self.pending_previews[preview_id]
             preview_path = preview_info.get("preview_path")
-            if preview_path and Path(preview_path).exists():
-                Path(preview_path).unlink()
-            
-            # 대기 중인 프리뷰에서 제거
-            del self.pending_previews[preview_id]
+            if preview_path:
+                for path in (preview_path, str(preview_path) + DURATION_SIDECAR_SUFFIX):
+                    Path(path).unlink(missing_ok=True)
             
-            print(f"[*] 프리뷰 거부 완료: {preview_id}")
+            logger.info(f"프리뷰 거부 완료: {preview_id}")
             return True
             
         except Exception as e:
@@ -1743,11 +2740,11 @@ class BroadcastController:
     
     def get_all_previews(self):
         """모든 대기 중인 프리뷰 조회"""
-        return list(self.pending_previews.values())
+        return list(self._previews_snapshot)
 
     def save_device_states(self, target_devices):
         """
-        방송 대상 장치들의 현재 상태를 저장
+        방송 대상 장치들의 현재 상태를 저장 (활성 방 비트마스크 스냅샷)
         
         Parameters:
         -----------
@@ -1761,46 +2758,36 @@ class BroadcastController:
         """
         try:
             if not target_devices:
-                print("[*] 저장할 장치가 없습니다.")
+                logger.info("저장할 장치가 없습니다.")
                 return True
                 
-            print(f"[*] 장치 상태 저장 시작: {target_devices}")
-            
-            # 현재 활성화된 방 목록 가져오기
-            active_rooms = self.broadcast_manager.get_active_rooms()
-            print(f"[*] 현재 활성화된 방: {sorted(active_rooms)}")
-            
-            # 대상 장치들의 상태 저장
-            for device in target_devices:
-                # 장치명을 방 번호로 변환 (예: "1-1" -> "101")
-                room_number = self._device_name_to_room_number(device)
-                if room_number:
-                    # 현재 상태 저장 (활성화되어 있으면 True, 아니면 False)
-                    self.device_state_backup[device] = room_number in active_rooms
-                    print(f"[*] 장치 {device} (방 {room_number}) 상태 저장: {'켜짐' if room_number in active_rooms else '꺼짐'}")
-                else:
-                    # 일반 장치의 경우 (방 번호가 없는 장치)
-                    # 장치 매트릭스에서 해당 장치의 위치를 찾아서 상태 저장
-                    device_coords = self._find_device_in_matrix(device)
-                    if device_coords:
-                        row, col = device_coords
-                        # 장치 매트릭스 위치를 기반으로 상태 저장
-                        # 실제로는 해당 위치의 장치가 활성화되어 있는지 확인
-                        self.device_state_backup[device] = self._is_device_active_at_position(row, col, active_rooms)
-                        print(f"[*] 일반 장치 {device} (위치: {row},{col}) 상태 저장: {'켜짐' if self.device_state_backup[device] else '꺼짐'}")
-                    else:
-                        print(f"[!] 장치 {device}의 위치를 찾을 수 없습니다.")
+            # 현재 활성 상태를 비트마스크로 한 번만 조회
+            active_mask = self.broadcast_manager.get_active_mask()
+            logger.debug("장치 상태 저장 시작: %s (현재 활성 마스크: 0x%016x)", target_devices, active_mask)
+            
+            # 대상 장치들의 비트를 한 번에 계산한 뒤 스냅샷에 일괄 반영
+            device_bits = {device: self._device_bit(device) for device in target_devices}
+            missing = [device for device, bit in device_bits.items() if not bit]
+            if missing:
+                logger.warning("위치를 찾을 수 없는 장치: %s", missing)
+            target_mask = 0
+            for bit in device_bits.values():
+                target_mask |= bit
+            self._device_state_backup_mask = (self._device_state_backup_mask & ~target_mask) | (active_mask & target_mask)
+            self.device_state_backup.update(
+                {device: bool(active_mask & bit) for device, bit in device_bits.items() if bit}
+            )
             
-            print(f"[*] 장치 상태 저장 완료: {len(self.device_state_backup)}개 장치")
+            logger.info("장치 상태 저장 완료: %d개 장치 (활성 마스크 0x%016x)", len(self.device_state_backup), active_mask)
             return True
             
         except Exception as e:
-            print(f"[!] 장치 상태 저장 중 오류: {e}")
+            logger.warning(f"장치 상태 저장 중 오류: {e}")
             return False
     
     def restore_device_states(self, target_devices):
         """
-        저장된 상태로 장치들을 복원
+        저장된 상태로 장치들을 복원 (대상 장치 비트만 한 번의 패킷으로 되돌림)
         Parameters:
         -----------
         target_devices : list
@@ -1812,152 +2799,97 @@ class BroadcastController:
         """
         try:
             if not self.restore_device_states_enabled:
-                print("[*] 장치 상태 복원이 비활성화되어 있습니다.")
+                logger.info("장치 상태 복원이 비활성화되어 있습니다.")
                 return True
             if not target_devices:
-                print("[*] 복원할 장치가 없습니다.")
+                logger.info("복원할 장치가 없습니다.")
                 return True
             if not self.device_state_backup:
-                print("[*] 저장된 장치 상태가 없습니다.")
+                logger.info("저장된 장치 상태가 없습니다.")
                 return True
-            print(f"[*] 장치 상태 복원 시작: {target_devices}")
-            # 현재 활성화된 방 목록 가져오기
-            active_rooms = self.broadcast_manager.get_active_rooms()
-            print(f"[*] 방송 후 현재 활성화된 방: {sorted(active_rooms)}")
-            # 켜야 할 장치와 꺼야 할 장치 분리
-            devices_to_turn_on = []
-            devices_to_turn_off = []
-            for device in target_devices:
-                if device in self.device_state_backup:
-                    original_state = self.device_state_backup[device]
-                    room_number = self._device_name_to_room_number(device)
-                    if room_number:
-                        current_state = room_number in active_rooms
-                        if current_state != original_state:
-                            if original_state:
-                                devices_to_turn_on.append(device)
-                            else:
-                                devices_to_turn_off.append(device)
-                    else:
-                        device_coords = self._find_device_in_matrix(device)
-                        if device_coords:
-                            row, col = device_coords
-                            current_state = self._is_device_active_at_position(row, col, active_rooms)
-                            if current_state != original_state:
-                                if original_state:
-                                    devices_to_turn_on.append(device)
-                                else:
-                                    devices_to_turn_off.append(device)
-            # 한 번에 상태 반영
-            if devices_to_turn_on:
-                print(f"[*] 켜야 할 장치: {devices_to_turn_on}")
-                self.control_multiple_devices(devices_to_turn_on, 1)
-            if devices_to_turn_off:
-                print(f"[*] 꺼야 할 장치: {devices_to_turn_off}")
-                self.control_multiple_devices(devices_to_turn_off, 0)
-            # 복원 완료 후 상태 확인
-            time.sleep(0.5)
-            final_active_rooms = self.broadcast_manager.get_active_rooms()
-            print(f"[*] 상태 복원 후 활성화된 방: {sorted(final_active_rooms)}")
+            logger.debug("장치 상태 복원 시작: %s", target_devices)
+            
+            # 저장된 장치들의 비트마스크 계산
+            backup = self.device_state_backup
+            target_mask = 0
+            for bit in [self._device_bit(device) for device in target_devices if device in backup]:
+                target_mask |= bit
+            saved_mask = self._device_state_backup_mask & target_mask
+            
+            # 대상 장치 중 현재 상태와 다른 비트만 한 번에 반영
+            current_mask = self.broadcast_manager.get_active_mask()
+            set_mask = saved_mask & ~current_mask
+            clear_mask = target_mask & ~saved_mask & current_mask
+            logger.debug("방송 후 현재 활성 마스크: 0x%016x", current_mask)
+            # 전송 결과로 복원 여부 판단 (apply_delta가 실패 시 메모리 상태를 롤백하므로 별도 대기 불필요)
+            restored = True
+            if set_mask or clear_mask:
+                restored = self.broadcast_manager.apply_delta(set_mask=set_mask, clear_mask=clear_mask, retries=3, retry_delay=0.2)
+                if not restored:
+                    logger.warning("복원 대상 장치 상태가 저장된 상태와 일치하지 않습니다.")
+            
             # 백업 데이터 정리
+            self._device_state_backup_mask &= ~target_mask
             for device in target_devices:
-                if device in self.device_state_backup:
-                    del self.device_state_backup[device]
-            print(f"[*] 장치 상태 복원 완료")
-            return True
+                self.device_state_backup.pop(device, None)
+            logger.info("장치 상태 복원 완료: 켜기 0x%016x, 끄기 0x%016x", set_mask, clear_mask)
+            return restored
         except Exception as e:
-            print(f"[!] 장치 상태 복원 중 오류: {e}")
+            logger.warning(f"장치 상태 복원 중 오류: {e}")
             return False
     
-    def _find_device_in_matrix(self, device_name):
+    def _device_bit(self, device_name):
         """
-        장치명을 장치 매트릭스에서 찾아서 좌표 반환
+        장치명을 활성 방 비트마스크의 비트로 변환
         
         Parameters:
         -----------
         device_name : str
-            찾을 장치명
+            장치명 (예: "1-1" 또는 장치 매트릭스의 이름)
             
         Returns:
         --------
-        tuple
-            (row, col) 또는 None
-        """
-        try:
-            device_matrix = self.device_mapper.get_device_matrix()
-            for row in range(len(device_matrix)):
-                for col in range(len(device_matrix[row])):
-                    if device_matrix[row][col] == device_name:
-                        return (row, col)
-            return None
-        except Exception as e:
-            print(f"[!] 장치 매트릭스 검색 중 오류: {e}")
-            return None
-    
-    def _is_device_active_at_position(self, row, col, active_rooms):
+        int
+            해당 장치의 비트 (찾을 수 없으면 0)
         """
-        특정 위치의 장치가 활성화되어 있는지 확인
+        room_id = _room_from_name(device_name) if isinstance(device_name, str) else None
+        if room_id is not None:
+            return self._room_bit[room_id]
         
-        Parameters:
-        -----------
-        row : int
-            행 번호
-        col : int
-            열 번호
-        active_rooms : list
-            활성화된 방 목록
-            
-        Returns:
-        --------
-        bool
-            활성화 여부
-        """
-        try:
-            # 장치 매트릭스 위치를 기반으로 활성화 여부 판단
-            # 실제 구현에서는 해당 위치의 장치 상태를 확인하는 로직 필요
-            # 현재는 단순히 해당 위치가 활성화되어 있다고 가정
-            device_id = row * 16 + col + 1
-            return device_id in active_rooms
-        except Exception as e:
-            print(f"[!] 장치 활성화 상태 확인 중 오류: {e}")
-            return False
+        # 일반 장치의 경우 장치 매트릭스 위치 기준 (0부터 시작하는 행/열)
+        device_coords = self._find_device_in_matrix(device_name)
+        if device_coords:
+            row, col = device_coords
+            return 1 << (row * 16 + col)
+        return 0
     
-    def _device_name_to_room_number(self, device_name):
+    def _find_device_in_matrix(self, device_name):
         """
-        장치명을 방 번호로 변환
+        장치명을 장치 매트릭스에서 찾아서 좌표 반환
         
         Parameters:
         -----------
         device_name : str
-            장치명 (예: "1-1", "3-2")
+            찾을 장치명
             
         Returns:
         --------
-        int
-            방 번호 (예: 101, 302) 또는 None
+        tuple
+            (row, col) 또는 None
         """
         try:
-            # 학년-반 형식 (예: "1-1", "3-2")
-            if '-' in device_name and device_name[0].isdigit():
-                grade, class_num = device_name.split('-')
-                grade = int(grade)
-                class_num = int(class_num)
-                
-                # 방 번호 생성 (학년 + 반)
-                room_number = grade * 100 + class_num
-                
-                # 좌표 유효성 검사
-                if 1 <= grade <= 4 and 1 <= class_num <= 16:
-                    return room_number
-                else:
-                    print(f"[!] 좌표 범위 초과: ({grade}, {class_num})")
-                    return None
-            else:
-                print(f"[!] 지원되지 않는 장치명 형식: {device_name}")
-                return None
-                    
+            version = self.device_mapper.matrix_version
+            if version != self._device_index_version:
+                # 매트릭스가 바뀐 경우에만 재구성 (중복 이름은 기존 순차 검색처럼 첫 위치 우선)
+                index = {}
+                for row, names in enumerate(self.device_mapper.get_device_matrix()):
+                    for col, name in enumerate(names):
+                        index.setdefault(name, (row, col))
+                self._device_index = index
+                self._device_index_version = version
+            return self._device_index.get(device_name)
         except Exception as e:
-            print(f"[!] 장치명 변환 중 오류: {e}")
+            logger.warning(f"장치 매트릭스 검색 중 오류: {e}")
             return None
     
     def set_restore_device_states(self, enabled):
@@ -1970,7 +2902,7 @@ class BroadcastController:
             복원 기능 활성화 여부
         """
         self.restore_device_states_enabled = enabled
-        print(f"[*] 장치 상태 복원 기능: {'활성화' if enabled else '비활성화'}")
+        logger.info(f"장치 상태 복원 기능: {'활성화' if enabled else '비활성화'}")
     
     def get_device_state_backup_info(self):
         """
@@ -9,6 +9,7 @@ from .network import NetworkManager
 from ..models.device import DeviceStatus
 from ..core.config import setup_logging
 import time
+import logging
 
 # 중앙 로깅 설정 사용
 logger = setup_logging(__name__)
@@ -33,10 +34,15 @@ class BroadcastManager:
         # 장치 상태 관리 (메모리 상에서 관리)
         self.device_matrix = {}  # {(row, col): DeviceStatus}
         self.active_rooms = set()  # 활성화된 방 번호 집합
+        self.active_mask = 0  # 활성화된 방 비트마스크 (bit = (row-1)*16 + (col-1), active_rooms와 함께 갱신)
         
         # 통계
         self.packet_sent_count = 0
         
+        # 상태 요약 캐시 (활성 마스크, 전송 횟수, 대상 주소가 바뀌면 다시 생성)
+        self._status_summary_key = None
+        self._status_summary_cache = None
+        
         # 매트릭스 초기화 (4행 16열)
         self._initialize_device_matrix()
         
@@ -71,30 +77,38 @@ class BroadcastManager:
             logger.error(f"잘못된 좌표: ({row}, {col})")
             return False
         
+        if self.active_mask >> ((row - 1) * 16 + (col - 1)) & 1:
+            logger.debug("상태 변경 없음, 패킷 전송 생략: (%d, %d) 이미 켜짐", row, col)
+            return True
+        
         logger.info(f"장치 켜기 + 패킷 전송: ({row}, {col})")
         
         # 이전 상태 백업
         previous_active = self.active_rooms.copy()
+        previous_mask = self.active_mask
         
         try:
             # 1. 내부 상태 업데이트
             room_id = self._coordinates_to_room(row, col)
             self.device_matrix[(row, col)] = DeviceStatus.ON
             self.active_rooms.add(room_id)
+            self.active_mask |= 1 << ((row - 1) * 16 + (col - 1))
             
             # 2. 현재 활성화된 모든 방들의 상태로 패킷 전송
             success, response = self.network_manager.send_current_state_packet(self.active_rooms)
             
             if success:
                 self.packet_sent_count += 1
-                logger.info(f"패킷 전송 성공: {sorted(self.active_rooms)} (총 {len(self.active_rooms)}개 방)")
-                if response:
-                    logger.info(f"서버 응답: {response.hex()}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("패킷 전송 성공: %s (총 %d개 방)", sorted(self.active_rooms), len(self.active_rooms))
+                if response and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("서버 응답: %s", response.hex())
                 return True
             else:
                 # 패킷 전송 실패 시 이전 상태로 롤백
                 self.device_matrix[(row, col)] = DeviceStatus.OFF
                 self.active_rooms = previous_active
+                self.active_mask = previous_mask
                 logger.error(f"패킷 전송 실패 - 상태 롤백")
                 return False
             
@@ -103,6 +117,7 @@ class BroadcastManager:
             # 오류 발생 시 이전 상태로 롤백
             self.device_matrix[(row, col)] = DeviceStatus.OFF
             self.active_rooms = previous_active
+            self.active_mask = previous_mask
             return False
     
     def turn_off_device(self, row: int, col: int) -> bool:
@@ -113,10 +128,15 @@ class BroadcastManager:
             logger.error(f"잘못된 좌표: ({row}, {col})")
             return False
         
+        if not self.active_mask >> ((row - 1) * 16 + (col - 1)) & 1:
+            logger.debug("상태 변경 없음, 패킷 전송 생략: (%d, %d) 이미 꺼짐", row, col)
+            return True
+        
         logger.info(f"장치 끄기 + 패킷 전송: ({row}, {col})")
         
         # 이전 상태 백업
         previous_active = self.active_rooms.copy()
+        previous_mask = self.active_mask
         previous_status = self.device_matrix[(row, col)]
         
         try:
@@ -124,20 +144,23 @@ class BroadcastManager:
             room_id = self._coordinates_to_room(row, col)
             self.device_matrix[(row, col)] = DeviceStatus.OFF
             self.active_rooms.discard(room_id)
+            self.active_mask &= ~(1 << ((row - 1) * 16 + (col - 1)))
             
             # 2. 현재 활성화된 모든 방들의 상태로 패킷 전송
             success, response = self.network_manager.send_current_state_packet(self.active_rooms)
             
             if success:
                 self.packet_sent_count += 1
-                logger.info(f"패킷 전송 성공: {sorted(self.active_rooms)} (총 {len(self.active_rooms)}개 방)")
-                if response:
-                    logger.info(f"서버 응답: {response.hex()}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("패킷 전송 성공: %s (총 %d개 방)", sorted(self.active_rooms), len(self.active_rooms))
+                if response and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("서버 응답: %s", response.hex())
                 return True
             else:
                 # 패킷 전송 실패 시 이전 상태로 롤백
                 self.device_matrix[(row, col)] = previous_status
                 self.active_rooms = previous_active
+                self.active_mask = previous_mask
                 logger.error(f"패킷 전송 실패 - 상태 롤백")
                 return False
             
@@ -146,47 +169,61 @@ class BroadcastManager:
             # 오류 발생 시 이전 상태로 롤백
             self.device_matrix[(row, col)] = previous_status
             self.active_rooms = previous_active
+            self.active_mask = previous_mask
             return False
     
     def set_active_rooms(self, active_rooms: Set[int]) -> bool:
         """
-        방 번호 기반 다중 장치 제어 + 실제 패킷 전송
+        방 번호 기반 다중 장치 제어 + 실제 패킷 전송 (set_active_mask로 위임)
+        """
+        logger.info("방 번호 기반 제어 + 패킷 전송: %s", active_rooms)
+        return self.set_active_mask(self._mask_from_rooms(active_rooms))
+    
+    def set_active_mask(self, mask: int, force: bool = False) -> bool:
+        """
+        방 비트마스크 기반 다중 장치 제어 + 실제 패킷 전송
+        
+        Args:
+            mask (int): 활성화할 방 비트마스크 (bit = (row-1)*16 + (col-1))
+            force (bool): 현재 상태와 같아도 패킷 전송
+            
+        Returns:
+            bool: 성공 여부
         """
-        logger.info(f"방 번호 기반 제어 + 패킷 전송: {active_rooms}")
+        mask &= (1 << 64) - 1
+        if mask == self.active_mask and not force:
+            logger.debug("상태 변경 없음, 패킷 전송 생략: 0x%016x", mask)
+            return True
         
         # 이전 상태 백업
         previous_active = self.active_rooms.copy()
+        previous_mask = self.active_mask
         previous_matrix = self.device_matrix.copy()
         
         try:
-            # 1. 모든 장치를 일단 OFF로 설정
+            # 1. 비트마스크대로 장치 상태 설정
             for row in range(1, 5):
                 for col in range(1, 17):
-                    self.device_matrix[(row, col)] = DeviceStatus.OFF
-            
-            # 2. 활성화할 방들만 ON으로 설정
-            self.active_rooms = set()
-            for room_id in active_rooms:
-                row, col = self._room_to_coordinates(room_id)
-                if self._validate_coordinates(row, col):
-                    self.device_matrix[(row, col)] = DeviceStatus.ON
-                    self.active_rooms.add(room_id)
-                else:
-                    logger.warning(f"잘못된 방 번호 무시: {room_id}")
+                    on = mask >> ((row - 1) * 16 + (col - 1)) & 1
+                    self.device_matrix[(row, col)] = DeviceStatus.ON if on else DeviceStatus.OFF
+            self.active_rooms = self._rooms_from_mask(mask)
+            self.active_mask = mask
             
-            # 3. 실제 패킷 전송
+            # 2. 실제 패킷 전송
             success, response = self.network_manager.send_current_state_packet(self.active_rooms)
             
             if success:
                 self.packet_sent_count += 1
-                logger.info(f"패킷 전송 성공: {sorted(self.active_rooms)} (총 {len(self.active_rooms)}개 방)")
-                if response:
-                    logger.info(f"서버 응답: {response.hex()}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("패킷 전송 성공: %s (총 %d개 방)", sorted(self.active_rooms), len(self.active_rooms))
+                if response and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("서버 응답: %s", response.hex())
                 return True
             else:
                 # 패킷 전송 실패 시 이전 상태로 롤백
                 self.device_matrix = previous_matrix
                 self.active_rooms = previous_active
+                self.active_mask = previous_mask
                 logger.error(f"패킷 전송 실패 - 상태 롤백")
                 return False
             
@@ -195,6 +232,7 @@ class BroadcastManager:
             # 오류 발생 시 이전 상태로 롤백
             self.device_matrix = previous_matrix
             self.active_rooms = previous_active
+            self.active_mask = previous_mask
             return False
     
     def turn_off_all_devices(self) -> bool:
@@ -202,85 +240,64 @@ class BroadcastManager:
         모든 장치 끄기 + 실제 패킷 전송
         """
         logger.info("모든 장치 끄기 + 패킷 전송")
-        print("[*] BroadcastManager: 모든 장치 끄기 시작")
         
         # 이전 상태 백업
         previous_active = self.active_rooms.copy()
+        previous_mask = self.active_mask
         previous_matrix = self.device_matrix.copy()
         
-        print(f"[*] BroadcastManager: 이전 상태 - 활성 방: {sorted(previous_active)}")
-        print(f"[*] BroadcastManager: 이전 상태 - 활성 장치 수: {sum(1 for status in previous_matrix.values() if status == DeviceStatus.ON)}")
+        logger.debug("이전 상태 - 활성 방: %s", sorted(previous_active))
         
         try:
             # 1. 내부 상태 업데이트 (모든 장치 OFF)
-            print("[*] BroadcastManager: 내부 상태 업데이트 (모든 장치 OFF)")
             for row in range(1, 5):
                 for col in range(1, 17):
                     self.device_matrix[(row, col)] = DeviceStatus.OFF
             self.active_rooms.clear()
-            print("[*] BroadcastManager: 내부 상태 업데이트 완료")
-            
-            # 상태 확인
-            print("[*] BroadcastManager: 업데이트 후 상태 확인")
-            active_count_after_update = sum(1 for status in self.device_matrix.values() if status == DeviceStatus.ON)
-            active_rooms_after_update = len(self.active_rooms)
-            print(f"[*] BroadcastManager: 업데이트 후 활성 장치 수: {active_count_after_update}")
-            print(f"[*] BroadcastManager: 업데이트 후 활성 방 수: {active_rooms_after_update}")
+            self.active_mask = 0
+            logger.debug("내부 상태 업데이트 완료 (모든 장치 OFF)")
             
             # 2. 실제 패킷 전송 (빈 집합 = 모든 장치 OFF) - 최대 3번 시도
-            print("[*] BroadcastManager: 패킷 전송 시작 (최대 3번 시도)")
             for attempt in range(3):
                 try:
-                    print(f"[*] BroadcastManager: 패킷 전송 시도 {attempt + 1}/3")
+                    logger.debug("패킷 전송 시도 %d/3", attempt + 1)
                     success, response = self.network_manager.send_current_state_packet(set())
                     
                     if success:
                         self.packet_sent_count += 1
                         logger.info(f"모든 장치 끄기 패킷 전송 성공 (시도 {attempt + 1}/3)")
-                        print(f"[*] BroadcastManager: 패킷 전송 성공 (시도 {attempt + 1}/3)")
-                        if response:
-                            logger.info(f"서버 응답: {response.hex()}")
-                            print(f"[*] BroadcastManager: 서버 응답 수신: {response.hex()}")
+                        if response and logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("서버 응답: %s", response.hex())
                         
                         # 최종 상태 확인
-                        print("[*] BroadcastManager: 최종 상태 확인")
-                        final_active_count = sum(1 for status in self.device_matrix.values() if status == DeviceStatus.ON)
-                        final_active_rooms = len(self.active_rooms)
-                        print(f"[*] BroadcastManager: 최종 활성 장치 수: {final_active_count}")
-                        print(f"[*] BroadcastManager: 최종 활성 방 수: {final_active_rooms}")
-                        print(f"[*] BroadcastManager: 최종 활성 방 목록: {sorted(self.active_rooms)}")
-                        
-                        if final_active_count == 0:
-                            print("[*] BroadcastManager: 모든 장치가 성공적으로 OFF 상태로 설정됨")
-                        else:
-                            print(f"[!] BroadcastManager: 경고 - 여전히 {final_active_count}개 장치가 ON 상태")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            final_active_count = sum(1 for status in self.device_matrix.values() if status == DeviceStatus.ON)
+                            logger.debug("최종 활성 장치 수: %d, 활성 방: %s", final_active_count, sorted(self.active_rooms))
                         
                         return True
                     else:
-                        print(f"[!] BroadcastManager: 패킷 전송 실패 (시도 {attempt + 1}/3)")
+                        logger.warning(f"패킷 전송 실패 (시도 {attempt + 1}/3)")
                         if attempt < 2:
-                            print(f"[*] BroadcastManager: 재시도 전 대기 (0.5초)")
                             time.sleep(0.5)
                         
                 except Exception as e:
-                    print(f"[!] BroadcastManager: 패킷 전송 시도 {attempt + 1}/3 중 오류: {e}")
+                    logger.warning(f"패킷 전송 시도 {attempt + 1}/3 중 오류: {e}")
                     if attempt < 2:
-                        print(f"[*] BroadcastManager: 재시도 전 대기 (0.5초)")
                         time.sleep(0.5)
             
             # 모든 시도 실패 시 이전 상태로 롤백
-            print("[!] BroadcastManager: 모든 패킷 전송 시도 실패 - 상태 롤백")
             self.device_matrix = previous_matrix
             self.active_rooms = previous_active
+            self.active_mask = previous_mask
             logger.error("패킷 전송 실패 - 상태 롤백")
             return False
             
         except Exception as e:
             logger.error(f"모든 장치 끄기 오류: {e}")
-            print(f"[!] BroadcastManager: 모든 장치 끄기 중 오류: {e}")
             # 오류 발생 시 이전 상태로 롤백
             self.device_matrix = previous_matrix
             self.active_rooms = previous_active
+            self.active_mask = previous_mask
             return False
     
     def get_device_status(self, row: int, col: int) -> Optional[DeviceStatus]:
@@ -293,6 +310,64 @@ class BroadcastManager:
         """활성화된 방 번호 집합 조회"""
         return self.active_rooms.copy()
     
+    def get_active_mask(self) -> int:
+        """활성화된 방 비트마스크 조회 (bit = (row-1)*16 + (col-1))"""
+        return self.active_mask
+    
+    def _mask_from_rooms(self, rooms) -> int:
+        """방 번호 집합을 방 비트마스크로 변환 (범위를 벗어난 방 번호는 무시)"""
+        mask = 0
+        for room_id in rooms:
+            row, col = self._room_to_coordinates(room_id)
+            if self._validate_coordinates(row, col):
+                mask |= 1 << ((row - 1) * 16 + (col - 1))
+            else:
+                logger.warning(f"잘못된 방 번호 무시: {room_id}")
+        return mask
+    
+    def _rooms_from_mask(self, mask: int) -> Set[int]:
+        """방 비트마스크를 방 번호 집합으로 변환"""
+        return {(i // 16 + 1) * 100 + (i % 16 + 1) for i in range(64) if mask >> i & 1}
+    
+    def apply_state_mask(self, on_mask: int = 0, off_mask: int = 0, force: bool = False) -> bool:
+        """
+        켤/끌 비트마스크를 현재 상태에 합쳐 64개 장치 상태를 한 번의 패킷으로 전송
+        
+        Args:
+            on_mask (int): 켤 방 비트마스크
+            off_mask (int): 끌 방 비트마스크
+            force (bool): 현재 상태와 같아도 패킷 전송 (장비와 메모리 상태 불일치 복구용)
+            
+        Returns:
+            bool: 성공 여부 (패킷 전송 결과로 확인되므로 별도 대기 불필요)
+        """
+        return self.set_active_mask((self.active_mask | on_mask) & ~off_mask, force=force)
+    
+    def apply_delta(self, set_mask: int = 0, clear_mask: int = 0, retries: int = 3, retry_delay: float = 0.2,
+                    force: bool = False) -> bool:
+        """
+        현재 상태에 비트마스크 변경분을 적용하고 패킷 전송 (실패 시 재전송)
+        
+        Args:
+            set_mask (int): 켤 방 비트마스크
+            clear_mask (int): 끌 방 비트마스크
+            retries (int): 최대 전송 시도 횟수
+            retry_delay (float): 재전송 전 대기 시간 (초)
+            force (bool): 현재 상태와 같아도 패킷 전송
+            
+        Returns:
+            bool: 성공 여부
+        """
+        for attempt in range(retries):
+            if self.apply_state_mask(set_mask, clear_mask, force=force):
+                logger.info("비트마스크 적용 완료 (시도 %d/%d): 0x%016x", attempt + 1, retries, self.active_mask)
+                return True
+            if attempt < retries - 1:
+                time.sleep(retry_delay)
+        
+        logger.error(f"비트마스크 적용 실패 ({retries}회 시도): set=0x{set_mask:016x}, clear=0x{clear_mask:016x}")
+        return False
+    
     def get_active_devices(self) -> List[Tuple[int, int]]:
         """활성화된 장치 좌표 목록 조회"""
         active_devices = []
@@ -308,8 +383,27 @@ class BroadcastManager:
         logger.info(f"연결 테스트 결과: {success}")
         return success
     
+    @property
+    def status_summary(self) -> Dict[str, Any]:
+        """
+        통합 상태 요약 (캐시됨)
+        
+        활성 마스크, 패킷 전송 횟수, 대상 주소가 바뀔 때만 다시 생성하며, 같은 dict를 그대로 반환하므로
+        호출 측에서는 읽기 전용으로 사용해야 합니다.
+        """
+        key = (self.active_mask, self.packet_sent_count,
+               self.network_manager.target_ip, self.network_manager.target_port)
+        if self._status_summary_key != key:
+            self._status_summary_cache = self._build_status_summary()
+            self._status_summary_key = key
+        return self._status_summary_cache
+    
     def get_status_summary(self) -> Dict[str, Any]:
-        """통합 상태 요약"""
+        """통합 상태 요약 (읽기 전용 캐시 반환)"""
+        return self.status_summary
+    
+    def _build_status_summary(self) -> Dict[str, Any]:
+        """통합 상태 요약 생성"""
         active_count = sum(1 for status in self.device_matrix.values() if status == DeviceStatus.ON)
         total_devices = len(self.device_matrix)
         
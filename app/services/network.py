@@ -4,9 +4,13 @@
 방송 시스템의 패킷 생성 및 통신을 처리합니다.
 """
 import socket
-from scapy.all import IFACES
+import logging
+import threading
+from ..core.config import setup_logging
 from .packet_builder import PacketBuilder
 
+logger = setup_logging(__name__)
+
 class NetworkManager:
     """
     네트워크 통신 관리 클래스
@@ -32,23 +36,147 @@ class NetworkManager:
         # 패킷 카운터 초기화
         self.packet_counter = 0
         
+        # 방송 장비와의 지속 연결 (워커/API 스레드가 함께 쓰므로 잠금으로 보호)
+        self._sock = None
+        self._sock_addr = None
+        self._sock_lock = threading.Lock()
+        
         # 패킷 빌더 초기화
         self.packet_builder = PacketBuilder()
         
+        # 입력에만 의존하는 패킷 캐시 (좌표 패킷은 (행, 열, 상태) 128가지뿐이라 처음 만들 때 저장)
+        self._coord_cache = {}
+        self._all_off_payload = self.packet_builder.create_all_off_payload()
+        
         # 네트워크 인터페이스 설정
         if interface is None:
             self.interface = self._get_default_interface()
     
     def _get_default_interface(self):
-        """기본 네트워크 인터페이스 선택"""
+        """기본 네트워크 인터페이스 선택 (표준 라이브러리로 조회, 루프백 제외)"""
         try:
-            interfaces = IFACES.show(resolve_mac=False, print_result=False)
-            if interfaces and isinstance(interfaces, dict):
-                # 첫 번째 인터페이스 선택
-                return list(interfaces.keys())[0]
-        except Exception as e:
-            print(f"[!] 인터페이스 선택 중 오류: {e}")
-        return None
+            names = [name for _, name in socket.if_nameindex()]
+        except (AttributeError, OSError) as e:  # if_nameindex 미지원 플랫폼
+            logger.warning("인터페이스 선택 중 오류: %s", e)
+            return None
+        for name in names:
+            if not name.startswith("lo"):
+                return name
+        return names[0] if names else None
+    
+    def _get_connected_socket(self, timeout):
+        """
+        캐시된 연결 반환 (끊겼거나 대상이 바뀌었으면 새로 연결, _sock_lock 안에서 호출)
+        
+        Parameters:
+        -----------
+        timeout : float
+            연결/수신 타임아웃 (초)
+            
+        Returns:
+        --------
+        socket.socket
+            연결된 TCP 소켓
+        """
+        addr = (self.target_ip, self.target_port)
+        sock = self._sock
+        if sock is not None and self._sock_addr == addr and self._drain_socket(sock):
+            sock.settimeout(timeout)
+            return sock
+        
+        self._close_socket()
+        sock = socket.create_connection(addr, timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self._sock = sock
+        self._sock_addr = addr
+        return sock
+    
+    @staticmethod
+    def _drain_socket(sock):
+        """
+        늦게 도착한 응답을 비우고 연결이 살아 있는지 확인
+        
+        Returns:
+        --------
+        bool
+            상대가 연결을 닫지 않았으면 True
+        """
+        try:
+            sock.setblocking(False)
+            while True:
+                if not sock.recv(1024):
+                    return False  # 상대가 연결을 닫음
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+    
+    def _close_socket(self):
+        """캐시된 연결 닫기 (_sock_lock 안에서 호출)"""
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._sock_addr = None
+    
+    def _exchange(self, payload, repeat, timeout):
+        """
+        지속 연결로 페이로드를 전송하고 응답 수신 (연결이 끊겨 있으면 한 번 재연결 후 재시도)
+        
+        Parameters:
+        -----------
+        payload : bytes
+            전송할 패킷
+        repeat : int
+            연속 전송 횟수
+        timeout : float
+            연결/수신 타임아웃 (초)
+            
+        Returns:
+        --------
+        bytes|None
+            마지막 응답값
+        """
+        with self._sock_lock:
+            for attempt in range(2):
+                sock = self._get_connected_socket(timeout)
+                last_response = None
+                try:
+                    for i in range(repeat):
+                        sock.sendall(payload)  # 부분 전송 시에도 전체 패킷 전송
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("패킷 전송 %d/%d: %d바이트", i + 1, repeat, len(payload))
+                        try:
+                            response = sock.recv(1024)
+                        except socket.timeout:
+                            logger.warning("응답 타임아웃 %d/%d", i + 1, repeat)
+                            continue
+                        if not response:
+                            # 장비가 응답 없이 연결을 닫음 - 기존과 같이 전송 성공으로 보고 재전송하지 않음
+                            # (닫힌 연결은 재사용하지 않고, 끊긴 연결은 다음 전송 전 _drain_socket에서 걸러짐)
+                            self._close_socket()
+                            return last_response
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("응답 수신: %s", response.hex())
+                        last_response = response
+                    return last_response
+                except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError) as e:
+                    self._close_socket()
+                    if attempt:
+                        raise
+                    logger.warning("연결이 끊겨 재연결 후 재전송: %s", e)
+                except (socket.timeout, OSError):
+                    # 전송 도중 실패한 연결은 다음 패킷에 재사용하지 않음
+                    self._close_socket()
+                    raise
+    
+    def close(self):
+        """방송 장비와의 지속 연결 종료"""
+        with self._sock_lock:
+            self._close_socket()
     
     def send_payload(self, payload, timeout=5):
         """
@@ -56,26 +184,12 @@ class NetworkManager:
         Returns:
             (bool, bytes|None): (성공여부, 마지막 응답값)
         """
-        last_response = None
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            sock.connect((self.target_ip, self.target_port))
-            for i in range(2):
-                sock.send(payload)
-                print(f"[*] 패킷 전송 {i+1}/2: {len(payload)}바이트")
-                try:
-                    response = sock.recv(1024)
-                    if response:
-                        print(f"[*] 응답 수신: {response.hex()}")
-                        last_response = response
-                except socket.timeout:
-                    print(f"[!] 응답 타임아웃 {i+1}/2")
-            sock.close()
+            last_response = self._exchange(payload, 2, timeout)
             self.packet_counter += 1
             return True, last_response
         except Exception as e:
-            print(f"[!] 패킷 전송 실패: {e}")
+            logger.warning("패킷 전송 실패: %s", e)
             return False, None
     
     def send_payload_single(self, payload, timeout=5):
@@ -85,23 +199,11 @@ class NetworkManager:
             (bool, bytes|None): (성공여부, 응답값)
         """
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            sock.connect((self.target_ip, self.target_port))
-            sock.send(payload)
-            print(f"[*] 패킷 전송: {len(payload)}바이트")
-            response = None
-            try:
-                response = sock.recv(1024)
-                if response:
-                    print(f"[*] 응답 수신: {response.hex()}")
-            except socket.timeout:
-                print(f"[!] 응답 타임아웃")
-            sock.close()
+            response = self._exchange(payload, 1, timeout)
             self.packet_counter += 1
             return True, response
         except Exception as e:
-            print(f"[!] 패킷 전송 실패: {e}")
+            logger.warning("패킷 전송 실패: %s", e)
             return False, None
     
     def send_coordinate_packet(self, row, col, state):
@@ -122,7 +224,12 @@ class NetworkManager:
         tuple(bool, bytes|None)
             (전송 성공 여부, 응답 데이터)
         """
-        payload = self.packet_builder.create_coordinate_payload(row, col, state)
+        key = (row, col, 1 if state else 0)
+        payload = self._coord_cache.get(key)
+        if payload is None:
+            payload = self.packet_builder.create_coordinate_payload(row, col, state)
+            if payload:
+                self._coord_cache[key] = payload
         if payload:
             return self.send_payload_single(payload)
         return False, None
@@ -141,30 +248,31 @@ class NetworkManager:
         (bool, bytes|None)
             (전송 성공 여부, 응답 데이터)
         """
-        print(f"[*] NetworkManager: 현재 상태 패킷 전송 시작 (활성 방: {sorted(active_rooms)})")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("현재 상태 패킷 전송 시작 (활성 방: %s)", sorted(active_rooms))
         
         try:
             payload = self.packet_builder.create_current_state_payload(active_rooms)
             if payload:
-                print(f"[*] NetworkManager: 패킷 생성 완료 ({len(payload)}바이트)")
-                print(f"[*] NetworkManager: 패킷 헥스: {payload.hex()}")
+                if debug:
+                    logger.debug("패킷 생성 완료 (%d바이트): %s", len(payload), payload.hex())
                 
                 success, response = self.send_payload_single(payload)
                 
                 if success:
-                    print(f"[*] NetworkManager: 패킷 전송 성공")
-                    if response:
-                        print(f"[*] NetworkManager: 응답 수신: {response.hex()}")
+                    if debug:
+                        logger.debug("패킷 전송 성공%s", f", 응답: {response.hex()}" if response else "")
                     return True, response
                 else:
-                    print(f"[!] NetworkManager: 패킷 전송 실패")
+                    logger.warning("현재 상태 패킷 전송 실패")
                     return False, response
             else:
-                print(f"[!] NetworkManager: 패킷 생성 실패")
+                logger.warning("현재 상태 패킷 생성 실패")
                 return False, None
                 
         except Exception as e:
-            print(f"[!] NetworkManager: 패킷 전송 중 오류: {e}")
+            logger.warning("현재 상태 패킷 전송 중 오류: %s", e)
             return False, None
     
     def get_packet_counter(self):
@@ -174,11 +282,11 @@ class NetworkManager:
     def reset_packet_counter(self):
         """패킷 카운터 초기화"""
         self.packet_counter = 0
-        print("[*] 패킷 카운터 초기화")
+        logger.info("패킷 카운터 초기화")
     
     def test_connection(self):
         """
-        방송 장비 연결 테스트
+        방송 장비 연결 테스트 (지속 연결이 살아 있거나 새로 연결할 수 있는지 확인)
         
         Returns:
         --------
@@ -186,14 +294,13 @@ class NetworkManager:
             연결 성공 여부
         """
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(3)
-            sock.connect((self.target_ip, self.target_port))
-            sock.close()
-            print(f"[*] 연결 테스트 성공: {self.target_ip}:{self.target_port}")
+            # 캐시된 연결이 살아 있으면 그대로 사용하고, 없으면 새로 연결
+            with self._sock_lock:
+                self._get_connected_socket(3)
+            logger.info("연결 테스트 성공: %s:%s", self.target_ip, self.target_port)
             return True
         except Exception as e:
-            print(f"[!] 연결 테스트 실패: {e}")
+            logger.warning("연결 테스트 실패: %s", e)
             return False
 
     def initialize_connection(self):
@@ -211,21 +318,21 @@ class NetworkManager:
                 return False, None
             
             # 모든 장비 OFF 패킷 전송으로 초기화
-            payload = self.packet_builder.create_all_off_payload()
+            payload = self._all_off_payload
             if payload:
                 success, response = self.send_payload(payload)
                 if success:
-                    print("[*] 네트워크 연결 초기화 완료")
+                    logger.info("네트워크 연결 초기화 완료")
                     return True, response
                 else:
-                    print("[!] 네트워크 초기화 패킷 전송 실패")
+                    logger.warning("네트워크 초기화 패킷 전송 실패")
                     return False, None
             else:
-                print("[!] 초기화 패킷 생성 실패")
+                logger.warning("초기화 패킷 생성 실패")
                 return False, None
                 
         except Exception as e:
-            print(f"[!] 네트워크 연결 초기화 중 오류: {e}")
+            logger.warning("네트워크 연결 초기화 중 오류: %s", e)
             return False, None
 
     def print_interface_info(self):
@@ -237,7 +344,7 @@ class NetworkManager:
             print(f"    - 인터페이스: {self.interface}")
             print(f"    - 전송된 패킷 수: {self.packet_counter}")
         except Exception as e:
-            print(f"[!] 네트워크 인터페이스 정보 출력 중 오류: {e}")
+            logger.warning("네트워크 인터페이스 정보 출력 중 오류: %s", e)
 
 # 싱글톤 인스턴스 생성
 network_manager = NetworkManager() 
\ No newline at end of file
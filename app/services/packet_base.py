@@ -3,6 +3,25 @@
 패킷 베이스 모듈
 패킷 빌더와 파서의 공통 기능을 제공합니다.
 """
+from ..core.config import setup_logging
+
+logger = setup_logging(__name__)
+
+def _xor43(packet):
+    """
+    앞 43바이트 XOR 값 계산 (정수 하나로 읽어 절반씩 접는 SWAR 방식)
+    
+    64바이트 이하 정수를 256/128/.../8비트씩 접으면 최하위 바이트에
+    모든 바이트의 XOR 값이 한 번씩만 모입니다.
+    """
+    v = int.from_bytes(packet[:43], 'little')
+    v ^= v >> 256
+    v ^= v >> 128
+    v ^= v >> 64
+    v ^= v >> 32
+    v ^= v >> 16
+    v ^= v >> 8
+    return v & 0xFF
 
 class PacketBase:
     """
@@ -16,6 +35,9 @@ class PacketBase:
     COMMAND = bytes.fromhex("43420100000000")
     FOOTER = bytes.fromhex("0300")
     
+    # 헤더와 명령어만 채운 기본 패킷 (나머지는 0, 매번 복사해서 사용)
+    _BASE = HEADER + COMMAND + bytes(PACKET_SIZE - len(HEADER) - len(COMMAND))
+    
     # 바이트 매핑: 캡처 데이터 분석 결과에 따라 수정
     BYTE_MAP = {
         (1, 0): 10, (1, 1): 11,  # 1행 1~8열, 9~16열
@@ -41,11 +63,8 @@ class PacketBase:
         int
             계산된 체크섬 값
         """
-        checksum = 0
         # 패킷의 처음부터 42바이트까지 XOR 연산 (실제 패킷 분석 결과)
-        for i in range(0, 43):
-            checksum ^= packet[i]
-        return checksum
+        return _xor43(packet)
     
     def validate_packet(self, packet):
         """
@@ -63,12 +82,12 @@ class PacketBase:
         """
         # 기본 길이 검사
         if len(packet) != self.PACKET_SIZE:
-            print(f"[!] 패킷 길이 오류: {len(packet)}바이트 (예상: {self.PACKET_SIZE}바이트)")
+            logger.warning("패킷 길이 오류: %d바이트 (예상: %d바이트)", len(packet), self.PACKET_SIZE)
             return False
         
         # 헤더 검사
         if packet[0:3] != self.HEADER:
-            print(f"[!] 헤더 오류: {packet[0:3].hex()} (예상: {self.HEADER.hex()})")
+            logger.warning("헤더 오류: %s (예상: %s)", packet[0:3].hex(), self.HEADER.hex())
             return False
         
         # 체크섬 검사
@@ -76,12 +95,12 @@ class PacketBase:
         received_checksum = packet[43]
         
         if calculated_checksum != received_checksum:
-            print(f"[!] 체크섬 오류: 계산값 {calculated_checksum:02x}, 수신값 {received_checksum:02x}")
+            logger.warning("체크섬 오류: 계산값 %02x, 수신값 %02x", calculated_checksum, received_checksum)
             return False
         
         # 푸터 검사
         if packet[44:46] != self.FOOTER:
-            print(f"[!] 푸터 오류: {packet[44:46].hex()} (예상: {self.FOOTER.hex()})")
+            logger.warning("푸터 오류: %s (예상: %s)", packet[44:46].hex(), self.FOOTER.hex())
             return False
         
         return True
@@ -150,15 +169,8 @@ class PacketBase:
         bytearray
             기본 패킷 구조
         """
-        packet = bytearray(self.PACKET_SIZE)
-        
-        # 기본 헤더 설정
-        packet[0:3] = self.HEADER
-        packet[3:10] = self.COMMAND
-        
-        # 나머지는 0으로 초기화 (이미 0)
-        
-        return packet
+        # 미리 만든 기본 패킷을 한 번에 복사 (헤더/명령어 설정, 나머지는 0)
+        return bytearray(self._BASE)
     
     def finalize_packet(self, packet):
         """
@@ -4,8 +4,16 @@
 방송 시스템 제어용 패킷을 생성합니다.
 """
 
+import logging
+import numpy as np
+from ..core.config import setup_logging
 from .packet_base import PacketBase
 
+logger = setup_logging(__name__)
+
+# 상태 바이트 위치 ((행, 열 그룹) 순서: 1행 1~8열, 1행 9~16열, 2행 ...)
+_STATUS_POSITIONS = [PacketBase.BYTE_MAP[(row, group)] for row in range(1, 5) for group in range(2)]
+
 class PacketBuilder(PacketBase):
     """
     패킷 빌더 클래스
@@ -34,7 +42,7 @@ class PacketBuilder(PacketBase):
         """
         # 좌표 유효성 검사
         if not (1 <= row <= 4 and 1 <= col <= 16):
-            print(f"[!] 잘못된 좌표: ({row}, {col}). 1-4행, 1-16열 범위여야 합니다.")
+            logger.warning("잘못된 좌표: (%s, %s). 1-4행, 1-16열 범위여야 합니다.", row, col)
             return None
         
         # 기본 페이로드 생성
@@ -46,10 +54,10 @@ class PacketBuilder(PacketBase):
         # 비트 설정
         if state:
             payload[byte_pos] |= (1 << bit_pos)
-            print(f"[*] 장치 활성화: ({row}, {col}) -> 바이트 {byte_pos}, 비트 {bit_pos}")
         else:
             payload[byte_pos] &= ~(1 << bit_pos)
-            print(f"[*] 장치 비활성화: ({row}, {col}) -> 바이트 {byte_pos}, 비트 {bit_pos}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("장치 %s: (%d, %d) -> 바이트 %d, 비트 %d", "활성화" if state else "비활성화", row, col, byte_pos, bit_pos)
         
         # 패킷 완성
         return self.finalize_packet(payload)
@@ -74,19 +82,20 @@ class PacketBuilder(PacketBase):
         payload = self.create_base_packet()
         
         # 각 좌표에 대해 비트 설정
+        debug = logger.isEnabledFor(logging.DEBUG)
         for row, col in coordinates:
             if not (1 <= row <= 4 and 1 <= col <= 16):
-                print(f"[!] 잘못된 좌표 무시: ({row}, {col})")
+                logger.warning("잘못된 좌표 무시: (%s, %s)", row, col)
                 continue
             
             byte_pos, bit_pos = self.get_byte_bit_position(row, col)
             
             if state:
                 payload[byte_pos] |= (1 << bit_pos)
-                print(f"[*] 장치 활성화: ({row}, {col}) -> 바이트 {byte_pos}, 비트 {bit_pos}")
             else:
                 payload[byte_pos] &= ~(1 << bit_pos)
-                print(f"[*] 장치 비활성화: ({row}, {col}) -> 바이트 {byte_pos}, 비트 {bit_pos}")
+            if debug:
+                logger.debug("장치 %s: (%d, %d) -> 바이트 %d, 비트 %d", "활성화" if state else "비활성화", row, col, byte_pos, bit_pos)
         
         # 패킷 완성
         return self.finalize_packet(payload)
@@ -111,7 +120,7 @@ class PacketBuilder(PacketBase):
         """
         # 위치 유효성 검사
         if not (0 <= byte_pos <= 7 and 0 <= bit_pos <= 7):
-            print(f"[!] 잘못된 바이트/비트 위치: 바이트 {byte_pos}, 비트 {bit_pos}")
+            logger.warning("잘못된 바이트/비트 위치: 바이트 %s, 비트 %s", byte_pos, bit_pos)
             return None
         
         # 기본 페이로드 생성
@@ -120,10 +129,10 @@ class PacketBuilder(PacketBase):
         # 비트 설정
         if state:
             payload[byte_pos] |= (1 << bit_pos)
-            print(f"[*] 장치 활성화: 바이트 {byte_pos}, 비트 {bit_pos}")
         else:
             payload[byte_pos] &= ~(1 << bit_pos)
-            print(f"[*] 장치 비활성화: 바이트 {byte_pos}, 비트 {bit_pos}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("장치 %s: 바이트 %d, 비트 %d", "활성화" if state else "비활성화", byte_pos, bit_pos)
         
         # 패킷 완성
         return self.finalize_packet(payload)
@@ -142,7 +151,7 @@ class PacketBuilder(PacketBase):
         
         # 패킷 완성
         result = self.finalize_packet(payload)
-        print("[*] 전체 장비 OFF 패킷 생성")
+        logger.debug("전체 장비 OFF 패킷 생성")
         return result
     
     def create_current_state_payload(self, active_rooms):
@@ -159,34 +168,32 @@ class PacketBuilder(PacketBase):
         bytes
             생성된 패킷 페이로드
         """
-        print(f"[*] PacketBuilder: 현재 상태 패킷 생성 시작 (활성 방: {sorted(active_rooms)})")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("현재 상태 패킷 생성 시작 (활성 방: %s)", sorted(active_rooms))
         
         # 기본 페이로드 생성
         payload = self.create_base_packet()
-        print(f"[*] PacketBuilder: 기본 패킷 생성 완료")
-        
-        # 활성화된 방들에 대해 비트 설정
-        activated_count = 0
-        for room in active_rooms:
-            # 방 번호를 행/열로 변환 (예: 101 -> 1행 1열)
-            row = room // 100
-            col = room % 100
-            
-            if 1 <= row <= 4 and 1 <= col <= 16:
-                byte_pos, bit_pos = self.get_byte_bit_position(row, col)
-                payload[byte_pos] |= (1 << bit_pos)
-                activated_count += 1
-                print(f"[*] PacketBuilder: 활성화된 방 {room} ({row}행 {col}열) -> 바이트 {byte_pos}, 비트 {bit_pos}")
-            else:
-                print(f"[!] PacketBuilder: 잘못된 방 번호 무시: {room}")
         
-        print(f"[*] PacketBuilder: 총 {activated_count}개 방 활성화 설정 완료")
+        # 방 번호를 행/열로 변환 (예: 101 -> 1행 1열) 후 4x16 그리드에 표시
+        rooms = np.fromiter(active_rooms, dtype=np.int64, count=len(active_rooms))
+        rows, cols = np.divmod(rooms, 100)
+        valid = (rows >= 1) & (rows <= 4) & (cols >= 1) & (cols <= 16)
+        if not valid.all():
+            logger.warning("잘못된 방 번호 무시: %s", rooms[~valid].tolist())
+        grid = np.zeros((4, 16), dtype=bool)
+        grid[rows[valid] - 1, cols[valid] - 1] = True
         
-        # 패킷 완성
-        result = self.finalize_packet(payload)
-        print(f"[*] PacketBuilder: 패킷 완성 완료 ({len(result)}바이트)")
+        # 8열씩 묶어 한 번에 비트 패킹 (열 1/9 -> 비트 0) 후 상태 바이트 위치에 기록
+        status_bytes = np.packbits(grid.reshape(8, 8), axis=1, bitorder='little').ravel().tolist()
+        for byte_pos, value in zip(_STATUS_POSITIONS, status_bytes):
+            payload[byte_pos] = value
         
-        return result
+        if debug:
+            logger.debug("총 %d개 방 활성화 설정 완료: %s", int(valid.sum()), sorted(rooms[valid].tolist()))
+        
+        # 패킷 완성
+        return self.finalize_packet(payload)
 
 # 싱글톤 인스턴스 생성
 packet_builder = PacketBuilder() 
\ No newline at end of file
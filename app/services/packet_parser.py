@@ -4,8 +4,24 @@
 네트워크에서 받은 응답 패킷을 해석하여 장비 상태를 추출합니다.
 """
 
+import logging
+import numpy as np
+from ..core.config import setup_logging
 from .packet_base import PacketBase
 
+logger = setup_logging(__name__)
+
+# 장비 상태 바이트 위치 (1행 1~8열, 1행 9~16열, 2행 ... 순서) 및 각 비트의 (행, 열) 라벨
+_BYTE_POSITIONS = np.array([PacketBase.BYTE_MAP[(row, group)] for row in range(1, 5) for group in range(2)], dtype=np.intp)
+_BIT_ROWS = np.repeat(np.arange(1, 5), 16)
+_BIT_COLS = np.tile(np.arange(1, 17), 4)
+_BIT_LABELS = tuple(zip(_BIT_ROWS.tolist(), _BIT_COLS.tolist()))
+
+def _unpack_status_bits(packet):
+    """8개 상태 바이트를 64개 비트 배열로 풀기 (인덱스 = (행-1)*16 + (열-1))"""
+    status_bytes = np.frombuffer(packet, dtype=np.uint8, count=44)[_BYTE_POSITIONS]
+    return np.unpackbits(status_bytes, bitorder='little')
+
 class PacketParser(PacketBase):
     """
     패킷 파서 클래스
@@ -32,35 +48,20 @@ class PacketParser(PacketBase):
             활성화된 장비 좌표 리스트 [(row, col), ...]
         """
         if len(packet) < 44:  # 44바이트 이상이면 정상
-            print(f"[!] 패킷 길이 오류: {len(packet)}바이트 (최소 44바이트 필요)")
+            logger.warning("패킷 길이 오류: %d바이트 (최소 44바이트 필요)", len(packet))
             return []
         
         # 패킷 유효성 검사 (송신 패킷과 응답 패킷 모두 지원)
         if not self._validate_response_packet(packet):
-            print("[!] 패킷 유효성 검사 실패")
+            logger.warning("패킷 유효성 검사 실패")
             return []
         
-        active_devices = []
-        
-        # 각 행의 바이트 위치에서 비트를 확인하여 활성화된 장비 추출
-        for row in range(1, 5):  # 1~4행
-            for group in range(2):  # 0: 1~8열, 1: 9~16열
-                byte_pos = self.BYTE_MAP[(row, group)]
-                byte_value = packet[byte_pos]
-                
-                # 각 비트를 확인하여 활성화된 장비 찾기
-                for bit_pos in range(8):
-                    if byte_value & (1 << bit_pos):
-                        # 비트 위치를 열 번호로 변환
-                        if group == 0:  # 1~8열
-                            col = bit_pos + 1
-                        else:  # 9~16열
-                            col = bit_pos + 9
-                        
-                        active_devices.append((row, col))
-                        print(f"[*] 활성화된 장비 발견: ({row}, {col}) -> 바이트 {byte_pos}, 비트 {bit_pos}")
-        
-        print(f"[*] 총 {len(active_devices)}개의 활성화된 장비 발견")
+        # 8개 상태 바이트를 한 번에 비트로 풀어 켜진 비트의 (행, 열) 라벨 추출
+        active_idx = np.flatnonzero(_unpack_status_bits(packet))
+        active_devices = list(zip(_BIT_ROWS[active_idx].tolist(), _BIT_COLS[active_idx].tolist()))
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("총 %d개의 활성화된 장비 발견: %s", len(active_devices), active_devices)
         return active_devices
     
     def parse_device_status_packet_to_dict(self, packet):
@@ -68,27 +69,17 @@ class PacketParser(PacketBase):
         장비 상태 응답 패킷을 파싱하여 전체 장비 상태 딕셔너리로 반환
         """
         if len(packet) < 44:  # 44바이트 이상이면 정상
-            print(f"[!] 패킷 길이 오류: {len(packet)}바이트 (최소 44바이트 필요)")
+            logger.warning("패킷 길이 오류: %d바이트 (최소 44바이트 필요)", len(packet))
             return {}
         
         # 패킷 유효성 검사 (송신 패킷과 응답 패킷 모두 지원)
         if not self._validate_response_packet(packet):
-            print("[!] 패킷 유효성 검사 실패")
+            logger.warning("패킷 유효성 검사 실패")
             return {}
         
-        device_status = {}
-        
-        # 모든 장비를 먼저 OFF 상태로 초기화
-        for row in range(1, 5):
-            for col in range(1, 17):
-                device_status[(row, col)] = False
-        
-        # 활성화된 장비만 ON 상태로 설정
-        active_devices = self.parse_device_status_packet(packet)
-        for row, col in active_devices:
-            device_status[(row, col)] = True
-        
-        return device_status
+        # 유효성 검사를 마친 패킷을 한 번만 풀어 64개 장비 상태를 바로 구성
+        bits = _unpack_status_bits(packet).astype(bool).tolist()
+        return dict(zip(_BIT_LABELS, bits))
     
     def parse_device_status_packet_to_rooms(self, packet):
         """
@@ -119,7 +110,7 @@ class PacketParser(PacketBase):
         """
         # 기본 길이 검사 (44바이트 이상이면 정상)
         if len(packet) < 44:
-            print(f"[!] 패킷 길이 오류: {len(packet)}바이트 (최소 44바이트 필요)")
+            logger.warning("패킷 길이 오류: %d바이트 (최소 44바이트 필요)", len(packet))
             return False
         
         # 헤더 검사 (송신 패킷 또는 응답 패킷)
@@ -132,47 +123,35 @@ class PacketParser(PacketBase):
             expected_command = self.RESPONSE_COMMAND
             packet_type = "응답"
         else:
-            print(f"[!] 헤더 오류: {packet[0:3].hex()} (예상: {self.HEADER.hex()} 또는 {self.RESPONSE_HEADER.hex()})")
+            logger.warning("헤더 오류: %s (예상: %s 또는 %s)", packet[0:3].hex(), self.HEADER.hex(), self.RESPONSE_HEADER.hex())
             return False
         
         # 명령어 검사
         if packet[3:10] != expected_command:
-            print(f"[!] 명령어 오류: {packet[3:10].hex()} (예상: {expected_command.hex()})")
+            logger.warning("명령어 오류: %s (예상: %s)", packet[3:10].hex(), expected_command.hex())
             return False
         
-        # 체크섬 검사
-        if packet_type == "송신":
-            calculated_checksum = self.calculate_checksum(packet)
-            received_checksum = packet[43]
-            if calculated_checksum != received_checksum:
-                print(f"[!] 체크섬 오류: 계산값 {calculated_checksum:02x}, 수신값 {received_checksum:02x}")
-                return False
-        else:
-            # 응답 패킷 체크섬: 0~42번 XOR + 0x03 == 43번 바이트
-            xor_chk = 0
-            for b in packet[:43]:
-                xor_chk ^= b
-            calc_chk = (xor_chk + 0x03) & 0xFF
-            received_checksum = packet[43]
-            if calc_chk != received_checksum:
-                print(f"[!] 응답 체크섬 오류: 계산값 {calc_chk:02x}, 수신값 {received_checksum:02x}")
-                return False
-            else:
-                print(f"[*] 응답 패킷 체크섬 정상: {calc_chk:02x}")
+        # 체크섬 검사 (XOR은 한 번만 계산, 응답 패킷은 0~42번 XOR + 0x03 == 43번 바이트)
+        xor_chk = self.calculate_checksum(packet)
+        expected_checksum = xor_chk if packet_type == "송신" else (xor_chk + 0x03) & 0xFF
+        received_checksum = packet[43]
+        if expected_checksum != received_checksum:
+            logger.warning("%s 체크섬 오류: 계산값 %02x, 수신값 %02x", packet_type, expected_checksum, received_checksum)
+            return False
         
         # 푸터 검사
         if len(packet) == 44:
             # 44바이트 응답 패킷: 마지막 바이트가 03
             if packet[43] != 0x03:
-                print(f"[!] 푸터 오류: {packet[43]:02x} (예상: 03)")
+                logger.warning("푸터 오류: %02x (예상: 03)", packet[43])
                 return False
         else:
             # 46바이트 패킷: 마지막 2바이트가 0300
             if packet[44:46] != self.FOOTER:
-                print(f"[!] 푸터 오류: {packet[44:46].hex()} (예상: {self.FOOTER.hex()})")
+                logger.warning("푸터 오류: %s (예상: %s)", packet[44:46].hex(), self.FOOTER.hex())
                 return False
         
-        print(f"[*] {packet_type} 패킷 유효성 검사 통과")
+        logger.debug("%s 패킷 유효성 검사 통과", packet_type)
         return True
     
     def print_packet_analysis_with_devices(self, packet):
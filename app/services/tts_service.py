@@ -5,10 +5,16 @@
 """
 import os
 import time
-import traceback
+import wave
+import logging
 import importlib.util
 from pathlib import Path
 
+from ..core.config import setup_logging
+
+# 중앙 로깅 설정 사용
+logger = setup_logging(__name__)
+
 # 기본 설정
 DEFAULT_LANGUAGE = "ko"  # 기본 언어: 한국어
 AUDIO_EXT = {
@@ -45,21 +51,21 @@ class TTSService:
         """
         # 1. MeloTTS 시도 (최고 품질)
         if self._try_load_melotts():
-            print("[*] MeloTTS 엔진이 활성화되었습니다.")
+            logger.info("MeloTTS 엔진이 활성화되었습니다.")
             return
         
         # 2. gTTS 시도 (중간 품질, 인터넷 필요)
         if self._try_load_gtts():
-            print("[*] gTTS 엔진이 활성화되었습니다.")
+            logger.info("gTTS 엔진이 활성화되었습니다.")
             return
             
         # 3. pyttsx3 시도 (낮은 품질, 오프라인)
         if self._try_load_pyttsx3():
-            print("[*] pyttsx3 엔진이 활성화되었습니다.")
+            logger.info("pyttsx3 엔진이 활성화되었습니다.")
             return
             
         # 모든 엔진 로드 실패
-        print("[!] 경고: 사용 가능한 TTS 엔진이 없습니다.")
+        logger.warning("사용 가능한 TTS 엔진이 없습니다.")
     
     def _try_load_melotts(self):
         """MeloTTS 엔진 로드 시도"""
@@ -75,7 +81,7 @@ class TTSService:
                 # 진행률 콜백 함수
                 def progress_callback(progress):
                     if int(progress * 100) % 10 == 0:
-                        print(f"[*] 모델 다운로드 진행률: {int(progress * 100)}%")
+                        logger.info(f"모델 다운로드 진행률: {int(progress * 100)}%")
                 
                 # 한국어 모델 초기화
                 self.tts_engine = Text2Speech(
@@ -87,10 +93,9 @@ class TTSService:
                 self.tts_type = "melotts"
                 return True
         except ImportError:
-            print("[!] MeloTTS 모듈을 찾을 수 없습니다.")
-        except Exception as e:
-            print(f"[!] MeloTTS 초기화 오류: {e}")
-            traceback.print_exc()
+            logger.warning("MeloTTS 모듈을 찾을 수 없습니다.")
+        except Exception:
+            logger.exception("MeloTTS 초기화 오류")
         return False
     
     def _try_load_gtts(self):
@@ -103,10 +108,9 @@ class TTSService:
                 self.tts_type = "gtts"
                 return True
         except ImportError:
-            print("[!] gTTS 모듈을 찾을 수 없습니다.")
-        except Exception as e:
-            print(f"[!] gTTS 초기화 오류: {e}")
-            traceback.print_exc()
+            logger.warning("gTTS 모듈을 찾을 수 없습니다.")
+        except Exception:
+            logger.exception("gTTS 초기화 오류")
         return False
     
     def _try_load_pyttsx3(self):
@@ -122,10 +126,9 @@ class TTSService:
                 self.tts_engine.setProperty('volume', 1.0)  # 볼륨
                 return True
         except ImportError:
-            print("[!] pyttsx3 모듈을 찾을 수 없습니다.")
-        except Exception as e:
-            print(f"[!] pyttsx3 초기화 오류: {e}")
-            traceback.print_exc()
+            logger.warning("pyttsx3 모듈을 찾을 수 없습니다.")
+        except Exception:
+            logger.exception("pyttsx3 초기화 오류")
         return False
     
     def synthesize(self, text, output_path=None, language=DEFAULT_LANGUAGE):
@@ -147,12 +150,12 @@ class TTSService:
             생성된 음성 파일 경로
         """
         if not self.tts_engine:
-            print("[!] 오류: 활성화된 TTS 엔진이 없습니다.")
+            logger.error("활성화된 TTS 엔진이 없습니다.")
             return None
             
         # 텍스트 검증
         if not text or not text.strip():
-            print("[!] 오류: 변환할 텍스트가 비어있습니다.")
+            logger.warning("변환할 텍스트가 비어있습니다.")
             return None
             
         try:
@@ -167,7 +170,8 @@ class TTSService:
             # 디렉토리 생성
             os.makedirs(output_path.parent, exist_ok=True)
             
-            print(f"[*] 텍스트를 음성으로 변환 중: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"텍스트를 음성으로 변환 중: '{text[:50]}{'...' if len(text) > 50 else ''}'")
             start_time = time.time()
             
             # TTS 엔진별 처리
@@ -179,7 +183,6 @@ class TTSService:
                 if output_path.suffix.lower() == '.mp3':
                     try:
                         from pydub import AudioSegment
-                        import io
                         
                         # 임시 WAV 파일로 먼저 저장
                         temp_wav_path = output_path.with_suffix('.temp.wav')
@@ -189,7 +192,6 @@ class TTSService:
                             # PCM 데이터로 가정하고 WAV 파일 생성
                             try:
                                 import numpy as np
-                                import wave
                                 
                                 # 바이트 데이터를 NumPy 배열로 변환 (16비트 PCM 가정)
                                 audio_array = np.frombuffer(wav_data, dtype=np.int16)
@@ -201,9 +203,9 @@ class TTSService:
                                     wf.setframerate(24000)  # 24kHz
                                     wf.writeframes(audio_array.tobytes())
                                 
-                                print(f"[*] PCM 데이터에서 WAV 파일 생성: {temp_wav_path}")
+                                logger.debug(f"PCM 데이터에서 WAV 파일 생성: {temp_wav_path}")
                             except Exception as e:
-                                print(f"[!] PCM 변환 중 오류: {e}")
+                                logger.warning(f"PCM 변환 중 오류: {e}")
                                 
                                 # 오류 발생 시 원시 데이터를 그대로 WAV 파일로 저장
                                 with open(temp_wav_path, "wb") as f:
@@ -220,11 +222,11 @@ class TTSService:
                             
                             # 임시 파일 삭제
                             os.remove(temp_wav_path)
-                            print(f"[*] WAV를 MP3로 변환 완료: {output_path}")
+                            logger.debug(f"WAV를 MP3로 변환 완료: {output_path}")
                         else:
-                            print(f"[!] 임시 WAV 파일을 찾을 수 없습니다: {temp_wav_path}")
+                            logger.warning(f"임시 WAV 파일을 찾을 수 없습니다: {temp_wav_path}")
                     except Exception as e:
-                        print(f"[!] MP3 변환 중 오류: {e}")
+                        logger.warning(f"MP3 변환 중 오류: {e}")
                         
                         # 변환 실패 시 WAV 파일로 출력
                         output_path = output_path.with_suffix('.wav')
@@ -234,10 +236,9 @@ class TTSService:
                     # WAV 파일 직접 저장
                     # MeloTTS가 올바른 WAV 헤더를 생성했는지 확인
                     if not wav_data.startswith(b'RIFF') or b'WAVE' not in wav_data[:12]:
-                        print("[!] 경고: MeloTTS가 생성한 데이터에 올바른 WAV 헤더가 없습니다.")
+                        logger.warning("MeloTTS가 생성한 데이터에 올바른 WAV 헤더가 없습니다.")
                         # PCM 데이터로 가정하고 WAV 파일 생성
                         try:
-                            import wave
                             import numpy as np
                             
                             # 바이트 데이터를 NumPy 배열로 변환 (16비트 PCM 가정)
@@ -250,9 +251,9 @@ class TTSService:
                                 wf.setframerate(24000)  # 24kHz
                                 wf.writeframes(audio_array.tobytes())
                             
-                            print(f"[*] PCM 데이터에서 올바른 WAV 파일 생성: {output_path}")
+                            logger.debug(f"PCM 데이터에서 올바른 WAV 파일 생성: {output_path}")
                         except Exception as e:
-                            print(f"[!] WAV 생성 중 오류: {e}")
+                            logger.warning(f"WAV 생성 중 오류: {e}")
                             
                             # 오류 발생 시 원시 데이터를 그대로 WAV 파일로 저장
                             with open(output_path, "wb") as f:
@@ -300,27 +301,25 @@ class TTSService:
                 self.tts_engine.runAndWait()
                 
                 # 파일 쓰기 완료 대기 (최대 5초)
-                import time as time_module
                 for i in range(50):
                     if output_path.exists() and os.path.getsize(output_path) > 0:
                         break
-                    time_module.sleep(0.1)
+                    time.sleep(0.1)
             
             # 결과 정보 출력
             elapsed_time = time.time() - start_time
-            print(f"[*] 음성 파일 생성 완료: {output_path} (소요 시간: {elapsed_time:.2f}초)")
+            logger.debug(f"음성 파일 생성 완료: {output_path} (소요 시간: {elapsed_time:.2f}초)")
             
             if output_path.exists():
                 file_size = os.path.getsize(output_path) / 1024  # KB
-                print(f"[*] 생성된 음성 파일 크기: {file_size:.1f} KB")
+                logger.debug(f"생성된 음성 파일 크기: {file_size:.1f} KB")
                 return output_path
             else:
-                print(f"[!] 생성된 파일을 찾을 수 없습니다: {output_path}")
+                logger.warning(f"생성된 파일을 찾을 수 없습니다: {output_path}")
                 return None
                 
-        except Exception as e:
-            print(f"[!] 음성 생성 중 오류 발생: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("음성 생성 중 오류 발생")
             return None
     
     def change_language(self, language):
@@ -363,7 +362,7 @@ class TTSService:
                     **cache_args
                 )
                 
-                print(f"[*] MeloTTS 언어 변경 완료: {speaker}")
+                logger.info(f"MeloTTS 언어 변경 완료: {speaker}")
                 return True
                 
             elif self.tts_type == "pyttsx3":
@@ -372,14 +371,14 @@ class TTSService:
                 for voice in voices:
                     if language == "ko" and ("korean" in voice.name.lower() or "ko" in voice.id.lower()):
                         self.tts_engine.setProperty('voice', voice.id)
-                        print(f"[*] pyttsx3 음성 변경 완료: {voice.name}")
+                        logger.info(f"pyttsx3 음성 변경 완료: {voice.name}")
                         return True
                     elif language == "en" and "en" in voice.id.lower():
                         self.tts_engine.setProperty('voice', voice.id)
-                        print(f"[*] pyttsx3 음성 변경 완료: {voice.name}")
+                        logger.info(f"pyttsx3 음성 변경 완료: {voice.name}")
                         return True
                 
-                print(f"[!] 지정한 언어({language})에 맞는 음성을 찾을 수 없습니다.")
+                logger.warning(f"지정한 언어({language})에 맞는 음성을 찾을 수 없습니다.")
                 return False
                 
             elif self.tts_type == "gtts":
@@ -387,12 +386,11 @@ class TTSService:
                 return True
                 
             else:
-                print("[!] 알 수 없는 TTS 엔진 유형입니다.")
+                logger.warning("알 수 없는 TTS 엔진 유형입니다.")
                 return False
                 
-        except Exception as e:
-            print(f"[!] 언어 변경 중 오류 발생: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("언어 변경 중 오류 발생")
             return False
     
     def get_tts_info(self):
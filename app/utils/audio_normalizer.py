@@ -5,8 +5,10 @@
 """
 import os
 import sys
+import json
 import tempfile
 import shutil
+import subprocess
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -94,7 +96,6 @@ class AudioNormalizer:
     def _get_ffmpeg_path(self) -> Optional[Path]:
         """ffmpeg 경로 반환"""
         try:
-            from ..core.config import config
             ffmpeg_paths = config.get_ffmpeg_paths()
             
             if ffmpeg_paths["ffmpeg_exists"]:
@@ -109,7 +110,6 @@ class AudioNormalizer:
     def _get_ffprobe_path(self) -> Optional[Path]:
         """ffprobe 경로 반환"""
         try:
-            from ..core.config import config
             ffmpeg_paths = config.get_ffmpeg_paths()
             
             if ffmpeg_paths["ffprobe_exists"]:
@@ -139,9 +139,6 @@ class AudioNormalizer:
             if not self.ffprobe_path:
                 return {"error": "ffprobe를 찾을 수 없습니다."}
             
-            import subprocess
-            import json
-            
             # Windows에서 인코딩 문제 해결
             if sys.platform == "win32":
                 # UTF-8 인코딩으로 환경 변수 설정
@@ -238,8 +235,6 @@ class AudioNormalizer:
             if not self.ffmpeg_path:
                 return {"error": "ffmpeg를 찾을 수 없습니다."}
             
-            import subprocess
-            
             # Windows에서 인코딩 문제 해결
             if sys.platform == "win32":
                 env = os.environ.copy()
@@ -338,8 +333,6 @@ class AudioNormalizer:
             logger.info(f"고품질 오디오 정규화 시작: {input_path}")
             logger.info(f"목표 볼륨: {target} dBFS, 헤드룸: {head} dB")
             
-            import subprocess
-            
             # 1단계: 임시 파일로 고품질 정규화
             temp_normalized = self._create_temp_file(".wav")
             temp_files.append(temp_normalized)
@@ -484,8 +477,6 @@ class AudioNormalizer:
             logger.info(f"간단한 오디오 정규화 시작: {input_path}")
             logger.info(f"목표 볼륨: {target} dBFS")
             
-            import subprocess
-            
             # 임시 파일 생성
             temp_normalized = self._create_temp_file(".wav")
             temp_files.append(temp_normalized)
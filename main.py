@@ -14,6 +14,7 @@ from pathlib import Path
 
 from app.core.config import config, setup_logging
 from app.api.routes import broadcast, schedule, device_matrix
+from app.services.broadcast_controller import broadcast_controller
 from app.core.security import verify_ip_and_api_key, get_security_manager
 
 # 중앙 로깅 설정 사용
@@ -91,6 +92,13 @@ app.include_router(broadcast.router, prefix="/api/broadcast", tags=["방송 API"
 app.include_router(schedule.router, prefix="/api/schedule", tags=["방송 일정"])
 app.include_router(device_matrix.router, prefix="/api", tags=["장치 매트릭스"])
 
+@app.on_event("shutdown")
+def shutdown_broadcast_controller():
+    """
+    서버 종료 시 방송 워커 정리 (대기 작업 취소 및 장치 끄기)
+    """
+    broadcast_controller.shutdown()
+
 @app.get("/", tags=["기본"])
 async def root():
     """
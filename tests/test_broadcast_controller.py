@@ -0,0 +1,92 @@
+"""
+BroadcastController 방송 작업 워커 테스트
+"""
+import threading
+from collections import deque
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from app.services.broadcast_controller import BroadcastController, BroadcastJob
+
+
+def _make_controller(jobs, restore_enabled=True):
+    """워커 동작에 필요한 상태만 가진 컨트롤러 생성 (장치/오디오 초기화 생략)"""
+    controller = BroadcastController.__new__(BroadcastController)
+    controller._jobs = deque(jobs)
+    controller._jobs_cv = threading.Condition()
+    controller._jobs_by_id = {job.job_id: job for job in jobs}
+    controller._pending_duration_sum = 0.0
+    controller._queue_version = 0
+    controller._current_job = None
+    controller._shutting_down = False
+    controller._held_mask = 0
+    controller._held_devices = None
+    controller.current_broadcast_start_time = None
+    controller._current_broadcast_started = None
+    controller.current_broadcast_duration = None
+    controller.restore_device_states_enabled = restore_enabled
+    controller.restore_device_states = mock.Mock(return_value=True)
+    controller._force_turn_off_devices = mock.Mock(return_value=True)
+    return controller
+
+
+def _run_worker(controller):
+    """대기열이 빌 때까지 워커를 실행한 뒤 종료"""
+    next_job = controller._next_job
+
+    def next_or_stop():
+        with controller._jobs_cv:
+            if not controller._jobs:
+                controller._shutting_down = True
+        return next_job()
+
+    controller._next_job = next_or_stop
+    controller._broadcast_worker()
+
+
+@pytest.mark.parametrize("restore_enabled", [True, False])
+def test_held_devices_released_when_next_job_fails(tmp_path, restore_enabled):
+    """장치를 넘겨받을 다음 작업이 넘겨받기 전에 실패하면 켜 둔 장치를 정리"""
+    devices = ["1-1", "1-2"]
+    failing_job = BroadcastJob('audio', {
+        'audio_path': str(tmp_path / "missing.mp3"),
+        'target_devices': devices,
+        'duration': 1,
+    })
+    controller = _make_controller([failing_job], restore_enabled)
+    # 이전 방송이 다음 작업을 위해 장치를 켜 둔 상태
+    controller._held_mask = 0b11
+    controller._held_devices = (failing_job, devices, devices)
+
+    _run_worker(controller)
+
+    assert controller._held_mask == 0
+    assert controller._held_devices is None
+    if restore_enabled:
+        controller.restore_device_states.assert_called_once_with(devices)
+        controller._force_turn_off_devices.assert_not_called()
+    else:
+        controller._force_turn_off_devices.assert_called_once_with(devices)
+        controller.restore_device_states.assert_not_called()
+
+
+def test_held_devices_released_when_next_job_cancelled(tmp_path):
+    """장치를 넘겨받을 작업이 취소되어 다른 작업이 먼저 오면 켜 둔 장치를 정리"""
+    devices = ["1-1"]
+    cancelled_job = BroadcastJob('audio', {'audio_path': "", 'target_devices': devices, 'duration': 1})
+    other_job = BroadcastJob('audio', {
+        'audio_path': str(tmp_path / "missing.mp3"),
+        'target_devices': ["2-1"],
+        'duration': 1,
+    })
+    controller = _make_controller([other_job])
+    controller._held_mask = 0b1
+    controller._held_devices = (cancelled_job, devices, devices)
+
+    _run_worker(controller)
+
+    assert controller._held_devices is None
+    controller.restore_device_states.assert_called_once_with(devices)